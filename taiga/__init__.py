@@ -5,9 +5,10 @@
 """
 Taiga Python API library
 """
+
 __version__ = "1.3.1.dev1"
 __author__ = "Nephila"
 __license__ = "MIT"
-__all__ = ["TaigaAPI"]
+__all__ = ["AsyncTaigaAPI", "TaigaAPI"]
 
-from .client import TaigaAPI
+from .client import AsyncTaigaAPI, TaigaAPI
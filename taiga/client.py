@@ -7,8 +7,14 @@ try:
 except ImportError:  # pragma: no cover
     pass
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    pass
+
 from . import exceptions, utils
 from .models import (
+    AsyncHistory,
     Epics,
     History,
     IssueAttachments,
@@ -36,7 +42,67 @@ from .models import (
     WikiLinks,
     WikiPages,
 )
-from .requestmaker import RequestMaker
+from .models.base import AsyncListResource
+from .requestmaker import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    AsyncRequestMaker,
+    RequestCache,
+    RequestMaker,
+    RetryPolicy,
+    build_async_session,
+    build_session,
+    get_json_codec,
+)
+
+#: resource factories exposed by the clients, by attribute name
+RESOURCE_FACTORIES = {
+    "projects": Projects,
+    "user_stories": UserStories,
+    "user_story_attachments": UserStoryAttachments,
+    "users": Users,
+    "swimlanes": SwimLanes,
+    "issues": Issues,
+    "issue_attachments": IssueAttachments,
+    "tasks": Tasks,
+    "task_attachments": TaskAttachments,
+    "milestones": Milestones,
+    "severities": Severities,
+    "roles": Roles,
+    "points": Points,
+    "issue_statuses": IssueStatuses,
+    "issue_types": IssueTypes,
+    "issue_attributes": IssueAttributes,
+    "task_attributes": TaskAttributes,
+    "user_story_attributes": UserStoryAttributes,
+    "task_statuses": TaskStatuses,
+    "priorities": Priorities,
+    "user_story_statuses": UserStoryStatuses,
+    "wikipages": WikiPages,
+    "wikilinks": WikiLinks,
+    "webhooks": Webhooks,
+    "epics": Epics,
+}
+
+
+def _decrypt_app_token(cyphered_token, app_secret):
+    """
+    Decrypt the token returned by the application token validation, returns ``None`` if it is not valid
+    """
+    from jwkest.jwe import JWE
+    from jwkest.jwk import SYMKey
+
+    sym_key = SYMKey(key=app_secret, alg="A128KW")
+    data, success = JWE().decrypt(cyphered_token, keys=[sym_key]), True
+    if isinstance(data, tuple):
+        data, success = data
+    try:
+        token = json.loads(data.decode("utf-8")).get("token", None)
+    except ValueError:  # pragma: no cover
+        token = None
+    if not success:
+        token = None
+    return token
 
 
 class SearchResult:
@@ -57,10 +123,31 @@ class TaigaAPI:
     :param token_type: the token type
     :param tls_verify: verify server certificate
     :param auth_type: authentication type identifier
+    :param session: a :class:`requests.Session` shared by all the calls; if not provided a new pooled one is created
+    :param pool_connections: number of connection pools cached by the created session
+    :param pool_maxsize: number of connections kept alive in each pool of the created session
+    :param request_cache: the :class:`taiga.requestmaker.RequestCache` shared by all the calls
+    :param retry: the :class:`taiga.requestmaker.RetryPolicy` of all the calls, authentication included
+    :param rate_limiter: the :class:`taiga.requestmaker.RateLimiter` shared by all the calls, authentication
+                         included
+    :param json_codec: the :class:`taiga.requestmaker.JSONCodec` of the payloads and responses; if not provided
+                       the fastest installed JSON library is used
     """
 
     def __init__(
-        self, host="https://api.taiga.io", token=None, token_type="Bearer", tls_verify=True, auth_type="normal"
+        self,
+        host="https://api.taiga.io",
+        token=None,
+        token_type="Bearer",
+        tls_verify=True,
+        auth_type="normal",
+        session=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        request_cache=None,
+        retry=None,
+        rate_limiter=None,
+        json_codec=None,
     ):
         self.host = host
         self.token = token
@@ -68,39 +155,59 @@ class TaigaAPI:
         self.token_type = token_type
         self.tls_verify = tls_verify
         self.auth_type = auth_type
+        self.request_cache = request_cache if request_cache is not None else RequestCache()
+        self.retry = retry if retry is not None else RetryPolicy(total=0)
+        self.rate_limiter = rate_limiter
+        self.json_codec = json_codec if json_codec is not None else get_json_codec()
+        self._owns_session = session is None
+        if session is None:
+            session = build_session(pool_connections, pool_maxsize)
+        self.session = session
         if not self.tls_verify:
             requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
         if token:
-            self.raw_request = RequestMaker("/api/v1", self.host, self.token, self.token_type, self.tls_verify)
+            self.raw_request = self._request_maker(self.token_type)
             self._init_resources()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying session, if it has been created by this instance
+        """
+        if self._owns_session:
+            self.session.close()
+
+    def _request_maker(self, token_type):
+        return RequestMaker(
+            "/api/v1",
+            self.host,
+            self.token,
+            token_type,
+            self.tls_verify,
+            session=self.session,
+            request_cache=self.request_cache,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            json_codec=self.json_codec,
+        )
+
     def _init_resources(self):
-        self.projects = Projects(self.raw_request)
-        self.user_stories = UserStories(self.raw_request)
-        self.user_story_attachments = UserStoryAttachments(self.raw_request)
-        self.users = Users(self.raw_request)
-        self.swimlanes = SwimLanes(self.raw_request)
-        self.issues = Issues(self.raw_request)
-        self.issue_attachments = IssueAttachments(self.raw_request)
-        self.tasks = Tasks(self.raw_request)
-        self.task_attachments = TaskAttachments(self.raw_request)
-        self.milestones = Milestones(self.raw_request)
-        self.severities = Severities(self.raw_request)
-        self.roles = Roles(self.raw_request)
-        self.points = Points(self.raw_request)
-        self.issue_statuses = IssueStatuses(self.raw_request)
-        self.issue_types = IssueTypes(self.raw_request)
-        self.issue_attributes = IssueAttributes(self.raw_request)
-        self.task_attributes = TaskAttributes(self.raw_request)
-        self.user_story_attributes = UserStoryAttributes(self.raw_request)
-        self.task_statuses = TaskStatuses(self.raw_request)
-        self.priorities = Priorities(self.raw_request)
-        self.user_story_statuses = UserStoryStatuses(self.raw_request)
-        self.wikipages = WikiPages(self.raw_request)
-        self.wikilinks = WikiLinks(self.raw_request)
+        for name, factory in RESOURCE_FACTORIES.items():
+            setattr(self, name, factory(self.raw_request))
         self.history = History(self.raw_request)
-        self.webhooks = Webhooks(self.raw_request)
-        self.epics = Epics(self.raw_request)
+
+    def _auth_post(self, full_url, payload, headers):
+        send = self.session.post
+        if self.rate_limiter is not None:
+            send = self.rate_limiter.limit(send)
+        return self.retry.call(
+            "POST", send, full_url, data=self.json_codec.dumps(payload), headers=headers, verify=self.tls_verify
+        )
 
     def me(self):
         """
@@ -108,15 +215,19 @@ class TaigaAPI:
         """
         return self.users.get("me")
 
-    def search(self, project, text=""):
+    def search(self, project, text="", raw=False):
         """
         Search in your Taiga.io instance
 
         :param project: the project id
         :param text: the query of your search
+        :param raw: return the JSON object (`True`) or the undecoded body (`"bytes"`) instead of a
+                    :class:`SearchResult`
         """
         result = self.raw_request.get("search", query={"project": project, "text": text})
-        result = result.json()
+        if raw:
+            return result.content if raw == "bytes" else self.raw_request.decode(result)
+        result = self.raw_request.decode(result)
         search_result = SearchResult()
         search_result.count = result["count"]
         search_result.tasks = self.tasks.parse_list(result["tasks"])
@@ -137,14 +248,15 @@ class TaigaAPI:
         payload = {"type": self.auth_type, "username": username, "password": password}
         try:
             full_url = utils.urljoin(self.host, "/api/v1/auth")
-            response = requests.post(full_url, data=json.dumps(payload), headers=headers, verify=self.tls_verify)
+            response = self._auth_post(full_url, payload, headers)
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "NETWORK ERROR", "POST")
         if response.status_code != 200:
             raise exceptions.TaigaRestException(full_url, response.status_code, response.text, "POST")
-        self.token = response.json()["auth_token"]
-        self.token_refresh = response.json()["refresh"]
-        self.raw_request = RequestMaker("/api/v1", self.host, self.token, "Bearer", self.tls_verify)
+        response_json = self.json_codec.decode(response)
+        self.token = response_json["auth_token"]
+        self.token_refresh = response_json["refresh"]
+        self.raw_request = self._request_maker("Bearer")
         self._init_resources()
 
     def auth_app(self, app_id, app_secret, auth_code, state=""):
@@ -159,33 +271,21 @@ class TaigaAPI:
         payload = {"application": app_id, "auth_code": auth_code, "state": state}
         try:
             full_url = utils.urljoin(self.host, "/api/v1/application-tokens/validate")
-            response = requests.post(full_url, data=json.dumps(payload), headers=headers, verify=self.tls_verify)
+            response = self._auth_post(full_url, payload, headers)
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "NETWORK ERROR", "POST")
         if response.status_code != 200:
             raise exceptions.TaigaRestException(full_url, response.status_code, response.text, "POST")
-        cyphered_token = response.json().get("cyphered_token", "")
+        cyphered_token = self.json_codec.decode(response).get("cyphered_token", "")
         if cyphered_token:
-            from jwkest.jwe import JWE
-            from jwkest.jwk import SYMKey
-
-            sym_key = SYMKey(key=app_secret, alg="A128KW")
-            data, success = JWE().decrypt(cyphered_token, keys=[sym_key]), True
-            if isinstance(data, tuple):
-                data, success = data
-            try:
-                self.token = json.loads(data.decode("utf-8")).get("token", None)
-            except ValueError:  # pragma: no cover
-                self.token = None
-            if not success:
-                self.token = None
+            self.token = _decrypt_app_token(cyphered_token, app_secret)
         else:
             self.token = None
 
         if self.token is None:
             raise exceptions.TaigaRestException(full_url, 400, "INVALID TOKEN", "POST")
 
-        self.raw_request = RequestMaker("/api/v1", self.host, self.token, "Application", self.tls_verify)
+        self.raw_request = self._request_maker("Application")
         self._init_resources()
 
     def refresh_token(self, token_refresh=""):
@@ -205,12 +305,196 @@ class TaigaAPI:
         payload = {"refresh": token_refresh}
         try:
             full_url = utils.urljoin(self.host, "/api/v1/auth/refresh")
-            response = requests.post(full_url, data=json.dumps(payload), headers=headers, verify=self.tls_verify)
+            response = self._auth_post(full_url, payload, headers)
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "NETWORK ERROR", "POST")
         if response.status_code != 200:
             raise exceptions.TaigaRestException(full_url, response.status_code, response.text, "POST")
-        self.token = response.json()["auth_token"]
-        self.token_refresh = response.json()["refresh"]
-        self.raw_request = RequestMaker("/api/v1", self.host, self.token, "Bearer", self.tls_verify)
+        response_json = self.json_codec.decode(response)
+        self.token = response_json["auth_token"]
+        self.token_refresh = response_json["refresh"]
+        self.raw_request = self._request_maker("Bearer")
+        self._init_resources()
+
+
+class AsyncTaigaAPI:
+    """
+    AsyncTaigaAPI class
+
+    Asynchronous counterpart of :class:`TaigaAPI`: it exposes the same resource factories, whose remote methods
+    (``list``, ``get``, ``create``, ``update``, ``patch``, ``delete``) are coroutines.
+
+    Requires ``httpx`` (``pip install python-taiga[async]``).
+
+    :param host: the host of your Taiga.io instance
+    :param token: the token you may provide
+    :param token_type: the token type
+    :param tls_verify: verify server certificate
+    :param auth_type: authentication type identifier
+    :param session: a :class:`httpx.AsyncClient` shared by all the calls; if not provided a new pooled one is created
+    :param pool_maxsize: number of connections of the created client
+    :param request_cache: the :class:`taiga.requestmaker.RequestCache` shared by all the calls
+    :param retry: the :class:`taiga.requestmaker.RetryPolicy` of all the calls, authentication included
+    :param rate_limiter: the :class:`taiga.requestmaker.RateLimiter` shared by all the calls, authentication
+                         included
+    :param json_codec: the :class:`taiga.requestmaker.JSONCodec` of the payloads and responses; if not provided
+                       the fastest installed JSON library is used
+    """
+
+    def __init__(
+        self,
+        host="https://api.taiga.io",
+        token=None,
+        token_type="Bearer",
+        tls_verify=True,
+        auth_type="normal",
+        session=None,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        request_cache=None,
+        retry=None,
+        rate_limiter=None,
+        json_codec=None,
+    ):
+        self.host = host
+        self.token = token
+        self.token_refresh = None
+        self.token_type = token_type
+        self.tls_verify = tls_verify
+        self.auth_type = auth_type
+        self.request_cache = request_cache if request_cache is not None else RequestCache()
+        self.retry = retry if retry is not None else RetryPolicy(total=0)
+        self.rate_limiter = rate_limiter
+        self.json_codec = json_codec if json_codec is not None else get_json_codec()
+        self._owns_session = session is None
+        if session is None:
+            session = build_async_session(pool_maxsize, tls_verify)
+        self.session = session
+        if token:
+            self.raw_request = self._request_maker(self.token_type)
+            self._init_resources()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the underlying client, if it has been created by this instance
+        """
+        if self._owns_session:
+            await self.session.aclose()
+
+    def _request_maker(self, token_type):
+        return AsyncRequestMaker(
+            "/api/v1",
+            self.host,
+            self.token,
+            token_type,
+            self.tls_verify,
+            session=self.session,
+            request_cache=self.request_cache,
+            retry=self.retry,
+            rate_limiter=self.rate_limiter,
+            json_codec=self.json_codec,
+        )
+
+    def _init_resources(self):
+        for name, factory in RESOURCE_FACTORIES.items():
+            setattr(self, name, AsyncListResource(self.raw_request, factory))
+        self.history = AsyncHistory(self.raw_request)
+
+    async def _auth_request(self, uri, payload):
+        headers = {"Content-type": "application/json"}
+        full_url = utils.urljoin(self.host, uri)
+        try:
+            send = self.session.post
+            if self.rate_limiter is not None:
+                send = self.rate_limiter.async_limit(send)
+            response = await self.retry.async_call(
+                "POST", send, full_url, content=self.json_codec.dumps(payload), headers=headers
+            )
+        except httpx.HTTPError:
+            raise exceptions.TaigaRestException(full_url, 400, "NETWORK ERROR", "POST")
+        if response.status_code != 200:
+            raise exceptions.TaigaRestException(full_url, response.status_code, response.text, "POST")
+        return full_url, self.json_codec.decode(response)
+
+    async def me(self):
+        """
+        Get a :class:`taiga.models.models.User` representing me
+        """
+        return await self.users.get("me")
+
+    async def search(self, project, text="", raw=False):
+        """
+        Search in your Taiga.io instance
+
+        :param project: the project id
+        :param text: the query of your search
+        :param raw: return the JSON object (`True`) or the undecoded body (`"bytes"`) instead of a
+                    :class:`SearchResult`
+        """
+        result = await self.raw_request.get("search", query={"project": project, "text": text})
+        if raw:
+            return result.content if raw == "bytes" else self.raw_request.decode(result)
+        result = self.raw_request.decode(result)
+        search_result = SearchResult()
+        search_result.count = result["count"]
+        search_result.tasks = self.tasks.parse_list(result["tasks"])
+        search_result.issues = self.issues.parse_list(result["issues"])
+        search_result.user_stories = self.user_stories.parse_list(result["userstories"])
+        search_result.wikipages = self.wikipages.parse_list(result["wikipages"])
+        search_result.epics = self.epics.parse_list(result["epics"])
+        return search_result
+
+    async def auth(self, username, password):
+        """
+        Authenticate you
+
+        :param username: your username
+        :param password: your password
+        """
+        payload = {"type": self.auth_type, "username": username, "password": password}
+        _full_url, response_json = await self._auth_request("/api/v1/auth", payload)
+        self.token = response_json["auth_token"]
+        self.token_refresh = response_json["refresh"]
+        self.raw_request = self._request_maker("Bearer")
+        self._init_resources()
+
+    async def auth_app(self, app_id, app_secret, auth_code, state=""):
+        """
+        Authenticate an app
+
+        :param app_id: the app id
+        :param app_secret: the app secret
+        :param auth_code: the app auth code
+        """
+        payload = {"application": app_id, "auth_code": auth_code, "state": state}
+        full_url, response_json = await self._auth_request("/api/v1/application-tokens/validate", payload)
+        cyphered_token = response_json.get("cyphered_token", "")
+        self.token = _decrypt_app_token(cyphered_token, app_secret) if cyphered_token else None
+        if self.token is None:
+            raise exceptions.TaigaRestException(full_url, 400, "INVALID TOKEN", "POST")
+        self.raw_request = self._request_maker("Application")
+        self._init_resources()
+
+    async def refresh_token(self, token_refresh=""):
+        """
+        Refresh auth token.
+
+        Passing a token_refresh will use passed token, otherwise it will try to use self.token_refresh.
+
+        :param token_refresh: the refresh token to be used to refresh api token
+        """
+        if not token_refresh:
+            if self.token_refresh:
+                token_refresh = self.token_refresh
+            else:
+                raise ValueError("Refresh token not set")
+        _full_url, response_json = await self._auth_request("/api/v1/auth/refresh", {"refresh": token_refresh})
+        self.token = response_json["auth_token"]
+        self.token_refresh = response_json["refresh"]
+        self.raw_request = self._request_maker("Bearer")
         self._init_resources()
@@ -10,6 +10,8 @@ class TaigaRestException(TaigaException):  # noqa: N818
         self.uri = uri
         self.status_code = status_code
         self.method = method
+        #: the undecoded body of the response
+        self.body = message
         try:
             json_message = json.loads(message)
             if "_error_message" in json_message:
@@ -19,3 +21,29 @@ class TaigaRestException(TaigaException):  # noqa: N818
         if not message:
             message = "Status: {} on URI: {}".format(status_code, uri)
         super().__init__(message)
+
+    def is_version_conflict(self):
+        """
+        Whether the request has been rejected because the ``version`` sent is not the current one
+        """
+        if self.status_code == 409:
+            return True
+        if self.status_code != 400:
+            return False
+        try:
+            body = json.loads(self.body)
+        except (TypeError, ValueError):
+            return False
+        return isinstance(body, dict) and "version" in body
+
+
+class TaigaConflictException(TaigaRestException):  # noqa: N818
+    """
+    Changes that could not be merged with the latest version of the object
+
+    :param fields: names of the attributes changed both locally and remotely
+    """
+
+    def __init__(self, uri, fields, method="PUT"):
+        self.fields = sorted(fields)
+        super().__init__(uri, 400, "Conflicting changes of {}".format(", ".join(self.fields)), method)
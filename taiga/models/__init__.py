@@ -1,4 +1,5 @@
 from .models import (
+    AsyncHistory,
     Epic,
     EpicAttribute,
     EpicAttributes,
@@ -59,6 +60,7 @@ from .models import (
 )
 
 __all__ = [
+    "AsyncHistory",
     "Epic",
     "EpicAttribute",
     "EpicAttributes",
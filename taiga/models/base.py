@@ -1,26 +1,408 @@
+import copy
+import datetime
+import math
+import operator
 import re
+import threading
+import weakref
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import dateutil.tz
+
+from .. import exceptions
+from ..requestmaker import CachedResponse, RequestCacheException
+
+#: default number of pages fetched concurrently by :py:meth:`ListResource.list`
+DEFAULT_MAX_WORKERS = 4
+
+#: conflict policy raising :class:`taiga.exceptions.TaigaConflictException` on the fields changed on both sides
+CONFLICT_FAIL = "fail"
+#: conflict policy keeping the local value of the fields changed on both sides
+CONFLICT_LAST_WRITER_WINS = "last-writer-wins"
+#: default number of times a request rejected for a version conflict is sent again
+DEFAULT_CONFLICT_RETRIES = 3
+
+_MISSING = object()
+
+#: bookkeeping attributes of the instances, slots of the compact ones
+_INTERNAL_ATTRIBUTES = ("_dirty", "_nested")
+
+
+#: lookups accepted by :py:meth:`SearchableList.filter`, as ``<attribute>__<lookup>=<value>``
+LOOKUPS = {
+    "exact": operator.eq,
+    "in": lambda attribute, value: attribute in value,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "contains": lambda attribute, value: value in attribute,
+    "isnull": None,
+}
+
+
+# a single instance for all the dates, each tzlocal() weighs more than the datetime itself
+_LOCAL_TIMEZONE = dateutil.tz.tzlocal()
+
+_TIMESTAMP_RE = re.compile(r"(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})$")
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}$")
+
+
+def parse_date(value, localize=True):
+    """
+    Parse a date (``2015-02-10``) or a timestamp (``2015-02-10T17:55:05.123Z``, ``2015-02-10T17:55:05+0000``)
+    sent by the API
+
+    :param value: the value to parse, returned unchanged if it is not a date
+    :param localize: convert the timestamps to the local timezone, otherwise they keep the offset of the API
+    :return: a :class:`datetime.datetime` for timestamps, a :class:`datetime.date` for dates
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        match = _TIMESTAMP_RE.match(value)
+        if match:
+            day, time, fraction, offset = match.groups()
+            # fromisoformat of python < 3.11 only accepts 3 or 6 fraction digits and "+HH:MM" offsets
+            if fraction:
+                time = "{}.{}".format(time, fraction[:6].ljust(6, "0"))
+            if offset == "Z":
+                offset = "+00:00"
+            elif ":" not in offset:
+                offset = "{}:{}".format(offset[:3], offset[3:])
+            parsed = datetime.datetime.fromisoformat("{}T{}{}".format(day, time, offset))
+            if localize:
+                parsed = parsed.astimezone(_LOCAL_TIMEZONE)
+            return parsed
+        if _DATE_RE.match(value):
+            return datetime.date.fromisoformat(value)
+    except ValueError:
+        pass
+    return value
+
+
+def _attributes(obj, keys=()):
+    """
+    Mapping of the attributes of ``obj``, with the nested objects of ``keys`` parsed if they are still pending
+    """
+    try:
+        attributes = obj._attributes()
+    except AttributeError:
+        return obj.__dict__
+    nested = getattr(obj, "_nested", None)
+    if nested:
+        for key in keys:
+            if key in nested:
+                getattr(obj, key)
+    return attributes
+
+
+def _sort_key(obj, key, descending):
+    # `None` values sort last in both directions
+    value = _attributes(obj, (key,)).get(key)
+    if descending:
+        return (value is not None, value)
+    return (value is None, value)
+
+
+#: weak references to the :class:`SearchableList` that have built indexes, by id
+_INDEXED_LISTS = {}
+_INDEXED_LISTS_LOCK = threading.Lock()
+
+
+def _drop_indexes(obj, key=None):
+    """
+    Drop the index of ``key``, or all the indexes if not provided, of the lists holding ``obj``
+    """
+    indexed_lists = []
+    with _INDEXED_LISTS_LOCK:
+        for list_id, ref in list(_INDEXED_LISTS.items()):
+            searchable = ref()
+            if searchable is None:
+                del _INDEXED_LISTS[list_id]
+            else:
+                indexed_lists.append(searchable)
+    for searchable in indexed_lists:
+        searchable._drop_indexes(obj, key)
 
 
 class SearchableList(list):
+    """
+    A list of model instances that can be searched by attribute value
+
+    The lookups accept the suffixes of :data:`LOOKUPS`, e.g. ``status__in=[1, 2]``,
+    ``created_date__gt=date``, ``tags__contains="bug"`` or ``assigned_to__isnull=True``.
+
+    The first lookup on a key builds a hash index of the objects by the value of that key, so the following
+    exact and ``in`` lookups on the same key take constant time. The indexes are dropped whenever the list
+    changes, the index of a key whenever that attribute of one of its :class:`InstanceResource` is set, and
+    rebuilt on demand.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._invalidate()
+
+    def _invalidate(self):
+        self._indexes = {}
+        self._positions = None
+
+    def _object_positions(self):
+        """
+        Positions of the objects in the list, by object id
+        """
+        if self._positions is None:
+            self._positions = {id(obj): position for position, obj in enumerate(self)}
+        return self._positions
+
+    def _drop_indexes(self, obj, key=None):
+        """
+        Drop the index of ``key``, or all the indexes if not provided, if ``obj`` is in the list
+        """
+        indexes = self._indexes
+        if not indexes or (key is not None and key not in indexes):
+            return
+        positions = self._positions
+        if positions is None or id(obj) not in positions:
+            return
+        if key is None:
+            self._indexes = {}
+        else:
+            indexes.pop(key, None)
+
+    def _index(self, key):
+        """
+        Index of the objects by the value of ``key``, `None` if the values are not hashable
+        """
+        try:
+            return self._indexes[key]
+        except KeyError:
+            pass
+        # the positions tell which objects are in the list when one of them changes
+        self._object_positions()
+        with _INDEXED_LISTS_LOCK:
+            ref = _INDEXED_LISTS.get(id(self))
+            if ref is None or ref() is not self:
+                _INDEXED_LISTS[id(self)] = weakref.ref(self)
+        index = {}
+        try:
+            for obj in self:
+                attributes = _attributes(obj, (key,))
+                if key in attributes:
+                    index.setdefault(attributes[key], []).append(obj)
+        except TypeError:
+            index = None
+        self._indexes[key] = index
+        return index
+
+    def _in_list_order(self, objects):
+        positions = self._object_positions()
+        return sorted(objects, key=lambda obj: positions[id(obj)])
+
+    def _bucket(self, key, lookup, value):
+        """
+        Indexed objects matching the lookup, `None` if the lookup cannot use an index
+        """
+        if lookup not in ("exact", "in"):
+            return None
+        index = self._index(key)
+        if index is None:
+            return None
+        try:
+            if lookup == "exact":
+                return index.get(value, ())
+            buckets = [index[item] for item in set(value) if item in index]
+        except TypeError:
+            return None
+        if len(buckets) == 1:
+            return buckets[0]
+        return self._in_list_order([obj for bucket in buckets for obj in bucket])
+
+    @staticmethod
+    def _parse_lookup(name):
+        key, separator, lookup = name.rpartition("__")
+        if separator and key and lookup in LOOKUPS:
+            return key, lookup
+        return name, "exact"
+
+    def _candidates(self, query):
+        """
+        Smallest set of objects that can match the query, with the conditions left to check on them
+        """
+        candidates = candidates_condition = None
+        conditions = []
+        for name, value in query.items():
+            key, lookup = self._parse_lookup(name)
+            condition = (key, lookup, value)
+            bucket = self._bucket(key, lookup, value)
+            if bucket is not None and (candidates is None or len(bucket) < len(candidates)):
+                if candidates is not None:
+                    conditions.append(candidates_condition)
+                candidates, candidates_condition = bucket, condition
+            else:
+                conditions.append(condition)
+        if candidates is None:
+            return self, conditions
+        return candidates, conditions
+
+    @staticmethod
+    def _match(obj, conditions):
+        attributes = _attributes(obj, [key for key, _lookup, _value in conditions])
+        for key, lookup, value in conditions:
+            if lookup == "isnull":
+                if (attributes.get(key) is None) != bool(value):
+                    return False
+            elif key not in attributes:
+                return False
+            elif lookup == "exact":
+                if attributes[key] != value:
+                    return False
+            else:
+                try:
+                    if not LOOKUPS[lookup](attributes[key], value):
+                        return False
+                except TypeError:
+                    return False
+        return True
+
     def get(self, **query):
-        for obj in self:
-            ok_obj = True
-            for key, value in query.items():
-                if key not in obj.__dict__ or obj.__dict__[key] != value:
-                    ok_obj = False
-            if ok_obj:
+        candidates, conditions = self._candidates(query)
+        for obj in candidates:
+            if self._match(obj, conditions):
                 return obj
 
     def filter(self, **query):  # noqa: A003
-        result_objs = []
-        for obj in self:
-            ok_obj = True
-            for key, value in query.items():
-                if key not in obj.__dict__ or obj.__dict__[key] != value:
-                    ok_obj = False
-            if ok_obj:
-                result_objs.append(obj)
-        return result_objs
+        """
+        Objects matching all the lookups, in a single pass
+
+        :param query: lookups as ``<attribute>=<value>`` or ``<attribute>__<lookup>=<value>``
+        :return: a :class:`SearchableList`
+        """
+        candidates, conditions = self._candidates(query)
+        if not conditions:
+            return SearchableList(candidates)
+        return SearchableList(obj for obj in candidates if self._match(obj, conditions))
+
+    def order_by(self, *keys):
+        """
+        Objects sorted by the given attributes, prefixed by ``-`` for descending order
+
+        Objects without the attribute, or with a `None` value, come last.
+
+        :param keys: the attributes to sort by
+        :return: a :class:`SearchableList`
+        """
+        objects = list(self)
+        for name in reversed(keys):
+            descending = name.startswith("-")
+            key = name.lstrip("-")
+            if descending:
+                objects.sort(key=lambda obj: _sort_key(obj, key, True), reverse=True)
+            else:
+                objects.sort(key=lambda obj: _sort_key(obj, key, False))
+        return SearchableList(objects)
+
+    def group_by(self, key):
+        """
+        Group the objects by the value of ``key``, in one pass
+
+        Objects without ``key`` are left out.
+
+        :param key: the attribute to group by
+        :return: a dict of value: :class:`SearchableList`
+        """
+        index = self._index(key)
+        if index is None:
+            raise TypeError("unhashable values of {}".format(key))
+        return {value: SearchableList(objects) for value, objects in index.items()}
+
+    def append(self, obj):
+        super().append(obj)
+        self._invalidate()
+
+    def extend(self, objects):
+        super().extend(objects)
+        self._invalidate()
+
+    def insert(self, index, obj):
+        super().insert(index, obj)
+        self._invalidate()
+
+    def remove(self, obj):
+        super().remove(obj)
+        self._invalidate()
+
+    def pop(self, *args):
+        obj = super().pop(*args)
+        self._invalidate()
+        return obj
+
+    def clear(self):
+        super().clear()
+        self._invalidate()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._invalidate()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._invalidate()
+
+    def __iadd__(self, objects):
+        result = super().__iadd__(objects)
+        self._invalidate()
+        return result
+
+    def __imul__(self, times):
+        result = super().__imul__(times)
+        self._invalidate()
+        return result
+
+    def __deepcopy__(self, memo):
+        # the indexes refer to the original objects, the copy builds its own
+        copied = type(self)()
+        memo[id(self)] = copied
+        copied.extend(copy.deepcopy(obj, memo) for obj in self)
+        return copied
+
+
+def _body_size(response):
+    if isinstance(response, CachedResponse):
+        return response.size
+    return len(response.content or b"")
+
+
+def _measured(parse, sizes):
+    """Page parser also appending the size of the page bodies to ``sizes``."""
+
+    def measured_parse(result):
+        sizes.append(_body_size(result))
+        return parse(result)
+
+    return measured_parse
+
+
+class _CachedObjects:
+    """
+    Parsed objects stored in the object cache, sized by the bodies they were parsed from
+    """
+
+    __slots__ = ("objects", "size")
+
+    def __init__(self, objects, size):
+        self.objects = objects
+        self.size = size
 
 
 class Resource:
@@ -28,6 +410,29 @@ class Resource:
         self.requester = requester
 
 
+class BatchResult:
+    """
+    Outcome of a batch of requests on many objects
+
+    :param results: the results of the successful requests, by object id
+    :param errors: the :class:`taiga.exceptions.TaigaException` raised by the failed requests, by object id
+    """
+
+    def __init__(self, results=None, errors=None):
+        self.results = results if results is not None else {}
+        self.errors = errors if errors is not None else {}
+
+    def __repr__(self):
+        return "BatchResult({} succeeded, {} failed)".format(len(self.results), len(self.errors))
+
+    @property
+    def ok(self):
+        """
+        Whether all the requests succeeded
+        """
+        return not self.errors
+
+
 class ListResource(Resource):
     """ListResource model
 
@@ -36,7 +441,21 @@ class ListResource(Resource):
     :param requester: :class:`Requester` instance
     """
 
-    def list(self, pagination=True, page_size=None, page=None, **queryparams):  # noqa: A003
+    #: maximum number of objects created by a single bulk request
+    bulk_chunk_size = 100
+
+    def list(  # noqa: A003
+        self,
+        pagination=True,
+        page_size=None,
+        page=None,
+        parallel=False,
+        max_workers=DEFAULT_MAX_WORKERS,
+        cache=False,
+        compact=False,
+        raw=False,
+        **queryparams,
+    ):
         """
         Retrieves a list of objects.
 
@@ -49,56 +468,274 @@ class ListResource(Resource):
         endpoint and returned. This may trigger some parsing error if the
         result set is very large.
 
+        If ``parallel`` is set and the first page reports the total count of
+        objects, the remaining pages are fetched concurrently on a pool of at
+        most ``max_workers`` threads and merged in page order.
+
+        If ``cache`` is set, the parsed objects are kept for the
+        ``cache_time`` of the model and the following identical calls return
+        copies of them without any request.
+
+        If ``compact`` is set, the objects are instances of a slotted variant
+        of the model (see :py:meth:`InstanceResource.compact_class`), which
+        take several times less memory than regular ones.
+
+        If ``raw`` is set, no model instance is built: the result is the list
+        of the decoded JSON objects or, with ``raw="bytes"``, the list of the
+        undecoded bodies of the pages.
+
         :param pagination: Use pagination (default: `True`)
         :param page_size: Size of the pagination page (default: `100`).
                           Any non numeric value will be casted to the
                           default value
         :param page: Page number to retrieve (default: `None`). Ignored if
                      `pagination` is `False`
+        :param parallel: Fetch the remaining pages concurrently (default: `False`)
+        :param max_workers: Maximum number of pages fetched at the same time
+                            when `parallel` is set (default: `4`)
+        :param cache: Use the local cache (default: `False`)
+        :param compact: Return memory-compact objects (default: `False`)
+        :param raw: Return the JSON objects (`True`) or the page bodies
+                    (`"bytes"`) instead of model instances (default: `False`)
         :param queryparams: Additional filter parameters as accepted by the
                             remote API
-        :return: <SearchableList>
+        :return: <SearchableList>, or a list when `raw` is set
         """
         if page_size and pagination:
-            try:
-                page_size = int(page_size)
-            except (ValueError, TypeError):
-                page_size = 100
-            queryparams["page_size"] = page_size
+            queryparams["page_size"] = self._clean_page_size(page_size)
         if page and pagination:
             queryparams["page"] = page
-        result = self.requester.get(self.instance.endpoint, query=queryparams, paginate=pagination)
-        objects = SearchableList()
-        objects.extend(self.parse_list(result.json()))
+        use_object_cache = cache and not raw
+        if use_object_cache:
+            cache_key = "{}:{}".format(
+                "compact" if compact else "list",
+                self.requester.cache_key(
+                    self.requester.get_full_url(self.instance.endpoint), queryparams, paginate=pagination
+                ),
+            )
+            try:
+                return self._cached_objects(cache_key)
+            except RequestCacheException:
+                pass
+        # the parsed objects are cached instead of the responses
+        cache_options = {} if use_object_cache else self._cache_options(cache)
+        parallel = parallel and pagination and not page
+        if parallel:
+            # lazy pagination does not report the total count needed to plan the concurrent fetch
+            result = self.requester.get(
+                self.instance.endpoint, query=queryparams, paginate=pagination, lazy=False, **cache_options
+            )
+        else:
+            result = self.requester.get(
+                self.instance.endpoint, query=queryparams, paginate=pagination, **cache_options
+            )
+        parse = self._page_parser(compact, raw)
+        if use_object_cache:
+            sizes = []
+            parse = _measured(parse, sizes)
+        objects = [] if raw else SearchableList()
+        objects.extend(parse(result))
         if result.headers.get("X-Pagination-Next", False) and not page:
             next_page = 2
         else:
             next_page = None
+        total_pages = self._total_pages(result.headers) if parallel and next_page else None
+        if total_pages:
+            objects.extend(
+                self._fetch_pages(queryparams, range(next_page, total_pages + 1), max_workers, cache_options, parse)
+            )
+            next_page = None
         while next_page:
             pageparams = queryparams.copy()
             pageparams["page"] = next_page
-            result = self.requester.get(
-                self.instance.endpoint,
-                query=pageparams,
-            )
-            objects.extend(self.parse_list(result.json()))
+            result = self.requester.get(self.instance.endpoint, query=pageparams, **cache_options)
+            objects.extend(parse(result))
             if result.headers.get("X-Pagination-Next", False):
                 next_page += 1
             else:
                 next_page = None
+        if use_object_cache:
+            self._cache_objects(cache_key, objects, sum(sizes))
+        return objects
+
+    def iter(self, page_size=None, compact=False, **queryparams):  # noqa: A003
+        """
+        Iterates over the objects, one page at a time.
+
+        Each page is requested only when the objects of the previous one have
+        been consumed, so memory usage is bound to a single page and stopping
+        the iteration (e.g.: ``break``) prevents any further request.
+
+        :param page_size: Size of the pagination page (default: `100`).
+                          Any non numeric value will be casted to the
+                          default value
+        :param compact: Yield memory-compact objects (default: `False`)
+        :param queryparams: Additional filter parameters as accepted by the
+                            remote API
+        :return: generator of model instances
+        """
+        if page_size:
+            queryparams["page_size"] = self._clean_page_size(page_size)
+        result = self.requester.get(self.instance.endpoint, query=queryparams, paginate=True)
+        next_page = 2
+        while True:
+            has_next = result.headers.get("X-Pagination-Next", False)
+            entries = self.requester.decode(result) or []
+            instance = self._instance_class(entries, compact)
+            for entry in entries:
+                yield instance.parse(self.requester, entry)
+            if not has_next:
+                break
+            pageparams = queryparams.copy()
+            pageparams["page"] = next_page
+            result = self.requester.get(
+                self.instance.endpoint,
+                query=pageparams,
+            )
+            next_page += 1
+
+    @staticmethod
+    def _clean_page_size(page_size):
+        try:
+            return int(page_size)
+        except (ValueError, TypeError):
+            return 100
+
+    @staticmethod
+    def _total_pages(headers):
+        try:
+            count = int(headers.get("X-Pagination-Count"))
+            paginated_by = int(headers.get("X-Paginated-By"))
+        except (ValueError, TypeError):
+            return None
+        if paginated_by <= 0:
+            return None
+        return math.ceil(count / paginated_by)
+
+    def _page_parser(self, compact=False, raw=False):
+        """Function turning a page response into the list of its objects."""
+        if raw == "bytes":
+            return lambda result: [result.content]
+        if raw:
+            return lambda result: self.requester.decode(result) or []
+        return lambda result: self.parse_list(self.requester.decode(result), compact)
+
+    def _fetch_page(self, queryparams, page, cache_options=None, parse=None):
+        pageparams = queryparams.copy()
+        pageparams["page"] = page
+        result = self.requester.get(self.instance.endpoint, query=pageparams, **(cache_options or {}))
+        return (parse or self._page_parser())(result)
+
+    def _fetch_pages(self, queryparams, pages, max_workers=DEFAULT_MAX_WORKERS, cache_options=None, parse=None):
+        """Fetch the given pages concurrently and return the objects in page order."""
+        objects = SearchableList()
+        if not pages:
+            return objects
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pages)))) as executor:
+            for page_objects in executor.map(
+                lambda page: self._fetch_page(queryparams, page, cache_options, parse), pages
+            ):
+                objects.extend(page_objects)
         return objects
 
-    def get(self, resource_id):
+    def _cache_options(self, cache):
+        if not cache:
+            return {}
+        return {"cache": True, "cache_time": self.instance.cache_time}
+
+    def _cached_objects(self, cache_key):
+        """Copies of the parsed objects stored in the cache, raises :class:`RequestCacheException` on miss."""
+        return copy.deepcopy(self.requester.object_cache.get(cache_key).objects)
+
+    def _cache_objects(self, cache_key, objects, size):
+        # callers are free to modify the returned objects and their attributes, the cached ones are deep copies
+        self.requester.object_cache.put(
+            cache_key, _CachedObjects(copy.deepcopy(objects), size), self.instance.cache_time
+        )
+
+    def get(self, resource_id, cache=False, raw=False):
+        """
+        Retrieves an object by id.
+
+        :param resource_id: the id of the object
+        :param cache: Use the local cache (default: `False`); see :py:meth:`list`
+        :param raw: Return the JSON object (`True`) or the undecoded body (`"bytes"`) instead of a model instance
+                    (default: `False`)
+        """
+        if raw:
+            response = self.requester.get(
+                "/{endpoint}/{id}", endpoint=self.instance.endpoint, id=resource_id, **self._cache_options(cache)
+            )
+            return response.content if raw == "bytes" else self.requester.decode(response)
+        if not cache:
+            response = self.requester.get("/{endpoint}/{id}", endpoint=self.instance.endpoint, id=resource_id)
+            return self.instance.parse(self.requester, self.requester.decode(response))
+        full_url = self.requester.get_full_url("/{endpoint}/{id}", endpoint=self.instance.endpoint, id=resource_id)
+        cache_key = "get:{}".format(full_url)
+        try:
+            return self._cached_objects(cache_key)
+        except RequestCacheException:
+            pass
+        # the parsed object is cached instead of the response
         response = self.requester.get("/{endpoint}/{id}", endpoint=self.instance.endpoint, id=resource_id)
-        return self.instance.parse(self.requester, response.json())
+        obj = self.instance.parse(self.requester, self.requester.decode(response))
+        self._cache_objects(cache_key, obj, _body_size(response))
+        return obj
 
     def delete(self, resource_id, query=None):
+        return self._delete_resource(resource_id, query)
+
+    def _delete_resource(self, resource_id, query=None):
         self.requester.delete("/{endpoint}/{id}", endpoint=self.instance.endpoint, id=resource_id, query=query)
         return self
 
     def _new_resource(self, **attrs):
         response = self.requester.post(self.instance.endpoint, **attrs)
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
+
+    def _upload_resource(self, **attrs):
+        response = self.requester.upload(self.instance.endpoint, **attrs)
+        return self.instance.parse(self.requester, self.requester.decode(response))
+
+    @staticmethod
+    def _bulk_payloads(field, subjects, chunk_size, payload):
+        """
+        Split the subjects in the payloads of the successive bulk requests
+
+        :param field: payload field holding the subjects, one per line
+        :param subjects: iterable of subjects
+        :param chunk_size: maximum number of subjects of a request
+        :param payload: the other fields of the requests, `None` values are left out
+        """
+        subjects = list(subjects)
+        for subject in subjects:
+            if "\n" in subject or "\r" in subject:
+                raise ValueError("Bulk created subjects cannot span several lines: {!r}".format(subject))
+        payload = {key: value for key, value in payload.items() if value is not None}
+        for start in range(0, len(subjects), chunk_size):
+            data = dict(payload)
+            data[field] = "\n".join(subjects[start : start + chunk_size])
+            yield data
+
+    def _bulk_create(self, field, subjects, chunk_size=None, **payload):
+        """
+        Create many objects through the ``bulk_create`` endpoint, returns them in the order of the subjects
+        """
+        objects = SearchableList()
+        for data in self._bulk_payloads(field, subjects, chunk_size or self.bulk_chunk_size, payload):
+            response = self.requester.post("/{endpoint}/bulk_create", endpoint=self.instance.endpoint, payload=data)
+            objects.extend(self.parse_list(self.requester.decode(response)))
+        return objects
+
+    def _bulk_update(self, action, **payload):
+        """
+        Send a bulk update of many objects to the ``action`` endpoint, `None` values are left out of the payload
+        """
+        payload = {key: value for key, value in payload.items() if value is not None}
+        response = self.requester.post(
+            "/{endpoint}/{action}", endpoint=self.instance.endpoint, action=action, payload=payload
+        )
+        return self.requester.decode(response)
 
     @classmethod
     def parse(cls, requester, entries):
@@ -109,15 +746,227 @@ class ListResource(Resource):
             result_entries.append(cls.instance.parse(requester, entry))
         return result_entries
 
-    def parse_list(self, entries):
+    def _instance_class(self, entries, compact):
+        if not compact or not entries or not isinstance(entries[0], dict):
+            return self.instance
+        return self.instance.compact_class(entries[0].keys())
+
+    @property
+    def _instance_requester(self):
+        """Requester the parsed instances are bound to."""
+        return self.requester
+
+    def parse_list(self, entries, compact=False):
         """Parse a JSON array into a list of model instances."""
         result_entries = SearchableList()
         entry_list = entries if entries else []
+        instance = self._instance_class(entry_list, compact)
+        requester = self._instance_requester
         for entry in entry_list:
-            result_entries.append(self.instance.parse(self.requester, entry))
+            result_entries.append(instance.parse(requester, entry))
         return result_entries
 
 
+#: methods of the requesters sending a request
+_REMOTE_METHODS = frozenset(["get", "post", "put", "patch", "delete", "upload"])
+
+
+class _AsyncInstanceRequester:
+    """
+    Requester of the instances returned by :class:`AsyncListResource`
+
+    Their own methods expect responses while the :class:`AsyncRequestMaker` returns coroutines: its remote
+    methods raise :class:`TypeError` instead, the rest of its interface is left available.
+    """
+
+    def __init__(self, requester):
+        self._requester = requester
+
+    def __getattr__(self, name):
+        attribute = getattr(self._requester, name)
+        if name not in _REMOTE_METHODS:
+            return attribute
+
+        def unavailable(*args, **kwargs):
+            raise TypeError(
+                "Models returned by AsyncTaigaAPI cannot send requests themselves, "
+                "use the coroutines of the AsyncTaigaAPI resources instead"
+            )
+
+        return unavailable
+
+
+class AsyncListResource(Resource):
+    """AsyncListResource model
+
+    Asynchronous counterpart of a :class:`ListResource` factory: it reuses the models and the payload building of
+    the wrapped factory, while every remote call is a coroutine to be awaited.
+
+    The methods of the returned model instances sending requests raise :class:`TypeError`: use the methods of
+    this class (:py:meth:`update`, :py:meth:`patch`, :py:meth:`save`, :py:meth:`delete`) instead.
+
+    :param requester: :class:`AsyncRequestMaker` instance
+    :param factory: the :class:`ListResource` subclass to wrap
+    """
+
+    def __init__(self, requester, factory):
+        super().__init__(requester)
+        self.factory = factory
+        self.instance = factory.instance
+        self._instance_requester = _AsyncInstanceRequester(requester)
+
+    async def list(self, pagination=True, page_size=None, page=None, **queryparams):  # noqa: A003
+        """
+        Retrieves a list of objects.
+
+        Parameters are the same as :py:meth:`ListResource.list`
+
+        :return: <SearchableList>
+        """
+        if page_size and pagination:
+            queryparams["page_size"] = ListResource._clean_page_size(page_size)
+        if page and pagination:
+            queryparams["page"] = page
+        result = await self.requester.get(self.instance.endpoint, query=queryparams, paginate=pagination)
+        objects = SearchableList()
+        objects.extend(self.parse_list(self.requester.decode(result)))
+        next_page = 2 if result.headers.get("X-Pagination-Next", False) and not page else None
+        while next_page:
+            pageparams = queryparams.copy()
+            pageparams["page"] = next_page
+            result = await self.requester.get(
+                self.instance.endpoint,
+                query=pageparams,
+            )
+            objects.extend(self.parse_list(self.requester.decode(result)))
+            next_page = next_page + 1 if result.headers.get("X-Pagination-Next", False) else None
+        return objects
+
+    async def get(self, resource_id):
+        response = await self.requester.get("/{endpoint}/{id}", endpoint=self.instance.endpoint, id=resource_id)
+        return self.instance.parse(self._instance_requester, self.requester.decode(response))
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete an object; arguments are the same of the ``delete`` method of the wrapped factory.
+        """
+        return self.factory.delete(self, *args, **kwargs)
+
+    async def _delete_resource(self, resource_id, query=None):
+        await self.requester.delete("/{endpoint}/{id}", endpoint=self.instance.endpoint, id=resource_id, query=query)
+        return self
+
+    def create(self, *args, **attrs):
+        """
+        Create a new object; arguments are the same of the ``create`` method of the wrapped factory.
+        """
+        # the wrapped factory builds the payload and hands it to our coroutine _new_resource
+        return self.factory.create(self, *args, **attrs)
+
+    async def update(self, obj, conflict=None, conflict_retries=DEFAULT_CONFLICT_RETRIES, **args):
+        """
+        Update the given model instance
+
+        :param obj: :class:`InstanceResource` to update
+        :param conflict: the conflict policy, see :py:meth:`InstanceResource.update`
+        :param conflict_retries: maximum number of times the request is sent again
+        """
+
+        def send():
+            return self.requester.put(
+                "/{endpoint}/{id}", endpoint=obj.endpoint, id=obj.id, payload=obj._update_payload(**args)
+            )
+
+        response = await self._send_resolving_conflicts(obj, send, obj.dirty_fields, conflict, conflict_retries)
+        obj._update_version(self.requester.decode(response))
+        obj._mark_clean()
+        return obj
+
+    async def patch(self, obj, fields, conflict=None, conflict_retries=DEFAULT_CONFLICT_RETRIES, **args):
+        """
+        Patch the given model instance
+
+        :param obj: :class:`InstanceResource` to patch
+        :param fields: the fields to send
+        :param conflict: the conflict policy, see :py:meth:`InstanceResource.update`
+        :param conflict_retries: maximum number of times the request is sent again
+        """
+
+        def send():
+            return self.requester.patch(
+                "/{endpoint}/{id}", endpoint=obj.endpoint, id=obj.id, payload=obj._patch_payload(fields, **args)
+            )
+
+        response = await self._send_resolving_conflicts(obj, send, fields, conflict, conflict_retries)
+        obj._update_version(self.requester.decode(response))
+        obj._mark_clean(fields)
+        return obj
+
+    async def save(self, obj, conflict=None, conflict_retries=DEFAULT_CONFLICT_RETRIES, **args):
+        """
+        Patch the changed attributes of the given model instance, see :py:meth:`InstanceResource.save`
+
+        :param obj: :class:`InstanceResource` to save
+        :param conflict: the conflict policy, see :py:meth:`InstanceResource.update`
+        :param conflict_retries: maximum number of times the request is sent again
+        """
+        if obj._save_payload(**args) is None:
+            return obj
+
+        def send():
+            return self.requester.patch(
+                "/{endpoint}/{id}", endpoint=obj.endpoint, id=obj.id, payload=obj._save_payload(**args)
+            )
+
+        response = await self._send_resolving_conflicts(obj, send, obj.dirty_fields, conflict, conflict_retries)
+        obj._update_version(self.requester.decode(response))
+        obj._mark_clean()
+        return obj
+
+    async def _send_resolving_conflicts(self, obj, send, fields, conflict, retries):
+        _check_conflict_policy(conflict)
+        attempt = 0
+        while True:
+            try:
+                return await send()
+            except exceptions.TaigaRestException as exc:
+                if conflict is None or attempt >= retries or not exc.is_version_conflict():
+                    raise
+            attempt += 1
+            response = await self.requester.get("/{endpoint}/{id}", endpoint=obj.endpoint, id=obj.id)
+            obj.merge_latest(self.requester.decode(response), fields, conflict)
+
+    async def _new_resource(self, **attrs):
+        response = await self.requester.post(self.instance.endpoint, **attrs)
+        return self.instance.parse(self._instance_requester, self.requester.decode(response))
+
+    async def _upload_resource(self, **attrs):
+        response = await self.requester.upload(self.instance.endpoint, **attrs)
+        return self.instance.parse(self._instance_requester, self.requester.decode(response))
+
+    def bulk_create(self, *args, **attrs):
+        """
+        Create many objects; arguments are the same of the ``bulk_create`` method of the wrapped factory.
+        """
+        return self.factory.bulk_create(self, *args, **attrs)
+
+    async def _bulk_create(self, field, subjects, chunk_size=None, **payload):
+        objects = SearchableList()
+        for data in ListResource._bulk_payloads(field, subjects, chunk_size or self.factory.bulk_chunk_size, payload):
+            response = await self.requester.post(
+                "/{endpoint}/bulk_create", endpoint=self.instance.endpoint, payload=data
+            )
+            objects.extend(self.parse_list(self.requester.decode(response)))
+        return objects
+
+    def _instance_class(self, entries, compact):
+        return self.factory._instance_class(self, entries, compact)
+
+    def parse_list(self, entries, compact=False):
+        """Parse a JSON array into a list of model instances."""
+        return self.factory.parse_list(self, entries, compact)
+
+
 class InstanceResource(Resource):
     """InstanceResource model
 
@@ -129,48 +978,289 @@ class InstanceResource(Resource):
 
     endpoint = ""
 
+    #: number of seconds the objects are kept in the cache, `None` to use the cache default
+    cache_time = None
+
     parser = {}
 
     allowed_params = []
 
     repr_attribute = "name"
 
+    #: attributes holding the dates and timestamps, parsed by :func:`parse_date`
+    date_fields = (
+        "created_date",
+        "modified_date",
+        "finished_date",
+        "finish_date",
+        "due_date",
+        "estimated_start",
+        "estimated_finish",
+    )
+
+    #: convert the parsed timestamps to the local timezone
+    localize_dates = True
+
     def __init__(self, requester, **params):
-        import dateutil.parser
+        for key in self.date_fields:
+            value = params.get(key)
+            if value:
+                params[key] = parse_date(value, self.localize_dates)
+        params["requester"] = requester
+        # a new instance cannot be indexed yet, no need to go through __setattr__
+        self._store(params)
 
-        self.requester = requester
-        for key, value in params.items():
-            if key in ["created_date", "modified_date"]:
-                if re.compile(r"\d+-\d+-\d+T\d+:\d+:\d+\+0000").match(value):
-                    d = dateutil.parser.parse(value)
-                    value = d.astimezone(dateutil.tz.tzlocal())
-            setattr(self, key, value)
+    def _store(self, attributes):
+        self.__dict__.update(attributes)
 
-    def update(self, **args):
+    def _attributes(self):
+        """
+        Mapping of the attributes of the instance
+        """
+        return self.__dict__
+
+    @classmethod
+    def compact_class(cls, keys=()):
+        """
+        Slotted variant of the model, storing ``keys`` and the ``allowed_params`` without a per-instance dict
+
+        Its instances behave like the regular ones (other attributes can still be set) while taking about a
+        third less memory, which matters for large lists. The classes are created once per set of keys.
+
+        :param keys: the attributes of the instances, usually the keys of the JSON objects
+        """
+        keys = frozenset(keys)
+        try:
+            return _COMPACT_CLASSES[cls, keys]
+        except KeyError:
+            pass
+        slots = sorted(
+            key
+            for key in keys.union(cls.allowed_params, ["requester"])
+            if key.isidentifier() and not key.startswith("__") and not hasattr(cls, key)
+        )
+        slots.extend(_INTERNAL_ATTRIBUTES)
+        compact_class = type(
+            cls.__name__,
+            (CompactInstanceMixin, cls),
+            {"__slots__": tuple(slots), "__module__": cls.__module__, "_slot_names": frozenset(slots)},
+        )
+        _COMPACT_CLASSES[cls, keys] = compact_class
+        return compact_class
+
+    def __setattr__(self, name, value):
+        dirty = getattr(self, "_dirty", None) or {}
+        if name in self.allowed_params and name not in dirty:
+            # keep the value of the last known remote state, the base of the merges; copy on write, the copies
+            # of the instance may share the dict
+            dirty = dict(dirty)
+            dirty[name] = self._attributes().get(name, _MISSING)
+            object.__setattr__(self, "_dirty", dirty)
+        super().__setattr__(name, value)
+        _drop_indexes(self, name)
+
+    def __deepcopy__(self, memo):
+        # the copies share the requester, and their attributes are stored without being marked as changed
+        memo.setdefault(id(self.requester), self.requester)
+        memo.setdefault(id(_LOCAL_TIMEZONE), _LOCAL_TIMEZONE)
+        obj = object.__new__(type(self))
+        memo[id(self)] = obj
+        obj._store({key: copy.deepcopy(value, memo) for key, value in self._attributes().items()})
+        return obj
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+        _drop_indexes(self, name)
+        self._mark_clean([name])
+
+    @property
+    def dirty_fields(self):
+        """
+        Names of the ``allowed_params`` assigned since the instance has been parsed or last sent
+        """
+        return frozenset(getattr(self, "_dirty", None) or ())
+
+    def _mark_clean(self, fields=None):
+        """
+        Forget the changes of ``fields``, or of all the attributes if not provided
+        """
+        dirty = getattr(self, "_dirty", None)
+        if dirty is None:
+            return
+        if fields is None:
+            object.__delattr__(self, "_dirty")
+        else:
+            object.__setattr__(self, "_dirty", {key: value for key, value in dirty.items() if key not in fields})
+
+    def update(self, conflict=None, conflict_retries=DEFAULT_CONFLICT_RETRIES, **args):
         """
         Update the current :class:`InstanceResource`
+
+        On a version conflict, the request fails unless a ``conflict`` policy is given: the latest state of the
+        object is fetched, the attributes assigned locally are merged into it and the request is sent again.
+        See :py:meth:`merge_latest` for the policies.
+
+        :param conflict: the conflict policy, `None` to fail without fetching the latest state
+        :param conflict_retries: maximum number of times the request is sent again
         """
-        self_dict = self.to_dict()
-        if args:
-            self_dict = dict(list(self_dict.items()) + list(args.items()))
-        response = self.requester.put("/{endpoint}/{id}", endpoint=self.endpoint, id=self.id, payload=self_dict)
-        obj_json = response.json()
-        if "version" in obj_json:
-            self.__dict__["version"] = obj_json["version"]
+
+        def send():
+            self_dict = self._update_payload(**args)
+            return self.requester.put("/{endpoint}/{id}", endpoint=self.endpoint, id=self.id, payload=self_dict)
+
+        response = self._send_resolving_conflicts(send, self.dirty_fields, conflict, conflict_retries)
+        self._update_version(self.requester.decode(response))
+        self._mark_clean()
         return self
 
-    def patch(self, fields, **args):
+    def patch(self, fields, conflict=None, conflict_retries=DEFAULT_CONFLICT_RETRIES, **args):
         """
         Patch the current :class:`InstanceResource`
+
+        :param fields: the fields to send
+        :param conflict: the conflict policy, see :py:meth:`update`
+        :param conflict_retries: maximum number of times the request is sent again
+        """
+
+        def send():
+            self_dict = self._patch_payload(fields, **args)
+            return self.requester.patch("/{endpoint}/{id}", endpoint=self.endpoint, id=self.id, payload=self_dict)
+
+        response = self._send_resolving_conflicts(send, fields, conflict, conflict_retries)
+        self._update_version(self.requester.decode(response))
+        self._mark_clean(fields)
+        return self
+
+    def save(self, conflict=None, conflict_retries=DEFAULT_CONFLICT_RETRIES, **args):
+        """
+        Patch the attributes of the current :class:`InstanceResource` assigned since it has been parsed, along
+        with its ``version``; nothing is sent if none has changed
+
+        Only assignments are tracked: an attribute modified in place must be assigned again, or sent with
+        :py:meth:`patch`.
+
+        :param conflict: the conflict policy, see :py:meth:`update`
+        :param conflict_retries: maximum number of times the request is sent again
         """
+        if self._save_payload(**args) is None:
+            return self
+
+        def send():
+            self_dict = self._save_payload(**args)
+            return self.requester.patch("/{endpoint}/{id}", endpoint=self.endpoint, id=self.id, payload=self_dict)
+
+        response = self._send_resolving_conflicts(send, self.dirty_fields, conflict, conflict_retries)
+        self._update_version(self.requester.decode(response))
+        self._mark_clean()
+        return self
+
+    def _send_resolving_conflicts(self, send, fields, conflict, retries):
+        """
+        Call ``send`` until it is not rejected for a version conflict, merging the latest state in between
+        """
+        _check_conflict_policy(conflict)
+        attempt = 0
+        while True:
+            try:
+                return send()
+            except exceptions.TaigaRestException as exc:
+                if conflict is None or attempt >= retries or not exc.is_version_conflict():
+                    raise
+            attempt += 1
+            response = self.requester.get("/{endpoint}/{id}", endpoint=self.endpoint, id=self.id)
+            self.merge_latest(self.requester.decode(response), fields, conflict)
+
+    def merge_latest(self, latest, fields, conflict=CONFLICT_FAIL):
+        """
+        Three-way merge of the latest state of the object into the current instance
+
+        The ``fields`` changed locally keep their value, unless they have been changed remotely too; the
+        ``conflict`` policy then decides:
+
+        * :data:`CONFLICT_FAIL` raises :class:`taiga.exceptions.TaigaConflictException`
+        * :data:`CONFLICT_LAST_WRITER_WINS` keeps the local value
+        * a callable ``conflict(field, base, mine, theirs)`` returns the value to keep, ``base`` being the value
+          before the local change (`None` if unknown)
+
+        The ``fields`` not assigned since the object has been parsed or last sent may have been edited in place:
+        their base is unknown, and they go through the ``conflict`` policy when their latest value differs.
+        All the other attributes, ``version`` included, take their latest value.
+
+        :param latest: the JSON object of the latest state
+        :param fields: names of the attributes sent
+        :param conflict: the conflict policy
+        """
+        _check_conflict_policy(conflict)
+        dirty = getattr(self, "_dirty", None) or {}
+        fresh = self.parse(self.requester, dict(latest))
+        fresh_attributes = _attributes(fresh)
+        current = self._attributes()
+        values = {}
+        conflicts = []
+        for key, theirs in fresh_attributes.items():
+            if key == "requester" or key.startswith("_"):
+                continue
+            mine = current.get(key, _MISSING)
+            if key not in fields or key == "version" or mine is _MISSING:
+                values[key] = theirs
+                continue
+            # the base of the fields not assigned is unknown, they may have been edited in place
+            base = dirty.get(key, _MISSING)
+            if mine == base:
+                values[key] = theirs
+                continue
+            if theirs == mine or theirs == base:
+                continue
+            if conflict == CONFLICT_FAIL:
+                conflicts.append(key)
+            elif callable(conflict):
+                values[key] = conflict(key, None if base is _MISSING else base, mine, theirs)
+        if conflicts:
+            raise exceptions.TaigaConflictException(
+                self.requester.get_full_url("/{endpoint}/{id}", endpoint=self.endpoint, id=self.id), conflicts
+            )
+        self._store(values)
+        nested = getattr(fresh, "_nested", None)
+        if nested:
+            for key in nested:
+                try:
+                    object.__delattr__(self, key)
+                except AttributeError:
+                    pass
+            object.__setattr__(self, "_nested", nested)
+        # the latest state is the base of the next merge
+        rebased = {key: fresh_attributes.get(key, _MISSING) for key in dirty}
+        if rebased:
+            object.__setattr__(self, "_dirty", rebased)
+        _drop_indexes(self)
+        return self
+
+    def _save_payload(self, **args):
+        """
+        Payload of :py:meth:`save`, `None` when there is nothing to send
+        """
+        if not self.dirty_fields and not args:
+            return None
+        self_dict = self._patch_payload(self.dirty_fields, **args)
+        if "version" not in self_dict and "version" in self._attributes():
+            self_dict["version"] = self.version
+        return self_dict
+
+    def _update_payload(self, **args):
+        self_dict = self.to_dict()
+        if args:
+            self_dict = dict(list(self_dict.items()) + list(args.items()))
+        return self_dict
+
+    def _patch_payload(self, fields, **args):
         self_dict = {key: value for (key, value) in self.to_dict().items() if key in fields}
         if args:
             self_dict = dict(list(self_dict.items()) + list(args.items()))
-        response = self.requester.patch("/{endpoint}/{id}", endpoint=self.endpoint, id=self.id, payload=self_dict)
-        obj_json = response.json()
+        return self_dict
+
+    def _update_version(self, obj_json):
         if "version" in obj_json:
-            self.__dict__["version"] = obj_json["version"]
-        return self
+            self._store({"version": obj_json["version"]})
 
     def delete(self, query=None):
         """
@@ -184,8 +1274,13 @@ class InstanceResource(Resource):
         Get a dictionary representation of :class:`InstanceResource`
         """
         self_dict = {}
-        for key, value in self.__dict__.items():
+        for key in getattr(self, "_nested", None) or ():
+            if key in self.allowed_params:
+                getattr(self, key)
+        for key, value in self._attributes().items():
             if self.allowed_params and key in self.allowed_params:
+                if isinstance(value, datetime.date):
+                    value = value.isoformat()
                 self_dict[key] = value
         return self_dict
 
@@ -193,13 +1288,27 @@ class InstanceResource(Resource):
     def parse(cls, requester, entry):
         """
         Turns a JSON object into a model instance.
+
+        The nested objects of the ``parser`` keys are kept as JSON and parsed on first access.
         """
         if not isinstance(entry, dict):
             return entry
-        for key_to_parse, cls_to_parse in cls.parser.items():
-            if key_to_parse in entry:
-                entry[key_to_parse] = cls_to_parse.parse(requester, entry[key_to_parse])
-        return cls(requester, **entry)
+        nested = {key: entry.pop(key) for key in cls.parser if key in entry}
+        obj = cls(requester, **entry)
+        if nested:
+            object.__setattr__(obj, "_nested", nested)
+        return obj
+
+    def __getattr__(self, name):
+        # only called for missing attributes: parse the pending nested objects
+        nested = None if name in _INTERNAL_ATTRIBUTES else getattr(self, "_nested", None)
+        if not nested or name not in nested:
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+        value = self.parser[name].parse(self.requester, nested[name])
+        self._store({name: value})
+        # copy on write, the copies of the instance may share the dict
+        object.__setattr__(self, "_nested", {key: raw for key, raw in nested.items() if key != name})
+        return value
 
     def __repr__(self):
         try:
@@ -216,3 +1325,73 @@ class InstanceResource(Resource):
             return "{}".format(attr)
         else:
             return repr(self)
+
+
+def _check_conflict_policy(conflict):
+    if conflict not in (None, CONFLICT_FAIL, CONFLICT_LAST_WRITER_WINS) and not callable(conflict):
+        raise ValueError("Unknown conflict policy: {!r}".format(conflict))
+
+
+#: slotted model classes, by model and keys
+_COMPACT_CLASSES = {}
+
+
+class CompactAttributes(Mapping):
+    """
+    Read-only mapping of the attributes of a compact instance, slots and instance dict
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __getitem__(self, key):
+        obj = self._obj
+        if key in obj._slot_names:
+            try:
+                return getattr(obj, key)
+            except AttributeError:
+                raise KeyError(key)
+        # reading the instance dict creates it, only do so when something has been stored there
+        if not getattr(obj, "_uses_dict", False):
+            raise KeyError(key)
+        return obj.__dict__[key]
+
+    def __iter__(self):
+        obj = self._obj
+        for key in obj.__slots__:
+            if hasattr(obj, key):
+                yield key
+        if getattr(obj, "_uses_dict", False):
+            yield from obj.__dict__
+
+    def __len__(self):
+        return sum(1 for _key in self)
+
+
+class CompactInstanceMixin:
+    """
+    Storage of the instances created by :py:meth:`InstanceResource.compact_class`
+    """
+
+    __slots__ = ("_uses_dict",)
+
+    _slot_names = frozenset()
+
+    def _store(self, attributes):
+        slot_names = self._slot_names
+        for key, value in attributes.items():
+            if key in slot_names:
+                object.__setattr__(self, key, value)
+            else:
+                object.__setattr__(self, "_uses_dict", True)
+                self.__dict__[key] = value
+
+    def __setattr__(self, name, value):
+        if name not in self._slot_names:
+            object.__setattr__(self, "_uses_dict", True)
+        super().__setattr__(name, value)
+
+    def _attributes(self):
+        return CompactAttributes(self)
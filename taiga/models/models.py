@@ -1,9 +1,12 @@
 import datetime
+import inspect
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase
 
 from .. import exceptions
-from .base import InstanceResource, ListResource
+from ..requestmaker import RequestCacheException
+from .base import DEFAULT_MAX_WORKERS, BatchResult, InstanceResource, ListResource
 
 
 class MoveOnDestroyMixinList:
@@ -12,7 +15,7 @@ class MoveOnDestroyMixinList:
     """
 
     def delete(self, resource_id, move_to_id):
-        return super().delete(resource_id=resource_id, query={"moveTo": move_to_id})
+        return self._delete_resource(resource_id, query={"moveTo": move_to_id})
 
 
 class MoveOnDestroyMixinObject:
@@ -43,34 +46,64 @@ class CustomAttributeResource(InstanceResource):
     CustomAttributeResource base class
     """
 
-    def set_attribute(self, id, value, version=1):  # noqa: A002
+    def set_attribute(self, id, value, version=None):  # noqa: A002
         """
         Set attribute to a specific value
 
         :param id: id of the attribute
         :param value: value of the attribute
-        :param version: version of the attribute (default = 1)
+        :param version: version of the attributes, the cached one if not provided
+        """
+        return self.set_attributes({id: value}, version)
+
+    def set_attributes(self, values, version=None):
+        """
+        Set many attributes with a single request
+
+        The other attributes and the version are taken from the values last fetched or set, which are only
+        requested when they are not in the cache; the cache is then updated with the new values.
+
+        :param values: values of the attributes, by attribute id
+        :param version: version of the attributes, the cached one if not provided
         """
         attributes = self._get_attributes(cache=True)
-        formatted_id = "{}".format(id)
-        attributes["attributes_values"][formatted_id] = value
-        response = self.requester.patch(
-            "/{endpoint}/custom-attributes-values/{id}",
-            endpoint=self.endpoint,
-            id=self.id,
-            payload={"attributes_values": attributes["attributes_values"], "version": version},
-        )
-        cache_key = self.requester.get_full_url(
-            "/{endpoint}/custom-attributes-values/{id}", endpoint=self.endpoint, id=self.id
+        attributes_values = attributes["attributes_values"]
+        attributes_values.update(("{}".format(key), value) for key, value in values.items())
+        try:
+            response = self.requester.patch(
+                "/{endpoint}/custom-attributes-values/{id}",
+                endpoint=self.endpoint,
+                id=self.id,
+                payload={
+                    "attributes_values": attributes_values,
+                    "version": version if version is not None else attributes["version"],
+                },
+            )
+        except exceptions.TaigaRestException:
+            # the cached values may be stale, e.g. on a version conflict: fetch them again next time
+            self.requester.cache.remove(self._attributes_cache_key())
+            raise
+        self._cache_attributes(response)
+        return self.requester.decode(response)
+
+    def _attributes_cache_key(self):
+        return self.requester.cache_key(
+            self.requester.get_full_url(
+                "/{endpoint}/custom-attributes-values/{id}", endpoint=self.endpoint, id=self.id
+            )
         )
-        self.requester.cache.put(cache_key, response)
-        return response.json()
+
+    def _cache_attributes(self, response):
+        self.requester.cache.put_response(self._attributes_cache_key(), response, json_codec=self.requester.json_codec)
 
     def _get_attributes(self, cache=False):
         response = self.requester.get(
             "/{endpoint}/custom-attributes-values/{id}", endpoint=self.endpoint, id=self.id, cache=cache
         )
-        return response.json()
+        if not cache:
+            # the values just fetched are the base of the next set_attributes
+            self._cache_attributes(response)
+        return self.requester.decode(response)
 
     def get_attributes(self):
         """
@@ -79,6 +112,54 @@ class CustomAttributeResource(InstanceResource):
         return self._get_attributes()
 
 
+class CustomAttributeMixinList:
+    """
+    Mixin that defines the batch methods on the custom attributes of many objects
+    """
+
+    def get_attributes_many(self, ids, cache=False, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Get concurrently the attributes of many objects
+
+        :param ids: ids of the objects
+        :param cache: use the local cache
+        :param max_workers: maximum number of concurrent requests
+        :return: :class:`BatchResult` of the attributes, by object id
+        """
+        return self._run_many(dict.fromkeys(ids), lambda obj, _: obj._get_attributes(cache=cache), max_workers)
+
+    def set_attributes_many(self, values, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Set concurrently the attributes of many objects, with a single request per object whose attributes
+        are already in the cache
+
+        :param values: values of the attributes by attribute id, by object id
+        :param max_workers: maximum number of concurrent requests
+        :return: :class:`BatchResult` of the updated attributes, by object id
+        """
+        return self._run_many(values, lambda obj, obj_values: obj.set_attributes(obj_values), max_workers)
+
+    def _run_many(self, arguments, function, max_workers):
+        result = BatchResult()
+        if not arguments:
+            return result
+
+        def run(item):
+            obj_id, argument = item
+            try:
+                return obj_id, function(self.instance(self.requester, id=obj_id), argument), None
+            except exceptions.TaigaException as exc:
+                return obj_id, None, exc
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(arguments)))) as executor:
+            for obj_id, value, error in executor.map(run, arguments.items()):
+                if error is None:
+                    result.results[obj_id] = value
+                else:
+                    result.errors[obj_id] = error
+        return result
+
+
 class CustomAttribute(InstanceResource):
     """
     CustomAttribute base class
@@ -92,6 +173,8 @@ class CustomAttribute(InstanceResource):
 
     repr_attribute = "name"
 
+    cache_time = 300
+
     allowed_params = ["name", "description", "order", "project"]
 
 
@@ -126,7 +209,7 @@ class User(InstanceResource):
         Get a list of starred :class:`Project`.
         """
         response = self.requester.get("/{endpoint}/{id}/starred", endpoint=self.endpoint, id=self.id)
-        return Projects.parse(self.requester, response.json())
+        return Projects.parse(self.requester, self.requester.decode(response))
 
 
 class Users(ListResource):
@@ -185,6 +268,8 @@ class Priority(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "priorities"
 
+    cache_time = 300
+
     allowed_params = ["name", "color", "order", "project"]
 
     repr_attribute = "name"
@@ -230,14 +315,19 @@ class Attachments(ListResource):
     Attachments factory base class
     """
 
-    def create(self, project, object_id, attached_file, **attrs):
+    def create(self, project, object_id, attached_file, stream=False, progress=None, chunk_size=None, **attrs):
         """
         Create a new :class:`Attachment`.
 
+        With ``stream`` (implied by ``progress``) the file is sent a chunk at a time instead of being loaded in
+        memory, see :class:`taiga.requestmaker.MultipartStream`. A file opened from a path is closed once sent.
+
         :param project: :class:`Project` id
         :param object_id: id of the current object
-        :param ref: :class:`Task` reference
-        :param attached_file: file path that you want to upload
+        :param attached_file: file path or file object that you want to upload
+        :param stream: stream the file
+        :param progress: callable called with the number of bytes sent and the total (`None` if unknown)
+        :param chunk_size: number of bytes of the file read at a time when streaming
         :param attrs: optional attributes for the :class:`Attachment`
         """
         attrs.update({"project": project, "object_id": object_id})
@@ -251,8 +341,33 @@ class Attachments(ListResource):
                 raise exceptions.TaigaException("Attachment must be a IOBase or a path to an existing file")
         else:
             raise exceptions.TaigaException("Attachment must be a IOBase or a path to an existing file")
-
-        return self._new_resource(files={"attached_file": attachment}, payload=attrs)
+        opened = attachment is not attached_file
+
+        try:
+            if stream or progress is not None:
+                result = self._upload_resource(
+                    fields=attrs, files={"attached_file": attachment}, progress=progress, chunk_size=chunk_size
+                )
+            else:
+                result = self._new_resource(files={"attached_file": attachment}, payload=attrs)
+        except BaseException:
+            if opened:
+                attachment.close()
+            raise
+        if not opened:
+            return result
+        if inspect.isawaitable(result):
+            # asynchronous factory, the file is sent when the coroutine is awaited
+            return _closing(result, attachment)
+        attachment.close()
+        return result
+
+
+async def _closing(awaitable, fileobj):
+    try:
+        return await awaitable
+    finally:
+        fileobj.close()
 
 
 class UserStoryAttachment(Attachment):
@@ -306,6 +421,8 @@ class Epic(CustomAttributeResource, CommentableResource):
 
     endpoint = "epics"
 
+    cache_time = 10
+
     repr_attribute = "subject"
 
     allowed_params = [
@@ -328,11 +445,17 @@ class Epic(CustomAttributeResource, CommentableResource):
         """
         return UserStories(self.requester).list(epic=self.id, **queryparams)
 
-    def list_attachments(self):
+    def iter_user_stories(self, **queryparams):
+        """
+        Iterates over the :class:`UserStory` of the epic, one page at a time.
+        """
+        return UserStories(self.requester).iter(epic=self.id, **queryparams)
+
+    def list_attachments(self, **queryparams):
         """
         Get a list of :class:`EpicAttachment`.
         """
-        return EpicAttachments(self.requester).list(object_id=self.id)
+        return EpicAttachments(self.requester).list(object_id=self.id, **queryparams)
 
     def attach(self, attached_file, **attrs):
         """
@@ -344,7 +467,7 @@ class Epic(CustomAttributeResource, CommentableResource):
         return EpicAttachments(self.requester).create(self.project, self.id, attached_file, **attrs)
 
 
-class Epics(ListResource):
+class Epics(CustomAttributeMixinList, ListResource):
     """
     Epics factory class
     """
@@ -379,6 +502,8 @@ class EpicStatus(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "epic-statuses"
 
+    cache_time = 300
+
     allowed_params = ["color", "is_closed", "name", "order", "project", "slug`"]
 
 
@@ -426,6 +551,8 @@ class UserStory(CustomAttributeResource, CommentableResource):
 
     endpoint = "userstories"
 
+    cache_time = 10
+
     repr_attribute = "subject"
     element_type = "User Story"
     element_shortcut = "us"
@@ -465,17 +592,40 @@ class UserStory(CustomAttributeResource, CommentableResource):
         """
         return Tasks(self.requester).create(self.project, subject, status, user_story=self.id, **attrs)
 
-    def list_tasks(self):
+    def add_tasks(self, subjects, status=None, chunk_size=None):
+        """
+        Add many :class:`Task` to the current :class:`UserStory` and return them.
+
+        :param subjects: subjects of the :class:`Task`
+        :param status: status of the :class:`Task`, the project default if not provided
+        :param chunk_size: maximum number of :class:`Task` created by a request
+        """
+        return Tasks(self.requester).bulk_create(
+            self.project,
+            subjects,
+            status=status,
+            user_story=self.id,
+            milestone=getattr(self, "milestone", None),
+            chunk_size=chunk_size,
+        )
+
+    def list_tasks(self, **queryparams):
         """
         Get a list of :class:`Task` in the current :class:`UserStory`.
         """
-        return Tasks(self.requester).list(user_story=self.id)
+        return Tasks(self.requester).list(user_story=self.id, **queryparams)
+
+    def iter_tasks(self, **queryparams):
+        """
+        Iterates over the :class:`Task` in the current :class:`UserStory`, one page at a time.
+        """
+        return Tasks(self.requester).iter(user_story=self.id, **queryparams)
 
-    def list_attachments(self):
+    def list_attachments(self, **queryparams):
         """
         Get a list of :class:`UserStoryAttachment`.
         """
-        return UserStoryAttachments(self.requester).list(object_id=self.id)
+        return UserStoryAttachments(self.requester).list(object_id=self.id, **queryparams)
 
     def attach(self, attached_file, **attrs):
         """
@@ -487,7 +637,7 @@ class UserStory(CustomAttributeResource, CommentableResource):
         return UserStoryAttachments(self.requester).create(self.project, self.id, attached_file, **attrs)
 
 
-class UserStories(ListResource):
+class UserStories(CustomAttributeMixinList, ListResource):
     """
     UserStories factory class
     """
@@ -505,12 +655,100 @@ class UserStories(ListResource):
         attrs.update({"project": project, "subject": subject})
         return self._new_resource(payload=attrs)
 
+    def bulk_create(self, project, subjects, status=None, swimlane=None, chunk_size=None):
+        """
+        Create many :class:`UserStory` with a request per ``chunk_size`` subjects, and return them.
+
+        :param project: :class:`Project` id
+        :param subjects: subjects of the :class:`UserStory`
+        :param status: status of the :class:`UserStory`, the project default if not provided
+        :param swimlane: swimlane of the :class:`UserStory`
+        :param chunk_size: maximum number of :class:`UserStory` created by a request
+        """
+        return self._bulk_create(
+            "bulk_stories", subjects, chunk_size, project_id=project, status_id=status, swimlane_id=swimlane
+        )
+
+    def bulk_update_backlog_order(self, project, user_stories, milestone=None, before=None, after=None):
+        """
+        Move many :class:`UserStory` in the backlog with a single request.
+
+        :param project: :class:`Project` id
+        :param user_stories: :class:`UserStory` ids, in their new order
+        :param milestone: :class:`Milestone` id of the moved :class:`UserStory`, the backlog if not provided
+        :param before: :class:`UserStory` id the moved ones are placed before
+        :param after: :class:`UserStory` id the moved ones are placed after
+        """
+        return self._bulk_update(
+            "bulk_update_backlog_order",
+            project_id=project,
+            milestone_id=milestone,
+            before_userstory_id=before,
+            after_userstory_id=after,
+            bulk_userstories=list(user_stories),
+        )
+
+    def bulk_update_kanban_order(self, project, status, user_stories, swimlane=None, before=None, after=None):
+        """
+        Move many :class:`UserStory` in a column of the kanban with a single request.
+
+        :param project: :class:`Project` id
+        :param status: :class:`UserStoryStatus` id of the column
+        :param user_stories: :class:`UserStory` ids, in their new order
+        :param swimlane: :class:`SwimLane` id of the column
+        :param before: :class:`UserStory` id the moved ones are placed before
+        :param after: :class:`UserStory` id the moved ones are placed after
+        """
+        return self._bulk_update(
+            "bulk_update_kanban_order",
+            project_id=project,
+            status_id=status,
+            swimlane_id=swimlane,
+            before_userstory_id=before,
+            after_userstory_id=after,
+            bulk_userstories=list(user_stories),
+        )
+
+    def bulk_update_sprint_order(self, project, milestone, user_stories, before=None, after=None):
+        """
+        Move many :class:`UserStory` inside a :class:`Milestone` with a single request.
+
+        :param project: :class:`Project` id
+        :param milestone: :class:`Milestone` id
+        :param user_stories: :class:`UserStory` ids, in their new order
+        :param before: :class:`UserStory` id the moved ones are placed before
+        :param after: :class:`UserStory` id the moved ones are placed after
+        """
+        return self._bulk_update(
+            "bulk_update_sprint_order",
+            project_id=project,
+            milestone_id=milestone,
+            before_userstory_id=before,
+            after_userstory_id=after,
+            bulk_userstories=list(user_stories),
+        )
+
+    def bulk_update_milestone(self, project, milestone, user_stories):
+        """
+        Move many :class:`UserStory` to a :class:`Milestone` with a single request.
+
+        :param project: :class:`Project` id
+        :param milestone: :class:`Milestone` id
+        :param user_stories: :class:`UserStory` ids, in their new order
+        """
+        return self._bulk_update(
+            "bulk_update_milestone",
+            project_id=project,
+            milestone_id=milestone,
+            bulk_stories=[{"us_id": us_id, "order": order} for order, us_id in enumerate(user_stories)],
+        )
+
     def import_(self, project, subject, status, **attrs):
         attrs.update({"project": project, "subject": subject, "status": status})
         response = self.requester.post(
             "/{endpoint}/{id}/{type}", endpoint="importer", id=project, type="us", payload=attrs
         )
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
 
 class UserStoryStatus(MoveOnDestroyMixinObject, InstanceResource):
@@ -529,6 +767,8 @@ class UserStoryStatus(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "userstory-statuses"
 
+    cache_time = 300
+
     allowed_params = ["color", "is_closed", "name", "order", "project", "wip_limit"]
 
 
@@ -561,6 +801,8 @@ class SwimLane(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "swimlanes"
 
+    cache_time = 300
+
     allowed_params = ["name", "order", "project", "statuses"]
 
     parser = {
@@ -596,6 +838,8 @@ class Point(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "points"
 
+    cache_time = 300
+
     repr_attribute = "subject"
 
     allowed_params = ["color", "value", "name", "order", "project"]
@@ -654,7 +898,35 @@ class Milestone(InstanceResource):
         Get the stats for the current :class:`Milestone`
         """
         response = self.requester.get("/{endpoint}/{id}/stats", endpoint=self.endpoint, id=self.id)
-        return response.json()
+        return self.requester.decode(response)
+
+    def move_user_stories(self, user_stories):
+        """
+        Move many :class:`UserStory` to the current :class:`Milestone` with a single request.
+
+        :param user_stories: :class:`UserStory` ids, in their new order
+        """
+        return UserStories(self.requester).bulk_update_milestone(self.project, self.id, user_stories)
+
+    def order_user_stories(self, user_stories, before=None, after=None):
+        """
+        Reorder many :class:`UserStory` of the current :class:`Milestone` with a single request.
+
+        :param user_stories: :class:`UserStory` ids, in their new order
+        :param before: :class:`UserStory` id the moved ones are placed before
+        :param after: :class:`UserStory` id the moved ones are placed after
+        """
+        return UserStories(self.requester).bulk_update_sprint_order(
+            self.project, self.id, user_stories, before=before, after=after
+        )
+
+    def move_tasks(self, tasks):
+        """
+        Move many :class:`Task` to the current :class:`Milestone` with a single request.
+
+        :param tasks: :class:`Task` ids, in their new order
+        """
+        return Tasks(self.requester).bulk_update_milestone(self.project, self.id, tasks)
 
 
 class Milestones(ListResource):
@@ -674,9 +946,9 @@ class Milestones(ListResource):
         :param estimated_finish: est. finish time of :class:`Milestone`
         :param attrs: optional attributes of :class:`Milestone`
         """
-        if isinstance(estimated_start, datetime.datetime):
+        if isinstance(estimated_start, datetime.date):
             estimated_start = estimated_start.strftime("%Y-%m-%d")
-        if isinstance(estimated_finish, datetime.datetime):
+        if isinstance(estimated_finish, datetime.date):
             estimated_finish = estimated_finish.strftime("%Y-%m-%d")
         attrs.update(
             {
@@ -689,9 +961,9 @@ class Milestones(ListResource):
         return self._new_resource(payload=attrs)
 
     def import_(self, project, name, estimated_start, estimated_finish, **attrs):
-        if isinstance(estimated_start, datetime.datetime):
+        if isinstance(estimated_start, datetime.date):
             estimated_start = estimated_start.strftime("%Y-%m-%d")
-        if isinstance(estimated_finish, datetime.datetime):
+        if isinstance(estimated_finish, datetime.date):
             estimated_finish = estimated_finish.strftime("%Y-%m-%d")
         attrs.update(
             {
@@ -704,7 +976,7 @@ class Milestones(ListResource):
         response = self.requester.post(
             "/{endpoint}/{id}/{type}", endpoint="importer", id=project, type="milestone", payload=attrs
         )
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
 
 class TaskStatus(MoveOnDestroyMixinObject, InstanceResource):
@@ -720,6 +992,8 @@ class TaskStatus(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "task-statuses"
 
+    cache_time = 300
+
     allowed_params = ["name", "color", "order", "project", "is_closed"]
 
 
@@ -779,6 +1053,8 @@ class Task(CustomAttributeResource, CommentableResource):
 
     endpoint = "tasks"
 
+    cache_time = 10
+
     repr_attribute = "subject"
     element_type = "Task"
     element_shortcut = "task"
@@ -803,11 +1079,11 @@ class Task(CustomAttributeResource, CommentableResource):
         "watchers",
     ]
 
-    def list_attachments(self):
+    def list_attachments(self, **queryparams):
         """
         Get a list of :class:`TaskAttachment`.
         """
-        return TaskAttachments(self.requester).list(object_id=self.id)
+        return TaskAttachments(self.requester).list(object_id=self.id, **queryparams)
 
     def attach(self, attached_file, **attrs):
         """
@@ -819,7 +1095,7 @@ class Task(CustomAttributeResource, CommentableResource):
         return TaskAttachments(self.requester).create(self.project, self.id, attached_file, **attrs)
 
 
-class Tasks(ListResource):
+class Tasks(CustomAttributeMixinList, ListResource):
     """
     Tasks factory
     """
@@ -838,12 +1114,76 @@ class Tasks(ListResource):
         attrs.update({"project": project, "subject": subject, "status": status})
         return self._new_resource(payload=attrs)
 
+    def bulk_create(self, project, subjects, status=None, user_story=None, milestone=None, chunk_size=None):
+        """
+        Create many :class:`Task` with a request per ``chunk_size`` subjects, and return them.
+
+        :param project: :class:`Project` id
+        :param subjects: subjects of the :class:`Task`
+        :param status: status of the :class:`Task`, the project default if not provided
+        :param user_story: :class:`UserStory` id of the :class:`Task`
+        :param milestone: :class:`Milestone` id of the :class:`Task`
+        :param chunk_size: maximum number of :class:`Task` created by a request
+        """
+        return self._bulk_create(
+            "bulk_tasks",
+            subjects,
+            chunk_size,
+            project_id=project,
+            status_id=status,
+            us_id=user_story,
+            milestone_id=milestone,
+        )
+
+    def bulk_update_taskboard_order(self, project, tasks, milestone=None):
+        """
+        Reorder many :class:`Task` in the taskboard with a single request.
+
+        :param project: :class:`Project` id
+        :param tasks: :class:`Task` ids, in their new order
+        :param milestone: :class:`Milestone` id of the taskboard
+        """
+        return self._bulk_update(
+            "bulk_update_taskboard_order",
+            project_id=project,
+            milestone_id=milestone,
+            bulk_tasks=[{"task_id": task_id, "order": order} for order, task_id in enumerate(tasks)],
+        )
+
+    def bulk_update_us_order(self, project, tasks):
+        """
+        Reorder many :class:`Task` inside their :class:`UserStory` with a single request.
+
+        :param project: :class:`Project` id
+        :param tasks: :class:`Task` ids, in their new order
+        """
+        return self._bulk_update(
+            "bulk_update_us_order",
+            project_id=project,
+            bulk_tasks=[{"task_id": task_id, "order": order} for order, task_id in enumerate(tasks)],
+        )
+
+    def bulk_update_milestone(self, project, milestone, tasks):
+        """
+        Move many :class:`Task` to a :class:`Milestone` with a single request.
+
+        :param project: :class:`Project` id
+        :param milestone: :class:`Milestone` id
+        :param tasks: :class:`Task` ids, in their new order
+        """
+        return self._bulk_update(
+            "bulk_update_milestone",
+            project_id=project,
+            milestone_id=milestone,
+            bulk_tasks=[{"task_id": task_id, "order": order} for order, task_id in enumerate(tasks)],
+        )
+
     def import_(self, project, subject, status, **attrs):
         attrs.update({"project": project, "subject": subject, "status": status})
         response = self.requester.post(
             "/{endpoint}/{id}/{type}", endpoint="importer", id=project, type="task", payload=attrs
         )
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
 
 class IssueType(MoveOnDestroyMixinObject, InstanceResource):
@@ -858,6 +1198,8 @@ class IssueType(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "issue-types"
 
+    cache_time = 300
+
     allowed_params = ["name", "color", "order", "project"]
 
 
@@ -886,6 +1228,8 @@ class IssueStatus(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "issue-statuses"
 
+    cache_time = 300
+
     allowed_params = ["name", "color", "order", "project", "is_closed"]
 
 
@@ -938,6 +1282,8 @@ class Issue(CustomAttributeResource, CommentableResource):
 
     endpoint = "issues"
 
+    cache_time = 10
+
     repr_attribute = "subject"
     element_type = "Issue"
     element_shortcut = "issue"
@@ -960,11 +1306,11 @@ class Issue(CustomAttributeResource, CommentableResource):
         "watchers",
     ]
 
-    def list_attachments(self):
+    def list_attachments(self, **queryparams):
         """
         Get a list of :class:`IssueAttachment`.
         """
-        return IssueAttachments(self.requester).list(object_id=self.id)
+        return IssueAttachments(self.requester).list(object_id=self.id, **queryparams)
 
     def upvote(self):
         """
@@ -990,7 +1336,7 @@ class Issue(CustomAttributeResource, CommentableResource):
         return IssueAttachments(self.requester).create(self.project, self.id, attached_file, **attrs)
 
 
-class Issues(ListResource):
+class Issues(CustomAttributeMixinList, ListResource):
     instance = Issue
 
     def create(self, project, subject, priority, status, issue_type, severity, **attrs):
@@ -1017,6 +1363,19 @@ class Issues(ListResource):
         )
         return self._new_resource(payload=attrs)
 
+    def bulk_create(self, project, subjects, milestone=None, chunk_size=None):
+        """
+        Create many :class:`Issue` with a request per ``chunk_size`` subjects, and return them.
+
+        The issues get the default priority, status, type and severity of the project.
+
+        :param project: :class:`Project` id
+        :param subjects: subjects of the :class:`Issue`
+        :param milestone: :class:`Milestone` id of the :class:`Issue`
+        :param chunk_size: maximum number of :class:`Issue` created by a request
+        """
+        return self._bulk_create("bulk_issues", subjects, chunk_size, project_id=project, milestone_id=milestone)
+
     def import_(self, project, subject, priority, status, issue_type, severity, **attrs):
         attrs.update(
             {
@@ -1031,7 +1390,7 @@ class Issues(ListResource):
         response = self.requester.post(
             "/{endpoint}/{id}/{type}", endpoint="importer", id=project, type="issue", payload=attrs
         )
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
 
 class IssueAttribute(CustomAttribute):
@@ -1110,6 +1469,8 @@ class Severity(MoveOnDestroyMixinObject, InstanceResource):
 
     endpoint = "severities"
 
+    cache_time = 300
+
     allowed_params = ["name", "color", "order", "project"]
 
 
@@ -1146,6 +1507,8 @@ class Role(InstanceResource):
 
     endpoint = "roles"
 
+    cache_time = 300
+
     allowed_params = ["name", "slug", "order", "computable"]
 
 
@@ -1219,11 +1582,22 @@ class Project(InstanceResource):
         "swimlanes": SwimLanes,
     }
 
+    #: factories of the objects designated by a ref, by resolver key
+    ref_factories = {
+        "task": Tasks,
+        "us": UserStories,
+        "issue": Issues,
+        "epic": Epics,
+    }
+
+    #: number of seconds the object designated by a ref is kept in the cache
+    ref_cache_time = 3600
+
     def get_item_by_ref(self, ref):
         response = self.requester.get(
             "/resolver?project={project_id}&ref={task_ref}", task_ref=ref, project_id=self.slug
         )
-        response_json = response.json()
+        response_json = self.requester.decode(response)
 
         if response_json and "task" in response_json:
             return self.get_task_by_ref(ref)
@@ -1231,9 +1605,50 @@ class Project(InstanceResource):
             return self.get_userstory_by_ref(ref)
         elif response_json and "issue" in response_json:
             return self.get_issue_by_ref(ref)
+        elif response_json and "epic" in response_json:
+            return self.get_epic_by_ref(ref)
         else:
             return None
 
+    def resolve_refs(self, refs, cache=True, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Get the objects of many refs, returns a mapping of the refs to their :class:`Task`, :class:`UserStory`,
+        :class:`Issue` or :class:`Epic`, `None` for the unknown ones.
+
+        The refs are resolved concurrently, once each; what a ref designates is kept for
+        :py:attr:`ref_cache_time` seconds, and with ``cache`` the objects already cached are not fetched again.
+
+        :param refs: refs of the project, as numbers or ``#123`` strings
+        :param cache: use the local cache to get the objects
+        :param max_workers: maximum number of concurrent requests
+        """
+        refs = sorted({int(str(ref).lstrip("#")) for ref in refs})
+        if not refs:
+            return {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(refs)))) as executor:
+            return dict(zip(refs, executor.map(lambda ref: self._resolve_ref(ref, cache), refs)))
+
+    def _resolve_ref(self, ref, cache):
+        cache_key = "ref:{}:{}".format(self.id, ref)
+        try:
+            ref_type, ref_id = self.requester.object_cache.get(cache_key)
+        except RequestCacheException:
+            try:
+                response = self.requester.get("/resolver", query={"project": self.slug, "ref": ref})
+            except exceptions.TaigaRestException as exc:
+                if exc.status_code == 404:
+                    return None
+                raise
+            response_json = self.requester.decode(response) or {}
+            for ref_type in self.ref_factories:
+                if ref_type in response_json:
+                    ref_id = response_json[ref_type]
+                    break
+            else:
+                return None
+            self.requester.object_cache.put(cache_key, (ref_type, ref_id), self.ref_cache_time)
+        return self.ref_factories[ref_type](self.requester).get(ref_id, cache=cache)
+
     def get_task_by_ref(self, ref):
         """
         Get a :class:`Task` by ref.
@@ -1246,7 +1661,7 @@ class Project(InstanceResource):
             task_ref=ref,
             project_id=self.id,
         )
-        return Task.parse(self.requester, response.json())
+        return Task.parse(self.requester, self.requester.decode(response))
 
     def get_epic_by_ref(self, ref):
         """
@@ -1260,7 +1675,7 @@ class Project(InstanceResource):
             ep_ref=ref,
             project_id=self.id,
         )
-        return Epic.parse(self.requester, response.json())
+        return Epic.parse(self.requester, self.requester.decode(response))
 
     def get_userstory_by_ref(self, ref):
         """
@@ -1274,7 +1689,7 @@ class Project(InstanceResource):
             us_ref=ref,
             project_id=self.id,
         )
-        return UserStory.parse(self.requester, response.json())
+        return UserStory.parse(self.requester, self.requester.decode(response))
 
     def get_issue_by_ref(self, ref):
         """
@@ -1288,21 +1703,21 @@ class Project(InstanceResource):
             us_ref=ref,
             project_id=self.id,
         )
-        return Issue.parse(self.requester, response.json())
+        return Issue.parse(self.requester, self.requester.decode(response))
 
     def stats(self):
         """
         Get the stats of the project
         """
         response = self.requester.get("/{endpoint}/{id}/stats", endpoint=self.endpoint, id=self.id)
-        return response.json()
+        return self.requester.decode(response)
 
     def issues_stats(self):
         """
         Get stats for issues of the project
         """
         response = self.requester.get("/{endpoint}/{id}/issues_stats", endpoint=self.endpoint, id=self.id)
-        return response.json()
+        return self.requester.decode(response)
 
     def like(self):
         """
@@ -1354,11 +1769,11 @@ class Project(InstanceResource):
         """
         return Memberships(self.requester).create(self.id, email, role, **attrs)
 
-    def list_memberships(self):
+    def list_memberships(self, **queryparams):
         """
         Get the list of :class:`Membership` resources for the project.
         """
-        return Memberships(self.requester).list(project=self.id)
+        return Memberships(self.requester).list(project=self.id, **queryparams)
 
     def add_user_story(self, subject, **attrs):
         """
@@ -1369,6 +1784,19 @@ class Project(InstanceResource):
         """
         return UserStories(self.requester).create(self.id, subject, **attrs)
 
+    def add_user_stories(self, subjects, status=None, swimlane=None, chunk_size=None):
+        """
+        Adds many :class:`UserStory` and returns them.
+
+        :param subjects: subjects of the :class:`UserStory`
+        :param status: status of the :class:`UserStory`, the project default if not provided
+        :param swimlane: swimlane of the :class:`UserStory`
+        :param chunk_size: maximum number of :class:`UserStory` created by a request
+        """
+        return UserStories(self.requester).bulk_create(
+            self.id, subjects, status=status, swimlane=swimlane, chunk_size=chunk_size
+        )
+
     def import_user_story(self, subject, status, **attrs):
         """
         Import an user story and returns a :class:`UserStory` resource.
@@ -1385,6 +1813,12 @@ class Project(InstanceResource):
         """
         return UserStories(self.requester).list(project=self.id, **queryparams)
 
+    def iter_user_stories(self, **queryparams):
+        """
+        Iterates over the :class:`UserStory` of the project, one page at a time.
+        """
+        return UserStories(self.requester).iter(project=self.id, **queryparams)
+
     def add_swimlane(self, name, **attrs):
         """
         Adds a :class:`SwimLane` and returns a :class:`SwimLane` resource.
@@ -1413,6 +1847,16 @@ class Project(InstanceResource):
         """
         return Issues(self.requester).create(self.id, subject, priority, status, issue_type, severity, **attrs)
 
+    def add_issues(self, subjects, milestone=None, chunk_size=None):
+        """
+        Adds many :class:`Issue` with the project defaults and returns them.
+
+        :param subjects: subjects of the :class:`Issue`
+        :param milestone: :class:`Milestone` id of the :class:`Issue`
+        :param chunk_size: maximum number of :class:`Issue` created by a request
+        """
+        return Issues(self.requester).bulk_create(self.id, subjects, milestone=milestone, chunk_size=chunk_size)
+
     def import_issue(self, subject, priority, status, issue_type, severity, **attrs):
         """
         Import and issue and returns a :class:`Issue` resource.
@@ -1426,11 +1870,23 @@ class Project(InstanceResource):
         """
         return Issues(self.requester).import_(self.id, subject, priority, status, issue_type, severity, **attrs)
 
-    def list_issues(self):
+    def list_issues(self, **queryparams):
         """
         Returns the :class:`Issue` list of the project.
         """
-        return Issues(self.requester).list(project=self.id)
+        return Issues(self.requester).list(project=self.id, **queryparams)
+
+    def iter_issues(self, **queryparams):
+        """
+        Iterates over the :class:`Issue` of the project, one page at a time.
+        """
+        return Issues(self.requester).iter(project=self.id, **queryparams)
+
+    def iter_tasks(self, **queryparams):
+        """
+        Iterates over the :class:`Task` of the project, one page at a time.
+        """
+        return Tasks(self.requester).iter(project=self.id, **queryparams)
 
     def add_milestone(self, name, estimated_start, estimated_finish, **attrs):
         """
@@ -1464,6 +1920,12 @@ class Project(InstanceResource):
         """
         return Milestones(self.requester).list(project=self.id, **queryparams)
 
+    def iter_milestones(self, **queryparams):
+        """
+        Iterates over the :class:`Milestone` of the project, one page at a time.
+        """
+        return Milestones(self.requester).iter(project=self.id, **queryparams)
+
     def add_point(self, name, value, **attrs):
         """
         Add a Point to the project and returns a :class:`Point` object.
@@ -1474,11 +1936,11 @@ class Project(InstanceResource):
         """
         return Points(self.requester).create(self.id, name, value, **attrs)
 
-    def list_points(self):
+    def list_points(self, **queryparams):
         """
         Get the list of :class:`Point` resources for the project.
         """
-        return Points(self.requester).list(project=self.id)
+        return Points(self.requester).list(project=self.id, **queryparams)
 
     def add_epic(self, subject, **attrs):
         """
@@ -1489,11 +1951,17 @@ class Project(InstanceResource):
         """
         return Epics(self.requester).create(self.id, subject, **attrs)
 
-    def list_epics(self):
+    def list_epics(self, **queryparams):
         """
         Get the list of :class:`Epic` resources for the project.
         """
-        return Epics(self.requester).list(project=self.id)
+        return Epics(self.requester).list(project=self.id, **queryparams)
+
+    def iter_epics(self, **queryparams):
+        """
+        Iterates over the :class:`Epic` of the project, one page at a time.
+        """
+        return Epics(self.requester).iter(project=self.id, **queryparams)
 
     def add_task_status(self, name, **attrs):
         """
@@ -1505,11 +1973,11 @@ class Project(InstanceResource):
         """
         return TaskStatuses(self.requester).create(self.id, name, **attrs)
 
-    def list_task_statuses(self):
+    def list_task_statuses(self, **queryparams):
         """
         Get the list of :class:`Task` resources for the project.
         """
-        return TaskStatuses(self.requester).list(project=self.id)
+        return TaskStatuses(self.requester).list(project=self.id, **queryparams)
 
     def import_task(self, subject, status, **attrs):
         """
@@ -1531,11 +1999,11 @@ class Project(InstanceResource):
         """
         return UserStoryStatuses(self.requester).create(self.id, name, **attrs)
 
-    def list_user_story_statuses(self):
+    def list_user_story_statuses(self, **queryparams):
         """
         Get the list of :class:`UserStoryStatus` resources for the project.
         """
-        return UserStoryStatuses(self.requester).list(project=self.id)
+        return UserStoryStatuses(self.requester).list(project=self.id, **queryparams)
 
     def add_issue_type(self, name, **attrs):
         """
@@ -1547,11 +2015,11 @@ class Project(InstanceResource):
         """
         return IssueTypes(self.requester).create(self.id, name, **attrs)
 
-    def list_issue_types(self):
+    def list_issue_types(self, **queryparams):
         """
         Get the list of :class:`IssueType` resources for the project.
         """
-        return IssueTypes(self.requester).list(project=self.id)
+        return IssueTypes(self.requester).list(project=self.id, **queryparams)
 
     def add_severity(self, name, **attrs):
         """
@@ -1562,11 +2030,11 @@ class Project(InstanceResource):
         """
         return Severities(self.requester).create(self.id, name, **attrs)
 
-    def list_severities(self):
+    def list_severities(self, **queryparams):
         """
         Get the list of :class:`Severity` resources for the project.
         """
-        return Severities(self.requester).list(project=self.id)
+        return Severities(self.requester).list(project=self.id, **queryparams)
 
     def add_role(self, name, **attrs):
         """
@@ -1577,11 +2045,11 @@ class Project(InstanceResource):
         """
         return Roles(self.requester).create(self.id, name, **attrs)
 
-    def list_roles(self):
+    def list_roles(self, **queryparams):
         """
         Get the list of :class:`Role` resources for the project.
         """
-        return Roles(self.requester).list(project=self.id)
+        return Roles(self.requester).list(project=self.id, **queryparams)
 
     def add_priority(self, name, **attrs):
         """
@@ -1592,11 +2060,11 @@ class Project(InstanceResource):
         """
         return Priorities(self.requester).create(self.id, name, **attrs)
 
-    def list_priorities(self):
+    def list_priorities(self, **queryparams):
         """
         Get the list of :class:`Priority` resources for the project.
         """
-        return Priorities(self.requester).list(project=self.id)
+        return Priorities(self.requester).list(project=self.id, **queryparams)
 
     def add_issue_status(self, name, **attrs):
         """
@@ -1608,11 +2076,11 @@ class Project(InstanceResource):
         """
         return IssueStatuses(self.requester).create(self.id, name, **attrs)
 
-    def list_issue_statuses(self):
+    def list_issue_statuses(self, **queryparams):
         """
         Get the list of :class:`IssueStatus` resources for the project.
         """
-        return IssueStatuses(self.requester).list(project=self.id)
+        return IssueStatuses(self.requester).list(project=self.id, **queryparams)
 
     def add_wikipage(self, slug, content, **attrs):
         """
@@ -1633,11 +2101,17 @@ class Project(InstanceResource):
         """
         return WikiPages(self.requester).import_(self.id, slug, content, **attrs)
 
-    def list_wikipages(self):
+    def list_wikipages(self, **queryparams):
         """
         Get the list of :class:`WikiPage` resources for the project.
         """
-        return WikiPages(self.requester).list(project=self.id)
+        return WikiPages(self.requester).list(project=self.id, **queryparams)
+
+    def iter_wikipages(self, **queryparams):
+        """
+        Iterates over the :class:`WikiPage` of the project, one page at a time.
+        """
+        return WikiPages(self.requester).iter(project=self.id, **queryparams)
 
     def add_wikilink(self, title, href, **attrs):
         """
@@ -1659,11 +2133,11 @@ class Project(InstanceResource):
         """
         return WikiLinks(self.requester).import_(self.id, title, href, **attrs)
 
-    def list_wikilinks(self):
+    def list_wikilinks(self, **queryparams):
         """
         Get the list of :class:`WikiLink` resources for the project.
         """
-        return WikiLinks(self.requester).list(project=self.id)
+        return WikiLinks(self.requester).list(project=self.id, **queryparams)
 
     def add_issue_attribute(self, name, **attrs):
         """
@@ -1674,11 +2148,11 @@ class Project(InstanceResource):
         """
         return IssueAttributes(self.requester).create(self.id, name, **attrs)
 
-    def list_issue_attributes(self):
+    def list_issue_attributes(self, **queryparams):
         """
         Get the list of :class:`IssueAttribute` resources for the project.
         """
-        return IssueAttributes(self.requester).list(project=self.id)
+        return IssueAttributes(self.requester).list(project=self.id, **queryparams)
 
     def add_task_attribute(self, name, **attrs):
         """
@@ -1689,11 +2163,11 @@ class Project(InstanceResource):
         """
         return TaskAttributes(self.requester).create(self.id, name, **attrs)
 
-    def list_task_attributes(self):
+    def list_task_attributes(self, **queryparams):
         """
         Get the list of :class:`TaskAttribute` resources for the project.
         """
-        return TaskAttributes(self.requester).list(project=self.id)
+        return TaskAttributes(self.requester).list(project=self.id, **queryparams)
 
     def add_user_story_attribute(self, name, **attrs):
         """
@@ -1705,17 +2179,17 @@ class Project(InstanceResource):
         """
         return UserStoryAttributes(self.requester).create(self.id, name, **attrs)
 
-    def list_user_story_attributes(self):
+    def list_user_story_attributes(self, **queryparams):
         """
         Get the list of :class:`UserStoryAttribute` resources for the project.
         """
-        return UserStoryAttributes(self.requester).list(project=self.id)
+        return UserStoryAttributes(self.requester).list(project=self.id, **queryparams)
 
-    def list_epic_attributes(self):
+    def list_epic_attributes(self, **queryparams):
         """
         Get the list of :class:`EpicAttribute` resources for the project.
         """
-        return EpicAttributes(self.requester).list(project=self.id)
+        return EpicAttributes(self.requester).list(project=self.id, **queryparams)
 
     def add_webhook(self, name, url, key, **attrs):
         """
@@ -1728,11 +2202,11 @@ class Project(InstanceResource):
         """
         return Webhooks(self.requester).create(self.id, name, url, key, **attrs)
 
-    def list_webhooks(self):
+    def list_webhooks(self, **queryparams):
         """
         Get the list of :class:`Webhook` resources for the project.
         """
-        return Webhooks(self.requester).list(project=self.id)
+        return Webhooks(self.requester).list(project=self.id, **queryparams)
 
     def add_tag(self, tag, color=None):
         """
@@ -1752,7 +2226,7 @@ class Project(InstanceResource):
         Get the list of tags for the project.
         """
         response = self.requester.get("/{}/{}/tags_colors".format(self.endpoint, self.id))
-        return response.json()
+        return self.requester.decode(response)
 
     def duplicate(self, name, description, is_private=False, users=[], **attrs):
         """
@@ -1766,7 +2240,7 @@ class Project(InstanceResource):
         """
         attrs.update({"name": name, "description": description, "is_private": is_private, "users": users})
         response = self.requester.post("/{endpoint}/{id}/duplicate", payload=attrs, endpoint=self.endpoint, id=self.id)
-        return self.parse(self.requester, response.json())
+        return self.parse(self.requester, self.requester.decode(response))
 
 
 class Projects(ListResource):
@@ -1790,7 +2264,7 @@ class Projects(ListResource):
     def import_(self, name, description, roles, **attrs):
         attrs.update({"name": name, "description": description, "roles": roles})
         response = self.requester.post("/{endpoint}", endpoint="importer", payload=attrs)
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
     def get_by_slug(self, slug):
         """
@@ -1799,7 +2273,7 @@ class Projects(ListResource):
         :param slug: the slug of :class:`Project`
         """
         response = self.requester.get("/{endpoint}/by_slug?slug={slug}", endpoint=self.instance.endpoint, slug=slug)
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
 
 class WikiAttachment(Attachment):
@@ -1843,11 +2317,11 @@ class WikiPage(InstanceResource):
         """
         return WikiAttachments(self.requester).create(self.project, self.id, attached_file, **attrs)
 
-    def list_attachments(self):
+    def list_attachments(self, **queryparams):
         """
         Get a list of :class:`WikiAttachment`.
         """
-        return WikiAttachments(self.requester).list(object_id=self.id, project=self.project)
+        return WikiAttachments(self.requester).list(object_id=self.id, project=self.project, **queryparams)
 
 
 class WikiPages(ListResource):
@@ -1874,7 +2348,7 @@ class WikiPages(ListResource):
         response = self.requester.post(
             "/{endpoint}/{id}/{type}", endpoint="importer", id=project, type="wiki_page", payload=attrs
         )
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
 
 class WikiLink(InstanceResource):
@@ -1918,7 +2392,7 @@ class WikiLinks(ListResource):
         response = self.requester.post(
             "/{endpoint}/{id}/{type}", endpoint="importer", id=project, type="wiki_link", payload=attrs
         )
-        return self.instance.parse(self.requester, response.json())
+        return self.instance.parse(self.requester, self.requester.decode(response))
 
 
 class History(InstanceResource):
@@ -1954,7 +2428,7 @@ class HistoryEntity:
         response = self.requester.get(
             "/{endpoint}/{entity}/{id}", endpoint=self.endpoint, entity=self.entity, id=resource_id, paginate=False
         )
-        return response.json()
+        return self.requester.decode(response)
 
     def delete_comment(self, resource_id, comment_id):
         """
@@ -2037,6 +2511,71 @@ class HistoryWiki(HistoryEntity):
         self.entity = "wiki"
 
 
+class AsyncHistory:
+    """
+    Asynchronous counterpart of :class:`History`
+    """
+
+    def __init__(self, requester):
+        self.requester = requester
+        self.issue = AsyncHistoryEntity(requester, "issue")
+        self.task = AsyncHistoryEntity(requester, "task")
+        self.user_story = AsyncHistoryEntity(requester, "userstory")
+        self.wiki = AsyncHistoryEntity(requester, "wiki")
+        self.epic = AsyncHistoryEntity(requester, "epic")
+
+
+class AsyncHistoryEntity(HistoryEntity):
+    """
+    Asynchronous counterpart of :class:`HistoryEntity`
+    """
+
+    def __init__(self, requester, entity):
+        super().__init__(requester)
+        self.entity = entity
+
+    async def get(self, resource_id):
+        """
+        Get a history element
+
+        :param resource_id: id of the resource object
+        """
+        response = await self.requester.get(
+            "/{endpoint}/{entity}/{id}", endpoint=self.endpoint, entity=self.entity, id=resource_id, paginate=False
+        )
+        return self.requester.decode(response)
+
+    async def delete_comment(self, resource_id, comment_id):
+        """
+        Delete a comment
+
+        :param resource_id: id of the resource object
+        :param comment_id: id of the comment to delete
+        """
+        await self.requester.post(
+            "/{endpoint}/{entity}/{id}/delete_comment?id={comment_id}",
+            endpoint=self.endpoint,
+            entity=self.entity,
+            id=resource_id,
+            comment_id=comment_id,
+        )
+
+    async def undelete_comment(self, resource_id, comment_id):
+        """
+        Undelete a comment
+
+        :param resource_id: id of the resource object
+        :param comment_id: id of the comment to undelete
+        """
+        await self.requester.post(
+            "/{endpoint}/{entity}/{id}/undelete_comment?id={comment_id}",
+            endpoint=self.endpoint,
+            entity=self.entity,
+            id=resource_id,
+            comment_id=comment_id,
+        )
+
+
 class Webhook(InstanceResource):
     """
     Webhook model
@@ -1,15 +1,255 @@
+import asyncio
+import copy
+import functools
 import json
+import mimetypes
+import os
+import random
+import sqlite3
+import sys
+import threading
 import time
+import uuid
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from requests.exceptions import RequestException
     from requests.packages.urllib3.exceptions import InsecureRequestWarning
 except ImportError:  # pragma: no cover
     pass
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
 from . import exceptions, utils
 
+#: default number of connection pools cached by the session adapter
+DEFAULT_POOL_CONNECTIONS = 10
+#: default number of connections kept alive in each pool
+DEFAULT_POOL_MAXSIZE = 10
+#: default number of bytes of the uploaded files read at a time
+DEFAULT_UPLOAD_CHUNK_SIZE = 64 * 1024
+#: default maximum total size of the responses the objects of the object cache have been parsed from
+DEFAULT_OBJECT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def build_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE):
+    """
+    Build a :class:`requests.Session` with a keep-alive connection pool
+
+    :param pool_connections: number of connection pools to cache
+    :param pool_maxsize: maximum number of connections to keep in each pool
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def build_async_session(pool_maxsize=DEFAULT_POOL_MAXSIZE, tls_verify=True):
+    """
+    Build a :class:`httpx.AsyncClient` with a keep-alive connection pool
+
+    :param pool_maxsize: maximum number of connections to open and keep alive
+    :param tls_verify: verify server certificate
+    """
+    if httpx is None:
+        raise RequestMakerException("httpx is required to use the asynchronous client")
+    limits = httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize)
+    return httpx.AsyncClient(limits=limits, verify=tls_verify)
+
+
+class JSONCodec:
+    """
+    Encodes the request payloads and decodes the response bodies
+
+    :param dumps: function serializing an object to a JSON ``str`` or ``bytes`` document
+    :param loads: function parsing a JSON ``str`` or ``bytes`` document
+    :param name: name of the codec
+    """
+
+    def __init__(self, dumps=json.dumps, loads=json.loads, name="json"):
+        self._dumps = dumps
+        self._loads = loads
+        self.name = name
+
+    def __repr__(self):
+        return "<JSONCodec {}>".format(self.name)
+
+    def dumps(self, obj):
+        return self._dumps(obj)
+
+    def loads(self, data):
+        return self._loads(data)
+
+    def decode(self, response):
+        """
+        Decode the JSON body of a response
+
+        :param response: a :class:`requests.Response`, :class:`httpx.Response` or :class:`CachedResponse`
+        """
+        if isinstance(response, CachedResponse):
+            # already decoded when stored
+            return response.json()
+        content = getattr(response, "content", None)
+        if not isinstance(content, (bytes, str)):
+            # response-like object without a raw body
+            return response.json()
+        return self._loads(content)
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def get_json_codec(name=None):
+    """
+    Build a :class:`JSONCodec`
+
+    :param name: ``orjson``, ``ujson`` or ``json``; if not provided the fastest installed library is used, the
+                 standard library being the fallback
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "ujson" if ujson is not None else "json"
+    if name == "orjson" and orjson is not None:
+        return JSONCodec(_orjson_dumps, orjson.loads, "orjson")
+    if name == "ujson" and ujson is not None:
+        return JSONCodec(ujson.dumps, ujson.loads, "ujson")
+    if name == "json":
+        return JSONCodec()
+    raise RequestMakerException("JSON codec {} is not available".format(name))
+
+
+class MultipartStream:
+    """
+    ``multipart/form-data`` body generated while it is sent
+
+    The files are read ``chunk_size`` bytes at a time, so the memory used does not depend on their size. When
+    the size of all the files is known, :py:attr:`len` holds the length of the body, otherwise the body is sent
+    with a chunked transfer encoding. The body can be iterated several times (to retry a request), the files
+    are read again from their initial position.
+
+    :param fields: the form fields, by name
+    :param files: the file objects, by name
+    :param chunk_size: number of bytes read at a time
+    :param progress: callable called with the number of bytes sent so far and the length of the body (`None`
+                     if unknown) after each chunk
+    """
+
+    def __init__(self, fields=None, files=None, chunk_size=DEFAULT_UPLOAD_CHUNK_SIZE, progress=None):
+        self.boundary = uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._parts = []
+        for name, value in (fields or {}).items():
+            if value is None:
+                continue
+            header = 'Content-Disposition: form-data; name="{}"'.format(name)
+            self._parts.append((self._part_header(header), "{}".format(value).encode("utf-8"), None))
+        for name, fileobj in (files or {}).items():
+            filename = os.path.basename("{}".format(getattr(fileobj, "name", None) or name))
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            header = 'Content-Disposition: form-data; name="{}"; filename="{}"\r\nContent-Type: {}'.format(
+                name, filename.replace('"', "%22"), content_type
+            )
+            start = fileobj.tell() if self._seekable(fileobj) else None
+            self._parts.append((self._part_header(header), fileobj, start))
+        self._closing = "--{}--\r\n".format(self.boundary).encode("ascii")
+        #: length of the body, `None` if unknown
+        self.len = self._length()
+
+    @property
+    def content_type(self):
+        return "multipart/form-data; boundary={}".format(self.boundary)
+
+    def _part_header(self, header):
+        return "--{}\r\n{}\r\n\r\n".format(self.boundary, header).encode("utf-8")
+
+    @staticmethod
+    def _seekable(fileobj):
+        try:
+            return fileobj.seekable()
+        except (AttributeError, ValueError):
+            return False
+
+    @staticmethod
+    def _file_size(fileobj, start):
+        if start is None or "b" not in getattr(fileobj, "mode", "b"):
+            return None
+        try:
+            return os.fstat(fileobj.fileno()).st_size - start
+        except (AttributeError, OSError, ValueError):
+            pass
+        end = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(start)
+        return end - start
+
+    def _length(self):
+        length = len(self._closing)
+        for header, content, start in self._parts:
+            if isinstance(content, bytes):
+                size = len(content)
+            else:
+                size = self._file_size(content, start)
+                if size is None:
+                    return None
+            length += len(header) + size + 2
+        return length
+
+    def _chunks(self):
+        for header, content, start in self._parts:
+            yield header
+            if isinstance(content, bytes):
+                yield content
+            else:
+                if start is not None:
+                    content.seek(start)
+                while True:
+                    chunk = content.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            yield b"\r\n"
+        yield self._closing
+
+    def __iter__(self):
+        sent = 0
+        for chunk in self._chunks():
+            sent += len(chunk)
+            yield chunk
+            if self.progress is not None:
+                self.progress(sent, self.len)
+
+
+class _AsyncIterable:
+    """
+    Asynchronous view of an iterable, as required by the body of the :class:`httpx.AsyncClient` requests
+    """
+
+    def __init__(self, iterable):
+        self._iterable = iterable
+
+    async def __aiter__(self):
+        for item in self._iterable:
+            yield item
+
 
 class RequestCacheException(Exception):  # noqa: N818
     pass
@@ -23,40 +263,638 @@ class RequestCacheInvalidException(RequestCacheException):  # noqa: N818
     pass
 
 
+class CachedResponse:
+    """
+    Lightweight copy of a response stored in :class:`RequestCache`
+
+    Only the decoded payload and the headers listed in :py:attr:`cached_headers` are kept; it exposes the subset
+    of the :class:`requests.Response` interface used by the library.
+
+    :param status_code: HTTP status code
+    :param payload: the decoded JSON payload
+    :param headers: response headers
+    :param size: size of the response body in bytes
+    """
+
+    #: response headers preserved in the cache
+    cached_headers = ("X-Pagination-Next", "X-Pagination-Count", "X-Paginated-By", "ETag", "Last-Modified")
+
+    def __init__(self, status_code, payload, headers=None, size=0):
+        self.status_code = status_code
+        self.payload = payload
+        self.headers = headers or {}
+        self.size = size
+
+    @classmethod
+    def from_response(cls, response, json_codec=None):
+        """
+        Build a :class:`CachedResponse` from a :class:`requests.Response`
+
+        :param response: the response to copy
+        :param json_codec: the :class:`JSONCodec` decoding the payload; if not provided ``response.json()`` is used
+        """
+        try:
+            payload = json_codec.decode(response) if json_codec is not None else response.json()
+        except ValueError:
+            payload = None
+        headers = {}
+        for header in cls.cached_headers:
+            value = response.headers.get(header)
+            if value is not None:
+                headers[header] = value
+        return cls(response.status_code, payload, headers, len(response.content or b""))
+
+    @property
+    def text(self):
+        return json.dumps(self.payload)
+
+    @property
+    def content(self):
+        return self.text.encode("utf-8")
+
+    def conditional_headers(self):
+        """
+        Request headers revalidating the cached payload against the validators of the response
+        """
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def json(self):
+        # callers are free to modify the returned payload, the cached one must stay untouched
+        return copy.deepcopy(self.payload)
+
+
 class RequestCache:
-    def __init__(self, valid_time=60):
+    """
+    In-memory cache of the responses with time based expiration and LRU eviction
+
+    :param valid_time: number of seconds an entry is valid
+    :param max_entries: maximum number of entries kept, `None` for no limit
+    :param max_bytes: maximum total size of the entries, `None` for no limit
+    :param sweep_interval: number of seconds between two sweeps of the expired entries
+    :param stale_time: number of seconds an expired entry carrying validators (``ETag``, ``Last-Modified``) is
+                       kept to be revalidated with a conditional request
+    """
+
+    def __init__(self, valid_time=60, max_entries=1024, max_bytes=None, sweep_interval=60, stale_time=600):
         self._valid_time = valid_time
-        self._cache = {}
+        self._stale_time = stale_time
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sweep_interval = sweep_interval
+        self._cache = OrderedDict()
+        self._size = 0
+        self._last_sweep = time.time()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._cache)
 
-    def put(self, key, value):
-        self._cache[key] = {"time": time.time(), "value": value}
+    @staticmethod
+    def _entry_size(value):
+        size = getattr(value, "size", None)
+        if size is None:
+            size = sys.getsizeof(value)
+        return size
+
+    def put(self, key, value, valid_time=None):
+        now = time.time()
+        with self._lock:
+            self.remove(key)
+            size = self._entry_size(value)
+            self._cache[key] = {"time": now, "value": value, "size": size, "valid_time": valid_time}
+            self._size += size
+            if now > self._last_sweep + self._sweep_interval:
+                self.sweep()
+            self._evict()
+
+    def put_response(self, key, response, valid_time=None, json_codec=None):
+        """
+        Store the decoded payload and the relevant headers of the response
+
+        :param key: the cache key
+        :param response: the response to store
+        :param valid_time: number of seconds the entry is valid, defaults to the cache one
+        :param json_codec: the :class:`JSONCodec` decoding the payload
+        """
+        self.put(key, CachedResponse.from_response(response, json_codec), valid_time)
 
     def remove(self, key):
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is not None:
+                self._size -= entry["size"]
 
     def get(self, key):
-        if key not in self._cache:
-            raise RequestCacheMissingException()
-        if time.time() > self._cache[key]["time"] + self._valid_time:
+        with self._lock:
+            if key not in self._cache:
+                raise RequestCacheMissingException()
+            entry = self._cache[key]
+            if time.time() > entry["time"] + self._entry_valid_time(entry["valid_time"]):
+                if self._is_dead(key, time.time()):
+                    self.remove(key)
+                raise RequestCacheInvalidException()
+            self._cache.move_to_end(key)
+            return self._cache[key]["value"]
+
+    def get_stale(self, key):
+        """
+        Get an entry which can be revalidated, even if expired
+        """
+        with self._lock:
+            if key not in self._cache or self._is_dead(key, time.time()):
+                raise RequestCacheMissingException()
+            return self._cache[key]["value"]
+
+    def touch(self, key):
+        """
+        Mark an entry as fresh again, after it has been revalidated
+        """
+        with self._lock:
+            if key not in self._cache:
+                raise RequestCacheMissingException()
+            self._cache[key]["time"] = time.time()
+            self._cache.move_to_end(key)
+
+    def _entry_valid_time(self, valid_time):
+        return self._valid_time if valid_time is None else valid_time
+
+    def _expire_time(self, stored_time, value, valid_time=None):
+        """
+        Time after which an entry stored at ``stored_time`` cannot be used (nor revalidated) anymore
+        """
+        expire_time = stored_time + self._entry_valid_time(valid_time)
+        if getattr(value, "conditional_headers", None) and value.conditional_headers():
+            expire_time += self._stale_time
+        return expire_time
+
+    def _is_dead(self, key, now):
+        entry = self._cache[key]
+        return now > self._expire_time(entry["time"], entry["value"], entry["valid_time"])
+
+    def sweep(self):
+        """
+        Remove all the expired entries that cannot be revalidated anymore
+        """
+        now = time.time()
+        with self._lock:
+            self._last_sweep = now
+            expired = [key for key in self._cache if self._is_dead(key, now)]
+            for key in expired:
+                self.remove(key)
+
+    def clear(self):
+        """
+        Remove all the entries
+        """
+        with self._lock:
+            self._cache.clear()
+            self._size = 0
+
+    def _evict(self):
+        while self._cache and (
+            (self._max_entries is not None and len(self._cache) > self._max_entries)
+            or (self._max_bytes is not None and self._size > self._max_bytes)
+        ):
+            key = next(iter(self._cache))
             self.remove(key)
-            raise RequestCacheInvalidException()
-        return self._cache[key]["value"]
+
+
+class SqliteRequestCache(RequestCache):
+    """
+    :class:`RequestCache` stored in a sqlite database
+
+    The database file can be shared by several processes on the same host, so that short-lived workers reuse the
+    responses already fetched by the others. Expiration, revalidation and eviction follow :class:`RequestCache`;
+    only :class:`CachedResponse` and JSON serializable values can be stored.
+
+    :param path: path of the sqlite database file
+    :param valid_time: number of seconds an entry is valid
+    :param max_entries: maximum number of entries kept, `None` for no limit
+    :param max_bytes: maximum total size of the entries, `None` for no limit
+    :param sweep_interval: number of seconds between two sweeps of the expired entries
+    :param stale_time: number of seconds an expired entry carrying validators is kept to be revalidated
+    :param timeout: number of seconds to wait for a lock held by another process
+    """
+
+    def __init__(
+        self, path, valid_time=60, max_entries=1024, max_bytes=None, sweep_interval=60, stale_time=600, timeout=10
+    ):
+        super().__init__(valid_time, max_entries, max_bytes, sweep_interval, stale_time)
+        self.path = path
+        self._timeout = timeout
+        self._connection = None
+        self._pid = None
+
+    def _db(self):
+        # connections must not be shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS request_cache "
+                "(key TEXT PRIMARY KEY, time REAL, valid REAL, expire REAL, access REAL, size INTEGER, value TEXT)"
+            )
+            self._pid = os.getpid()
+        return self._connection
+
+    def __len__(self):
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM request_cache").fetchone()[0]
+
+    @staticmethod
+    def _dumps(value):
+        if isinstance(value, CachedResponse):
+            return json.dumps(
+                {"response": [value.status_code, value.payload, value.headers, value.size]}, separators=(",", ":")
+            )
+        return json.dumps({"value": value}, separators=(",", ":"))
+
+    @staticmethod
+    def _loads(data):
+        data = json.loads(data)
+        if "response" in data:
+            return CachedResponse(*data["response"])
+        return data["value"]
+
+    def put(self, key, value, valid_time=None):
+        now = time.time()
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO request_cache (key, time, valid, expire, access, size, value) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    now,
+                    self._entry_valid_time(valid_time),
+                    self._expire_time(now, value, valid_time),
+                    now,
+                    self._entry_size(value),
+                    self._dumps(value),
+                ),
+            )
+            if now > self._last_sweep + self._sweep_interval:
+                self.sweep()
+            self._evict()
+
+    def remove(self, key):
+        with self._lock:
+            self._db().execute("DELETE FROM request_cache WHERE key = ?", (key,))
+
+    def _row(self, key):
+        return (
+            self._db().execute("SELECT time, valid, expire, value FROM request_cache WHERE key = ?", (key,)).fetchone()
+        )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._row(key)
+            if row is None:
+                raise RequestCacheMissingException()
+            stored_time, valid_time, expire_time, value = row
+            if now > stored_time + valid_time:
+                if now > expire_time:
+                    self.remove(key)
+                raise RequestCacheInvalidException()
+            self._db().execute("UPDATE request_cache SET access = ? WHERE key = ?", (now, key))
+            return self._loads(value)
+
+    def get_stale(self, key):
+        with self._lock:
+            row = self._row(key)
+            if row is None or time.time() > row[2]:
+                raise RequestCacheMissingException()
+            return self._loads(row[3])
+
+    def touch(self, key):
+        now = time.time()
+        with self._lock:
+            cursor = self._db().execute(
+                "UPDATE request_cache SET expire = ? + (expire - time), time = ?, access = ? WHERE key = ?",
+                (now, now, now, key),
+            )
+            if not cursor.rowcount:
+                raise RequestCacheMissingException()
+
+    def sweep(self):
+        """
+        Remove all the expired entries that cannot be revalidated anymore
+        """
+        now = time.time()
+        with self._lock:
+            self._last_sweep = now
+            self._db().execute("DELETE FROM request_cache WHERE expire < ?", (now,))
+
+    def clear(self):
+        """
+        Remove all the entries
+        """
+        with self._lock:
+            self._db().execute("DELETE FROM request_cache")
+
+    def _evict(self):
+        db = self._db()
+        if self._max_entries is not None:
+            db.execute(
+                "DELETE FROM request_cache WHERE key IN "
+                "(SELECT key FROM request_cache ORDER BY access DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries,),
+            )
+        if self._max_bytes is not None:
+            db.execute(
+                "DELETE FROM request_cache WHERE key IN (SELECT key FROM "
+                "(SELECT key, SUM(size) OVER (ORDER BY access DESC, key) AS total FROM request_cache) "
+                "WHERE total > ?)",
+                (self._max_bytes,),
+            )
 
 
 class RequestMakerException(Exception):  # noqa: N818
     pass
 
 
+class RetryPolicy:
+    """
+    Retry policy for the throttled (429), transient (502, 503, 504) and failed (network error) requests
+
+    The delay before each retry follows an exponential backoff with full jitter, unless the server sends a
+    ``Retry-After`` header, which is honored as long as it does not exceed ``max_retry_after``.
+
+    Idempotent requests (GET, PUT, DELETE) can safely be sent again, so they are retried on any status of
+    ``status_forcelist`` and on network errors. The others (POST, PATCH) may have been applied by the server
+    already: by default they are only retried on the statuses of ``non_idempotent_status_forcelist``, sent
+    when the request has been rejected before being processed.
+
+    :param total: maximum number of retries of a request, `0` disables the retries
+    :param backoff_factor: base of the exponential backoff, in seconds
+    :param max_backoff: maximum backoff between two attempts, in seconds
+    :param max_retry_after: maximum ``Retry-After`` honored, in seconds; longer waits are not retried
+    :param status_forcelist: statuses retried for the idempotent requests
+    :param non_idempotent_status_forcelist: statuses retried for the non idempotent requests
+    :param non_idempotent_network_errors: retry the non idempotent requests on network errors too
+    """
+
+    idempotent_methods = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+    def __init__(
+        self,
+        total=3,
+        backoff_factor=0.5,
+        max_backoff=30,
+        max_retry_after=120,
+        status_forcelist=(429, 502, 503, 504),
+        non_idempotent_status_forcelist=(429,),
+        non_idempotent_network_errors=False,
+    ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.status_forcelist = frozenset(status_forcelist)
+        self.non_idempotent_status_forcelist = frozenset(non_idempotent_status_forcelist)
+        self.non_idempotent_network_errors = non_idempotent_network_errors
+
+    def is_idempotent(self, method):
+        return method.upper() in self.idempotent_methods
+
+    def backoff(self, attempt):
+        """
+        Jittered delay before the retry following the failed ``attempt`` (starting from `0`)
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2**attempt)))
+
+    def retry_after(self, response):
+        """
+        Number of seconds requested by the ``Retry-After`` header of the response, `None` if missing or invalid
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+    def delay(self, method, attempt, response=None):
+        """
+        Seconds to wait before retrying the request, `None` if it must not be retried
+
+        :param method: the HTTP method of the request
+        :param attempt: number of the failed attempt, starting from `0`
+        :param response: the response received, `None` on network errors
+        """
+        if attempt >= self.total:
+            return None
+        idempotent = self.is_idempotent(method)
+        if response is None:
+            if idempotent or self.non_idempotent_network_errors:
+                return self.backoff(attempt)
+            return None
+        statuses = self.status_forcelist if idempotent else self.non_idempotent_status_forcelist
+        if response.status_code not in statuses:
+            return None
+        retry_after = self.retry_after(response)
+        if retry_after is None:
+            return self.backoff(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+    @staticmethod
+    def _rewind(files):
+        # the uploaded files have been read by the failed attempt
+        for value in (files or {}).values():
+            fileobj = value[1] if isinstance(value, (tuple, list)) else value
+            if hasattr(fileobj, "seek"):
+                fileobj.seek(0)
+
+    def call(self, method, send, url, **kwargs):
+        """
+        Call ``send(url, **kwargs)`` retrying it as allowed by the policy
+
+        Once the retries are exhausted the last response is returned, or the last
+        :class:`requests.exceptions.RequestException` raised.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = send(url, **kwargs)
+            except RequestException:
+                delay = self.delay(method, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self.delay(method, attempt, response)
+                if delay is None:
+                    return response
+            time.sleep(delay)
+            self._rewind(kwargs.get("files"))
+            attempt += 1
+
+    async def async_call(self, method, send, url, **kwargs):
+        """
+        Asynchronous counterpart of :meth:`call`, for ``send`` coroutines raising :class:`httpx.HTTPError`
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await send(url, **kwargs)
+            except httpx.HTTPError:
+                delay = self.delay(method, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self.delay(method, attempt, response)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            self._rewind(kwargs.get("files"))
+            attempt += 1
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting the rate of the requests
+
+    The bucket holds up to ``burst`` tokens and is refilled with ``rate`` tokens per second; each request takes
+    a token, waiting for it when the bucket is empty. Tokens are reserved in arrival order, so the threads (or
+    tasks) sharing a limiter are served fairly and the overall rate never exceeds ``rate`` after the burst.
+
+    :param rate: number of requests per second
+    :param burst: maximum number of requests sent at once, defaults to `1`
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """
+        Take a token, returns the number of seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """
+        Wait until a request can be sent
+        """
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def async_acquire(self):
+        """
+        Asynchronous counterpart of :meth:`acquire`
+        """
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def limit(self, send):
+        """
+        Wrap the ``send`` callable so that every call waits for a token
+        """
+
+        def limited(*args, **kwargs):
+            self.acquire()
+            return send(*args, **kwargs)
+
+        return limited
+
+    def async_limit(self, send):
+        """
+        Wrap the ``send`` coroutine function so that every call waits for a token
+        """
+
+        async def limited(*args, **kwargs):
+            await self.async_acquire()
+            return await send(*args, **kwargs)
+
+        return limited
+
+
 class RequestMaker:
-    def __init__(self, api_path, host, token, token_type="Bearer", tls_verify=True, enable_pagination=True):
+    """
+    Performs the HTTP calls against the Taiga REST API
+
+    All the calls go through a single :class:`requests.Session`, so connections to the Taiga host are pooled
+    and kept alive between requests.
+
+    :param api_path: path of the API on the host
+    :param host: the host of your Taiga.io instance
+    :param token: the authentication token
+    :param token_type: the token type
+    :param tls_verify: verify server certificate
+    :param enable_pagination: use remote pagination
+    :param session: a :class:`requests.Session` to share; if not provided a new one is created and owned
+    :param pool_connections: number of connection pools cached by the session created by the instance
+    :param pool_maxsize: number of connections kept alive in each pool of the session created by the instance
+    :param request_cache: the :class:`RequestCache` to use; if not provided a new one is created
+    :param retry: the :class:`RetryPolicy` of the calls; if not provided the calls are not retried
+    :param rate_limiter: the :class:`RateLimiter` of the calls, retries included; if not provided the calls
+                         are not limited
+    :param json_codec: the :class:`JSONCodec` of the payloads and responses; if not provided the fastest
+                       installed JSON library is used
+    """
+
+    def __init__(
+        self,
+        api_path,
+        host,
+        token,
+        token_type="Bearer",
+        tls_verify=True,
+        enable_pagination=True,
+        session=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        request_cache=None,
+        retry=None,
+        rate_limiter=None,
+        json_codec=None,
+    ):
         self.api_path = api_path
         self.host = host
         self.token = token
         self.token_type = token_type
         self.tls_verify = tls_verify
         self.enable_pagination = enable_pagination
-        self._cache = RequestCache()
+        self._cache = request_cache if request_cache is not None else RequestCache()
+        self.retry = retry if retry is not None else RetryPolicy(total=0)
+        self.rate_limiter = rate_limiter
+        self.json_codec = json_codec if json_codec is not None else get_json_codec()
+        #: in-process cache of the parsed model instances
+        self.object_cache = RequestCache(max_bytes=DEFAULT_OBJECT_CACHE_MAX_BYTES)
+        self._owns_session = session is None
+        if session is None:
+            session = build_session(pool_connections, pool_maxsize)
+        self.session = session
         if not self.tls_verify:
             requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
@@ -64,16 +902,30 @@ class RequestMaker:
     def cache(self):
         return self._cache
 
+    def close(self):
+        """
+        Close the underlying session, if it has been created by this instance
+        """
+        if self._owns_session:
+            self.session.close()
+
     def is_bad_response(self, response):
         return 400 <= response.status_code <= 500
 
-    def headers(self, paginate=True):
+    def decode(self, response):
+        """
+        Decode the JSON body of a response with the codec of the instance
+        """
+        return self.json_codec.decode(response)
+
+    def headers(self, paginate=True, lazy=True):
         headers = {
             "Content-type": "application/json",
             "Authorization": "{} {}".format(self.token_type, self.token),
         }
         if self.enable_pagination and paginate:
-            headers["x-lazy-pagination"] = "True"
+            if lazy:
+                headers["x-lazy-pagination"] = "True"
         else:
             headers["x-disable-pagination"] = "True"
         return headers
@@ -85,24 +937,76 @@ class RequestMaker:
         full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
         return full_url
 
-    def get(self, uri, query=None, cache=False, paginate=True, **parameters):
+    def _send(self, method, send, full_url, **kwargs):
+        """
+        Send the request through the rate limiter and the retry policy
+        """
+        if self.rate_limiter is not None:
+            send = self.rate_limiter.limit(send)
+        return self.retry.call(method, send, full_url, **kwargs)
+
+    def cache_key(self, full_url, query=None, paginate=True, lazy=True):
+        """
+        Key identifying a GET request in the cache
+
+        :param full_url: the requested URL
+        :param query: the query parameters
+        :param paginate: whether the request is paginated
+        :param lazy: whether the pagination is lazy, i.e. without the total count of the objects
+        """
+        key = full_url
+        if query:
+            key = "{}?{}".format(key, urlencode(sorted(query.items()), doseq=True))
+        if not paginate:
+            key = "{}#unpaginated".format(key)
+        elif not lazy:
+            key = "{}#counted".format(key)
+        return key
+
+    def _cache_lookup(self, key):
+        """
+        Look up the cache, returns the fresh cached response and the stale one to revalidate (if any)
+        """
+        try:
+            return self._cache.get(key), None
+        except RequestCacheInvalidException:
+            try:
+                return None, self._cache.get_stale(key)
+            except RequestCacheException:
+                return None, None
+        except RequestCacheException:
+            return None, None
+
+    def _cache_store(self, key, result, stale, cache_time=None):
+        """
+        Store the response in the cache, returns the response to hand to the caller
+        """
+        if stale is not None and result.status_code == 304:
+            self._cache.touch(key)
+            return stale
+        if not self.is_bad_response(result):
+            self._cache.put_response(key, result, cache_time, self.json_codec)
+        return result
+
+    def get(self, uri, query=None, cache=False, paginate=True, lazy=True, cache_time=None, **parameters):
         try:
             full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
 
-            result = None
+            result = stale = None
 
             if cache:
-                try:
-                    result = self._cache.get(full_url)
-                except RequestCacheException:
-                    pass
+                cache_key = self.cache_key(full_url, query, paginate, lazy)
+                result, stale = self._cache_lookup(cache_key)
 
             if not result:
-                result = requests.get(
-                    full_url, headers=self.headers(paginate), params=query or {}, verify=self.tls_verify
+                headers = self.headers(paginate, lazy)
+                if stale is not None:
+                    headers.update(stale.conditional_headers())
+                result = self._send(
+                    "GET", self.session.get, full_url, headers=headers, params=query or {}, verify=self.tls_verify
                 )
-            if cache:
-                self._cache.put(full_url, result)
+                if cache:
+                    result = self._cache_store(cache_key, result, stale, cache_time)
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "Network error!", "GET")
         if not self.is_bad_response(result):
@@ -119,12 +1023,59 @@ class RequestMaker:
             data = payload
         else:
             headers = self.headers()
-            data = json.dumps(payload)
+            data = self.json_codec.dumps(payload)
             files = {}
         try:
             full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
-            result = requests.post(
-                full_url, headers=headers, data=data, params=query or {}, files=files, verify=self.tls_verify
+            result = self._send(
+                "POST",
+                self.session.post,
+                full_url,
+                headers=headers,
+                data=data,
+                params=query or {},
+                files=files,
+                verify=self.tls_verify,
+            )
+        except RequestException:
+            raise exceptions.TaigaRestException(full_url, 400, "Network error!", "POST")
+        if not self.is_bad_response(result):
+            return result
+        else:
+            raise exceptions.TaigaRestException(full_url, result.status_code, result.text, "POST")
+
+    def _upload_headers(self, stream):
+        headers = {
+            "Authorization": "{} {}".format(self.token_type, self.token),
+            "Content-type": stream.content_type,
+            "x-disable-pagination": "True",
+        }
+        if stream.len is not None:
+            headers["Content-Length"] = "{}".format(stream.len)
+        return headers
+
+    def upload(self, uri, fields=None, files=None, query=None, progress=None, chunk_size=None, **parameters):
+        """
+        POST a ``multipart/form-data`` body streamed from the files, see :class:`MultipartStream`
+
+        :param uri: the URI, formatted with ``parameters``
+        :param fields: the form fields, by name
+        :param files: the file objects, by name
+        :param query: the query parameters
+        :param progress: callable called with the number of bytes sent and the length of the body
+        :param chunk_size: number of bytes of the files read at a time
+        """
+        stream = MultipartStream(fields, files, chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE, progress)
+        try:
+            full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
+            result = self._send(
+                "POST",
+                self.session.post,
+                full_url,
+                headers=self._upload_headers(stream),
+                data=stream,
+                params=query or {},
+                verify=self.tls_verify,
             )
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "Network error!", "POST")
@@ -136,7 +1087,14 @@ class RequestMaker:
     def delete(self, uri, query=None, **parameters):
         try:
             full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
-            result = requests.delete(full_url, headers=self.headers(), params=query or {}, verify=self.tls_verify)
+            result = self._send(
+                "DELETE",
+                self.session.delete,
+                full_url,
+                headers=self.headers(),
+                params=query or {},
+                verify=self.tls_verify,
+            )
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "Network error!", "DELETE")
         if not self.is_bad_response(result):
@@ -147,8 +1105,14 @@ class RequestMaker:
     def put(self, uri, payload=None, query=None, **parameters):
         try:
             full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
-            result = requests.put(
-                full_url, headers=self.headers(), data=json.dumps(payload), params=query or {}, verify=self.tls_verify
+            result = self._send(
+                "PUT",
+                self.session.put,
+                full_url,
+                headers=self.headers(),
+                data=self.json_codec.dumps(payload),
+                params=query or {},
+                verify=self.tls_verify,
             )
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "Network error!", "PUT")
@@ -160,8 +1124,14 @@ class RequestMaker:
     def patch(self, uri, payload=None, query=None, **parameters):
         try:
             full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
-            result = requests.patch(
-                full_url, headers=self.headers(), data=json.dumps(payload), params=query or {}, verify=self.tls_verify
+            result = self._send(
+                "PATCH",
+                self.session.patch,
+                full_url,
+                headers=self.headers(),
+                data=self.json_codec.dumps(payload),
+                params=query or {},
+                verify=self.tls_verify,
             )
         except RequestException:
             raise exceptions.TaigaRestException(full_url, 400, "Network error!", "PATCH")
@@ -169,3 +1139,137 @@ class RequestMaker:
             return result
         else:
             raise exceptions.TaigaRestException(full_url, result.status_code, result.text, "PATCH")
+
+
+class AsyncRequestMaker(RequestMaker):
+    """
+    Asynchronous counterpart of :class:`RequestMaker`
+
+    Every verb method is a coroutine; calls go through a single :class:`httpx.AsyncClient`, so a single event loop
+    can drive many concurrent requests over a pool of kept-alive connections.
+
+    :param api_path: path of the API on the host
+    :param host: the host of your Taiga.io instance
+    :param token: the authentication token
+    :param token_type: the token type
+    :param tls_verify: verify server certificate
+    :param enable_pagination: use remote pagination
+    :param session: a :class:`httpx.AsyncClient` to share; if not provided a new one is created and owned
+    :param pool_maxsize: number of connections of the client created by the instance
+    :param request_cache: the :class:`RequestCache` to use; if not provided a new one is created
+    :param retry: the :class:`RetryPolicy` of the calls; if not provided the calls are not retried
+    :param rate_limiter: the :class:`RateLimiter` of the calls, retries included; if not provided the calls
+                         are not limited
+    :param json_codec: the :class:`JSONCodec` of the payloads and responses; if not provided the fastest
+                       installed JSON library is used
+    """
+
+    def __init__(
+        self,
+        api_path,
+        host,
+        token,
+        token_type="Bearer",
+        tls_verify=True,
+        enable_pagination=True,
+        session=None,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        request_cache=None,
+        retry=None,
+        rate_limiter=None,
+        json_codec=None,
+    ):
+        owns_session = session is None
+        if session is None:
+            session = build_async_session(pool_maxsize, tls_verify)
+        super().__init__(
+            api_path,
+            host,
+            token,
+            token_type,
+            tls_verify,
+            enable_pagination,
+            session=session,
+            request_cache=request_cache,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            json_codec=json_codec,
+        )
+        self._owns_session = owns_session
+
+    async def close(self):
+        """
+        Close the underlying client, if it has been created by this instance
+        """
+        if self._owns_session:
+            await self.session.aclose()
+
+    async def _send(self, method, send, full_url, **kwargs):
+        """
+        Send the request through the rate limiter and the retry policy
+        """
+        if self.rate_limiter is not None:
+            send = self.rate_limiter.async_limit(send)
+        return await self.retry.async_call(method, send, full_url, **kwargs)
+
+    async def _request(self, method, full_url, **kwargs):
+        try:
+            result = await self._send(method, functools.partial(self.session.request, method), full_url, **kwargs)
+        except httpx.HTTPError:
+            raise exceptions.TaigaRestException(full_url, 400, "Network error!", method)
+        if self.is_bad_response(result):
+            raise exceptions.TaigaRestException(full_url, result.status_code, result.text, method)
+        return result
+
+    async def get(self, uri, query=None, cache=False, paginate=True, lazy=True, cache_time=None, **parameters):
+        full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
+        stale = None
+        if cache:
+            cache_key = self.cache_key(full_url, query, paginate, lazy)
+            result, stale = self._cache_lookup(cache_key)
+            if result:
+                return result
+        headers = self.headers(paginate, lazy)
+        if stale is not None:
+            headers.update(stale.conditional_headers())
+        result = await self._request("GET", full_url, headers=headers, params=query or {})
+        if cache:
+            result = self._cache_store(cache_key, result, stale, cache_time)
+        return result
+
+    async def post(self, uri, payload=None, query=None, files=None, **parameters):
+        full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
+        if files:
+            headers = {
+                "Authorization": "{} {}".format(self.token_type, self.token),
+                "x-disable-pagination": "True",
+            }
+            return await self._request(
+                "POST", full_url, headers=headers, data=payload, files=files, params=query or {}
+            )
+        return await self._request(
+            "POST", full_url, headers=self.headers(), content=self.json_codec.dumps(payload), params=query or {}
+        )
+
+    async def upload(self, uri, fields=None, files=None, query=None, progress=None, chunk_size=None, **parameters):
+        full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
+        stream = MultipartStream(fields, files, chunk_size or DEFAULT_UPLOAD_CHUNK_SIZE, progress)
+        return await self._request(
+            "POST", full_url, headers=self._upload_headers(stream), content=_AsyncIterable(stream), params=query or {}
+        )
+
+    async def delete(self, uri, query=None, **parameters):
+        full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
+        return await self._request("DELETE", full_url, headers=self.headers(), params=query or {})
+
+    async def put(self, uri, payload=None, query=None, **parameters):
+        full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
+        return await self._request(
+            "PUT", full_url, headers=self.headers(), content=self.json_codec.dumps(payload), params=query or {}
+        )
+
+    async def patch(self, uri, payload=None, query=None, **parameters):
+        full_url = self.urljoin(self.host, self.api_path, uri.format(**parameters))
+        return await self._request(
+            "PATCH", full_url, headers=self.headers(), content=self.json_codec.dumps(payload), params=query or {}
+        )
@@ -0,0 +1,238 @@
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import taiga.exceptions
+from taiga import AsyncTaigaAPI
+from taiga.models import Issue, Project, UserStory
+from taiga.requestmaker import AsyncRequestMaker, RetryPolicy
+
+from .tools import MockResponse, create_mock_json
+
+
+def mock_transport(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestAsyncRequestMaker(unittest.IsolatedAsyncioTestCase):
+    async def test_call_get(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=[{"id": 1}])
+
+        rm = AsyncRequestMaker("/api/v1", "http://host", "f4k3", session=mock_transport(handler))
+        response = await rm.get("/{endpoint}", endpoint="nowhere", query={"project": 1})
+        self.assertEqual(response.json(), [{"id": 1}])
+        self.assertEqual(str(requests[0].url), "http://host/api/v1/nowhere?project=1")
+        self.assertEqual(requests[0].headers["Authorization"], "Bearer f4k3")
+        self.assertEqual(requests[0].headers["x-lazy-pagination"], "True")
+
+    async def test_call_post_payload(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={"id": 1})
+
+        rm = AsyncRequestMaker("/api/v1", "http://host", "f4k3", session=mock_transport(handler))
+        await rm.post("/nowhere", payload={"subject": "US"})
+        self.assertEqual(requests[0].method, "POST")
+        self.assertEqual(json.loads(requests[0].content), {"subject": "US"})
+
+    async def test_call_upload(self):
+        requests = []
+
+        def handler(request):
+            requests.append((request, request.read()))
+            return httpx.Response(201, json={"id": 1})
+
+        rm = AsyncRequestMaker("/api/v1", "http://host", "f4k3", session=mock_transport(handler))
+        progress = []
+        await rm.upload(
+            "/nowhere",
+            fields={"project": 1},
+            files={"attached_file": io.BytesIO(b"content")},
+            progress=lambda sent, total: progress.append(sent),
+        )
+        request, body = requests[0]
+        self.assertEqual(request.headers["Content-Length"], str(len(body)))
+        self.assertTrue(request.headers["Content-Type"].startswith("multipart/form-data; boundary="))
+        self.assertIn(b"\r\n\r\ncontent\r\n", body)
+        self.assertEqual(progress[-1], len(body))
+
+    async def test_call_raise_exception_on_bad_response(self):
+        rm = AsyncRequestMaker(
+            "/api/v1", "http://host", "f4k3", session=mock_transport(lambda request: httpx.Response(400))
+        )
+        for method in (rm.get, rm.post, rm.put, rm.patch, rm.delete):
+            with self.assertRaises(taiga.exceptions.TaigaRestException):
+                await method("/nowhere")
+
+    async def test_call_raise_exception_on_network_error(self):
+        def handler(request):
+            raise httpx.ConnectError("unreachable")
+
+        rm = AsyncRequestMaker("/api/v1", "http://host", "f4k3", session=mock_transport(handler))
+        with self.assertRaises(taiga.exceptions.TaigaRestException):
+            await rm.get("/nowhere")
+
+    @patch("taiga.requestmaker.asyncio.sleep")
+    async def test_call_retried_on_throttle(self, sleep):
+        responses = [httpx.Response(429, headers={"Retry-After": "1"}), httpx.Response(200, json=[])]
+
+        rm = AsyncRequestMaker(
+            "/api/v1",
+            "http://host",
+            "f4k3",
+            session=mock_transport(lambda request: responses.pop(0)),
+            retry=RetryPolicy(),
+        )
+        response = await rm.get("/nowhere")
+        self.assertEqual(response.status_code, 200)
+        sleep.assert_awaited_once_with(1)
+
+
+class TestAsyncTaigaAPI(unittest.IsolatedAsyncioTestCase):
+    async def test_resources(self):
+        api = AsyncTaigaAPI(token="f4k3")
+        self.assertIs(api.projects.instance, Project)
+        self.assertIs(api.issues.requester, api.raw_request)
+        self.assertEqual(api.history.user_story.entity, "userstory")
+        await api.close()
+
+    async def test_auth(self):
+        def handler(request):
+            return httpx.Response(200, content=create_mock_json("tests/resources/auth_user_success.json"))
+
+        async with AsyncTaigaAPI(host="http://host", session=mock_transport(handler)) as api:
+            await api.auth("valid_user", "valid_password")
+            self.assertEqual(api.token, "f4k3")
+            self.assertEqual(api.raw_request.token, "f4k3")
+            self.assertIs(api.raw_request.session, api.session)
+
+    async def test_auth_not_success(self):
+        api = AsyncTaigaAPI(host="http://host", session=mock_transport(lambda request: httpx.Response(401)))
+        with self.assertRaises(taiga.exceptions.TaigaRestException):
+            await api.auth("valid_user", "valid_password")
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.get")
+    async def test_list(self, mock_requestmaker_get):
+        mock_requestmaker_get.return_value = MockResponse(
+            200, create_mock_json("tests/resources/userstories_list_success.json")
+        )
+        api = AsyncTaigaAPI(token="f4k3")
+        user_stories = await api.user_stories.list(project=1)
+        self.assertEqual(len(user_stories), 1)
+        self.assertIsInstance(user_stories[0], UserStory)
+        mock_requestmaker_get.assert_called_once_with("userstories", query={"project": 1}, paginate=True)
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.get")
+    async def test_get(self, mock_requestmaker_get):
+        mock_requestmaker_get.return_value = MockResponse(
+            200, create_mock_json("tests/resources/issue_details_success.json")
+        )
+        api = AsyncTaigaAPI(token="f4k3")
+        issue = await api.issues.get(1)
+        self.assertIsInstance(issue, Issue)
+        mock_requestmaker_get.assert_called_once_with("/{endpoint}/{id}", endpoint="issues", id=1)
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.post")
+    async def test_create(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(
+            200, create_mock_json("tests/resources/task_details_success.json")
+        )
+        api = AsyncTaigaAPI(token="f4k3")
+        await api.tasks.create(1, "Task 1", 2)
+        mock_requestmaker_post.assert_called_once_with(
+            "tasks", payload={"project": 1, "subject": "Task 1", "status": 2}
+        )
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.patch")
+    async def test_patch(self, mock_requestmaker_patch):
+        mock_requestmaker_patch.return_value = MockResponse(200, '{"version": 3}')
+        api = AsyncTaigaAPI(token="f4k3")
+        user_story = UserStory(api.raw_request, id=1, subject="US", version=2)
+        await api.user_stories.patch(user_story, ["subject"], version=2)
+        mock_requestmaker_patch.assert_called_once_with(
+            "/{endpoint}/{id}", endpoint="userstories", id=1, payload={"subject": "US", "version": 2}
+        )
+        self.assertEqual(user_story.version, 3)
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.delete")
+    async def test_delete(self, mock_requestmaker_delete):
+        api = AsyncTaigaAPI(token="f4k3")
+        await api.epics.delete(1)
+        mock_requestmaker_delete.assert_called_once_with("/{endpoint}/{id}", endpoint="epics", id=1, query=None)
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.delete")
+    async def test_delete_move_on_destroy(self, mock_requestmaker_delete):
+        api = AsyncTaigaAPI(token="f4k3")
+        await api.priorities.delete(1, 2)
+        mock_requestmaker_delete.assert_called_once_with(
+            "/{endpoint}/{id}", endpoint="priorities", id=1, query={"moveTo": 2}
+        )
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.get")
+    async def test_instance_methods_not_sending(self, mock_requestmaker_get):
+        mock_requestmaker_get.return_value = MockResponse(
+            200, create_mock_json("tests/resources/project_details_success.json")
+        )
+        api = AsyncTaigaAPI(token="f4k3")
+        project = await api.projects.get(1)
+        self.assertRaises(TypeError, project.list_user_stories)
+        self.assertRaises(TypeError, project.update)
+        self.assertEqual(mock_requestmaker_get.call_count, 1)
+        self.assertEqual(
+            project.requester.get_full_url("/{endpoint}", endpoint="projects"), "https://api.taiga.io/api/v1/projects"
+        )
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.get")
+    async def test_history(self, mock_requestmaker_get):
+        mock_requestmaker_get.return_value = MockResponse(
+            200, create_mock_json("tests/resources/history_success.json")
+        )
+        api = AsyncTaigaAPI(token="f4k3")
+        await api.history.issue.get(1)
+        mock_requestmaker_get.assert_called_once_with(
+            "/{endpoint}/{entity}/{id}", endpoint="history", entity="issue", id=1, paginate=False
+        )
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.post")
+    async def test_bulk_create(self, mock_requestmaker_post):
+        mock_requestmaker_post.side_effect = [MockResponse(200, '[{"id": 1}]'), MockResponse(200, '[{"id": 2}]')]
+        api = AsyncTaigaAPI(token="f4k3")
+        issues = await api.issues.bulk_create(1, ["Issue 1", "Issue 2"], chunk_size=1)
+        self.assertEqual([issue.id for issue in issues], [1, 2])
+        mock_requestmaker_post.assert_called_with(
+            "/{endpoint}/bulk_create", endpoint="issues", payload={"project_id": 1, "bulk_issues": "Issue 2"}
+        )
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.patch")
+    async def test_save(self, mock_requestmaker_patch):
+        mock_requestmaker_patch.return_value = MockResponse(200, '{"version": 3}')
+        api = AsyncTaigaAPI(token="f4k3")
+        user_story = UserStory(api.raw_request, id=1, subject="US", version=2)
+        await api.user_stories.save(user_story)
+        self.assertFalse(mock_requestmaker_patch.called)
+        user_story.subject = "New US"
+        await api.user_stories.save(user_story)
+        mock_requestmaker_patch.assert_called_once_with(
+            "/{endpoint}/{id}", endpoint="userstories", id=1, payload={"subject": "New US", "version": 2}
+        )
+        self.assertEqual(user_story.version, 3)
+        self.assertEqual(user_story.dirty_fields, frozenset())
+
+    @patch("taiga.requestmaker.AsyncRequestMaker.upload")
+    async def test_attach(self, mock_requestmaker_upload):
+        mock_requestmaker_upload.return_value = MockResponse(200, '{"id": 2}')
+        api = AsyncTaigaAPI(token="f4k3")
+        with patch("builtins.open", return_value=io.BytesIO(b"content")) as mock_open:
+            attachment = api.issue_attachments.create(1, 1, "report.txt", stream=True)
+            self.assertFalse(mock_open.return_value.closed)
+            self.assertEqual((await attachment).id, 2)
+            self.assertTrue(mock_open.return_value.closed)
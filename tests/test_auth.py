@@ -5,6 +5,7 @@ import requests
 
 import taiga.exceptions
 from taiga import TaigaAPI
+from taiga.requestmaker import RequestCache, RetryPolicy, get_json_codec
 
 from .tools import MockResponse, create_mock_json
 
@@ -20,32 +21,32 @@ class TestAuth(unittest.TestCase):
         TaigaAPI(host="host")
         self.assertFalse(init.called)
 
-    @patch("taiga.client.requests")
-    def test_auth_success(self, requests):
-        requests.post.return_value = MockResponse(200, create_mock_json("tests/resources/auth_user_success.json"))
+    @patch("taiga.client.requests.Session.post")
+    def test_auth_success(self, requests_post):
+        requests_post.return_value = MockResponse(200, create_mock_json("tests/resources/auth_user_success.json"))
         api = TaigaAPI(host="host")
         api.auth("valid_user", "valid_password")
         self.assertEqual(api.token, "f4k3")
 
-    @patch("taiga.client.requests")
-    def test_auth_not_success(self, requests):
-        requests.post.return_value = MockResponse(401, "Not allowed")
+    @patch("taiga.client.requests.Session.post")
+    def test_auth_not_success(self, requests_post):
+        requests_post.return_value = MockResponse(401, "Not allowed")
         api = TaigaAPI(host="host")
         self.assertRaises(taiga.exceptions.TaigaRestException, api.auth, "valid_user", "valid_password")
 
-    @patch("taiga.client.requests.post")
+    @patch("taiga.client.requests.Session.post")
     def test_auth_connection_error(self, requests_post):
         requests_post.side_effect = requests.RequestException()
         api = TaigaAPI(host="host")
         self.assertRaises(taiga.exceptions.TaigaRestException, api.auth, "valid_user", "valid_password")
 
-    @patch("taiga.client.requests")
-    def test_refresh_token_not_success(self, requests):
-        requests.post.return_value = MockResponse(401, "Not allowed")
+    @patch("taiga.client.requests.Session.post")
+    def test_refresh_token_not_success(self, requests_post):
+        requests_post.return_value = MockResponse(401, "Not allowed")
         api = TaigaAPI(host="host")
         self.assertRaises(taiga.exceptions.TaigaRestException, api.refresh_token, "testToken")
 
-    @patch("taiga.client.requests.post")
+    @patch("taiga.client.requests.Session.post")
     def test_refresh_token_connection_error(self, requests_post):
         requests_post.side_effect = requests.RequestException()
         api = TaigaAPI(host="host")
@@ -55,12 +56,12 @@ class TestAuth(unittest.TestCase):
         api = TaigaAPI(host="host")
         self.assertRaises(ValueError, api.refresh_token)
 
-    @patch("taiga.client.requests.post")
+    @patch("taiga.client.requests.Session.post")
     def test_refresh_token_passed_token(self, requests_post):
         requests_post.return_value = MockResponse(
             200, create_mock_json("tests/resources/auth_refresh_token_success.json")
         )
-        api = TaigaAPI(host="host")
+        api = TaigaAPI(host="host", json_codec=get_json_codec("json"))
         api.refresh_token("testToken")
         requests_post.assert_called_with(
             "host/api/v1/auth/refresh",
@@ -69,7 +70,7 @@ class TestAuth(unittest.TestCase):
             verify=True,
         )
 
-    @patch("taiga.client.requests.post")
+    @patch("taiga.client.requests.Session.post")
     def test_refresh_token_with_auth(self, requests_post):
         requests_post.return_value = MockResponse(200, create_mock_json("tests/resources/auth_user_success.json"))
         api = TaigaAPI(host="host")
@@ -83,3 +84,56 @@ class TestAuth(unittest.TestCase):
         api.refresh_token()
         self.assertEqual(api.token, "newToken")
         self.assertEqual(api.token_refresh, "newRefreshToken")
+
+    @patch("taiga.client.requests.Session.post")
+    def test_session_shared_across_auth(self, requests_post):
+        requests_post.return_value = MockResponse(200, create_mock_json("tests/resources/auth_user_success.json"))
+        session = requests.Session()
+        api = TaigaAPI(host="host", session=session)
+        api.auth("valid_user", "valid_password")
+        self.assertIs(api.raw_request.session, session)
+        requests_post.return_value = MockResponse(
+            200, create_mock_json("tests/resources/auth_refresh_token_success.json")
+        )
+        api.refresh_token()
+        self.assertIs(api.raw_request.session, session)
+        self.assertIs(api.projects.requester.session, session)
+
+    def test_close_owned_session_only(self):
+        session = requests.Session()
+        with patch.object(session, "close") as session_close:
+            with TaigaAPI(host="host", token="f4k3", session=session):
+                pass
+            self.assertFalse(session_close.called)
+        api = TaigaAPI(host="host", token="f4k3")
+        with patch.object(api.session, "close") as session_close:
+            with api:
+                pass
+            self.assertTrue(session_close.called)
+
+    @patch("taiga.client.requests.Session.post")
+    def test_request_cache_shared_across_auth(self, requests_post):
+        requests_post.return_value = MockResponse(200, create_mock_json("tests/resources/auth_user_success.json"))
+        request_cache = RequestCache(max_entries=10)
+        api = TaigaAPI(host="host", request_cache=request_cache)
+        api.auth("valid_user", "valid_password")
+        self.assertIs(api.raw_request.cache, request_cache)
+        requests_post.return_value = MockResponse(
+            200, create_mock_json("tests/resources/auth_refresh_token_success.json")
+        )
+        api.refresh_token()
+        self.assertIs(api.raw_request.cache, request_cache)
+
+    @patch("taiga.requestmaker.time.sleep")
+    @patch("taiga.client.requests.Session.post")
+    def test_auth_retried_on_throttle(self, requests_post, sleep):
+        requests_post.side_effect = [
+            MockResponse(429, "", {"Retry-After": "1"}),
+            MockResponse(200, create_mock_json("tests/resources/auth_user_success.json")),
+        ]
+        retry = RetryPolicy()
+        api = TaigaAPI(host="host", retry=retry)
+        api.auth("valid_user", "valid_password")
+        self.assertEqual(api.token, "f4k3")
+        sleep.assert_called_once_with(1)
+        self.assertIs(api.raw_request.retry, retry)
@@ -1,7 +1,16 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 
-from taiga.requestmaker import RequestCache, RequestCacheInvalidException, RequestCacheMissingException, RequestMaker
+from taiga.requestmaker import (
+    CachedResponse,
+    RequestCache,
+    RequestCacheInvalidException,
+    RequestCacheMissingException,
+    RequestMaker,
+    SqliteRequestCache,
+)
 
 from .tools import MockResponse
 
@@ -29,7 +38,50 @@ class TestRequestCache(unittest.TestCase):
         mock_time.return_value = 101
         self.assertRaises(RequestCacheInvalidException, cache.get, "http://ciao")
 
-    @patch("taiga.requestmaker.requests.get")
+    def test_cache_lru_max_entries(self):
+        cache = RequestCache(max_entries=2)
+        cache.put("http://one", "1")
+        cache.put("http://two", "2")
+        cache.get("http://one")
+        cache.put("http://three", "3")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("http://one"), "1")
+        self.assertEqual(cache.get("http://three"), "3")
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://two")
+
+    def test_cache_lru_max_bytes(self):
+        cache = RequestCache(max_bytes=250)
+        cache.put("http://one", CachedResponse(200, {}, size=100))
+        cache.put("http://two", CachedResponse(200, {}, size=100))
+        cache.put("http://one", CachedResponse(200, {}, size=100))
+        cache.put("http://three", CachedResponse(200, {}, size=100))
+        self.assertEqual(len(cache), 2)
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://two")
+
+    @patch("time.time")
+    def test_cache_sweep(self, mock_time):
+        mock_time.return_value = 0
+        cache = RequestCache(valid_time=10, sweep_interval=30)
+        cache.put("http://one", "1")
+        mock_time.return_value = 20
+        cache.put("http://two", "2")
+        self.assertEqual(len(cache), 2)
+        mock_time.return_value = 31
+        cache.put("http://three", "3")
+        self.assertEqual(len(cache), 1)
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://one")
+
+    def test_cached_response(self):
+        response = MockResponse(
+            200, '{"attributes_values": {"1": "a"}}', {"ETag": "abc", "Set-Cookie": "x", "X-Pagination-Next": "url"}
+        )
+        cached = CachedResponse.from_response(response)
+        self.assertEqual(cached.headers, {"ETag": "abc", "X-Pagination-Next": "url"})
+        self.assertEqual(cached.size, len(response.content))
+        cached.json()["attributes_values"]["1"] = "b"
+        self.assertEqual(cached.json(), {"attributes_values": {"1": "a"}})
+
+    @patch("taiga.requestmaker.requests.Session.get")
     @patch("time.time")
     def test_call_requests_get_with_cache(self, mock_time, requests_get):
         mock_time.return_value = 0
@@ -46,3 +98,139 @@ class TestRequestCache(unittest.TestCase):
         mock_time.return_value = 61
         rm.get("/nowhere", cache=True)
         self.assertEqual(requests_get.call_count, 3)
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    @patch("time.time")
+    def test_call_requests_get_with_cache_revalidation(self, mock_time, requests_get):
+        mock_time.return_value = 0
+        rm = RequestMaker(api_path="/", host="host", token="f4k3")
+        requests_get.return_value = MockResponse(200, '{"id": 1}', {"ETag": '"v1"'})
+        self.assertEqual(rm.get("/nowhere", cache=True).json(), {"id": 1})
+        self.assertNotIn("If-None-Match", requests_get.call_args[1]["headers"])
+        mock_time.return_value = 61
+        requests_get.return_value = MockResponse(304, "")
+        self.assertEqual(rm.get("/nowhere", cache=True).json(), {"id": 1})
+        self.assertEqual(requests_get.call_count, 2)
+        self.assertEqual(requests_get.call_args[1]["headers"]["If-None-Match"], '"v1"')
+        mock_time.return_value = 100
+        rm.get("/nowhere", cache=True)
+        self.assertEqual(requests_get.call_count, 2)
+        mock_time.return_value = 200
+        requests_get.return_value = MockResponse(200, '{"id": 2}', {"ETag": '"v2"'})
+        self.assertEqual(rm.get("/nowhere", cache=True).json(), {"id": 2})
+        self.assertEqual(requests_get.call_args[1]["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(rm.cache.get(rm.get_full_url("/nowhere")).headers["ETag"], '"v2"')
+
+    @patch("time.time")
+    def test_cache_entry_valid_time(self, mock_time):
+        mock_time.return_value = 0
+        cache = RequestCache(valid_time=100)
+        cache.put("http://short", "value", valid_time=10)
+        cache.put("http://default", "value")
+        mock_time.return_value = 11
+        self.assertRaises(RequestCacheInvalidException, cache.get, "http://short")
+        self.assertEqual(cache.get("http://default"), "value")
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    def test_call_requests_get_with_cache_query(self, requests_get):
+        rm = RequestMaker(api_path="/", host="host", token="f4k3")
+        requests_get.return_value = MockResponse(200, "")
+        rm.get("/nowhere", query={"project": 1, "status": 2}, cache=True)
+        rm.get("/nowhere", query={"status": 2, "project": 1}, cache=True)
+        self.assertEqual(requests_get.call_count, 1)
+        rm.get("/nowhere", query={"project": 2}, cache=True)
+        self.assertEqual(requests_get.call_count, 2)
+        rm.get("/nowhere", query={"project": 2}, cache=True, paginate=False)
+        self.assertEqual(requests_get.call_count, 3)
+        rm.get("/nowhere", query={"project": 2}, cache=True, lazy=False)
+        self.assertEqual(requests_get.call_count, 4)
+        self.assertNotIn("x-lazy-pagination", requests_get.call_args[1]["headers"])
+
+    @patch("time.time")
+    def test_cache_stale_time(self, mock_time):
+        mock_time.return_value = 0
+        cache = RequestCache(valid_time=10, stale_time=20)
+        cache.put("http://etag", CachedResponse(200, {}, {"ETag": "abc"}))
+        cache.put("http://plain", CachedResponse(200, {}))
+        mock_time.return_value = 15
+        self.assertRaises(RequestCacheInvalidException, cache.get, "http://etag")
+        self.assertRaises(RequestCacheInvalidException, cache.get, "http://plain")
+        self.assertTrue(cache.get_stale("http://etag"))
+        self.assertRaises(RequestCacheMissingException, cache.get_stale, "http://plain")
+        mock_time.return_value = 31
+        self.assertRaises(RequestCacheMissingException, cache.get_stale, "http://etag")
+
+
+class TestSqliteRequestCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_cache_put_get(self):
+        cache = SqliteRequestCache(self.path)
+        cache.put("http://ciao", "value")
+        cache.put("http://response", CachedResponse(200, {"id": 1}, {"ETag": "abc"}, 9))
+        self.assertEqual(cache.get("http://ciao"), "value")
+        response = cache.get("http://response")
+        self.assertEqual(response.json(), {"id": 1})
+        self.assertEqual(response.headers, {"ETag": "abc"})
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://hola")
+        cache.remove("http://ciao")
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://ciao")
+
+    def test_cache_shared(self):
+        SqliteRequestCache(self.path).put("http://ciao", "value")
+        self.assertEqual(SqliteRequestCache(self.path).get("http://ciao"), "value")
+
+    @patch("time.time")
+    def test_cache_valid_time(self, mock_time):
+        mock_time.return_value = 0
+        cache = SqliteRequestCache(self.path, valid_time=100, stale_time=50)
+        cache.put("http://ciao", "value")
+        cache.put("http://etag", CachedResponse(200, {}, {"ETag": "abc"}))
+        mock_time.return_value = 101
+        self.assertRaises(RequestCacheInvalidException, cache.get, "http://ciao")
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://ciao")
+        self.assertRaises(RequestCacheInvalidException, cache.get, "http://etag")
+        self.assertTrue(cache.get_stale("http://etag"))
+        cache.touch("http://etag")
+        self.assertTrue(cache.get("http://etag"))
+        mock_time.return_value = 300
+        cache.sweep()
+        self.assertEqual(len(cache), 0)
+
+    @patch("time.time")
+    def test_cache_lru(self, mock_time):
+        mock_time.return_value = 0
+        cache = SqliteRequestCache(self.path, max_entries=2)
+        cache.put("http://one", "1")
+        mock_time.return_value = 1
+        cache.put("http://two", "2")
+        mock_time.return_value = 2
+        cache.get("http://one")
+        mock_time.return_value = 3
+        cache.put("http://three", "3")
+        self.assertEqual(len(cache), 2)
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://two")
+
+    @patch("time.time")
+    def test_cache_lru_max_bytes(self, mock_time):
+        mock_time.return_value = 0
+        cache = SqliteRequestCache(self.path, max_bytes=250)
+        for index, key in enumerate(["http://one", "http://two", "http://one", "http://three"]):
+            mock_time.return_value = index
+            cache.put(key, CachedResponse(200, {}, size=100))
+        self.assertEqual(len(cache), 2)
+        self.assertRaises(RequestCacheMissingException, cache.get, "http://two")
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    def test_call_requests_get_with_cache(self, requests_get):
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", request_cache=SqliteRequestCache(self.path))
+        requests_get.return_value = MockResponse(200, '{"id": 1}')
+        rm.get("/nowhere", cache=True)
+        other = RequestMaker(api_path="/", host="host", token="f4k3", request_cache=SqliteRequestCache(self.path))
+        self.assertEqual(other.get("/nowhere", cache=True).json(), {"id": 1})
+        self.assertEqual(requests_get.call_count, 1)
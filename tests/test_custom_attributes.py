@@ -1,7 +1,9 @@
+import json
 import unittest
 from unittest.mock import patch
 
-from taiga.models import Issue, IssueAttribute, IssueAttributes
+from taiga.exceptions import TaigaRestException
+from taiga.models import Issue, IssueAttribute, IssueAttributes, Issues
 from taiga.requestmaker import RequestMaker
 
 from .tools import MockResponse, create_mock_json
@@ -27,7 +29,7 @@ class TestCustomAttributes(unittest.TestCase):
             "/{endpoint}/custom-attributes-values/{id}",
             endpoint=Issue.endpoint,
             id=issue.id,
-            payload={"attributes_values": {"1": 13}, "version": 1},
+            payload={"attributes_values": {"1": 13}, "version": 2},
         )
 
     @patch("taiga.requestmaker.RequestMaker.get")
@@ -51,3 +53,89 @@ class TestCustomAttributes(unittest.TestCase):
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
         issue_attribute = IssueAttributes(rm).create(1, "new attribute")
         self.assertTrue(isinstance(issue_attribute, IssueAttribute))
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_get_attributes_many(self, mock_requestmaker_get):
+        def get(uri, id, **parameters):
+            if id == 3:
+                raise TaigaRestException(uri, 404, "Not found")
+            return MockResponse(200, json.dumps({"issue": id, "attributes_values": {}, "version": 1}))
+
+        mock_requestmaker_get.side_effect = get
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        result = Issues(rm).get_attributes_many([1, 2, 3])
+        self.assertFalse(result.ok)
+        self.assertEqual(sorted(result.results), [1, 2])
+        self.assertEqual(result.results[2]["issue"], 2)
+        self.assertIsInstance(result.errors[3], TaigaRestException)
+        mock_requestmaker_get.assert_any_call(
+            "/{endpoint}/custom-attributes-values/{id}", endpoint="issues", id=1, cache=False
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_set_attributes_many(self, mock_requestmaker_patch, mock_requestmaker_get):
+        mock_requestmaker_get.side_effect = lambda uri, id, **parameters: MockResponse(
+            200, json.dumps({"issue": id, "attributes_values": {"1": "old", "2": "kept"}, "version": id + 1})
+        )
+        mock_requestmaker_patch.side_effect = lambda uri, id, payload, **parameters: MockResponse(
+            200, json.dumps(dict(payload, issue=id, version=payload["version"] + 1))
+        )
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        result = Issues(rm).set_attributes_many({1: {1: "new"}, 2: {"3": "added"}})
+        self.assertTrue(result.ok)
+        self.assertEqual(result.results[1]["attributes_values"], {"1": "new", "2": "kept"})
+        mock_requestmaker_patch.assert_any_call(
+            "/{endpoint}/custom-attributes-values/{id}",
+            endpoint="issues",
+            id=2,
+            payload={"attributes_values": {"1": "old", "2": "kept", "3": "added"}, "version": 3},
+        )
+        mock_requestmaker_get.assert_any_call(
+            "/{endpoint}/custom-attributes-values/{id}", endpoint="issues", id=1, cache=True
+        )
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    @patch("taiga.requestmaker.requests.Session.patch")
+    def test_set_attributes_uses_cached_version(self, requests_patch, requests_get):
+        requests_get.return_value = MockResponse(
+            200, json.dumps({"issue": 1, "attributes_values": {"1": "old"}, "version": 2})
+        )
+        requests_patch.side_effect = lambda url, data, **kwargs: MockResponse(
+            200, json.dumps(dict(json.loads(data), issue=1, version=json.loads(data)["version"] + 1))
+        )
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        issue = Issue(rm, id=1, project=1)
+        issue.get_attributes()
+        issue.set_attributes({1: "new", 2: "added"})
+        issue.set_attribute(3, "again")
+        self.assertEqual(requests_get.call_count, 1)
+        self.assertEqual(
+            json.loads(requests_patch.call_args_list[0][1]["data"]),
+            {"attributes_values": {"1": "new", "2": "added"}, "version": 2},
+        )
+        self.assertEqual(
+            json.loads(requests_patch.call_args_list[1][1]["data"]),
+            {"attributes_values": {"1": "new", "2": "added", "3": "again"}, "version": 3},
+        )
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    @patch("taiga.requestmaker.requests.Session.patch")
+    def test_set_attributes_conflict_drops_cached_version(self, requests_patch, requests_get):
+        requests_get.side_effect = [
+            MockResponse(200, json.dumps({"issue": 1, "attributes_values": {"1": "old"}, "version": 3})),
+            MockResponse(200, json.dumps({"issue": 1, "attributes_values": {"1": "theirs"}, "version": 4})),
+        ]
+        requests_patch.side_effect = [
+            MockResponse(400, '{"version": "The version doesn\'t match"}'),
+            MockResponse(200, json.dumps({"issue": 1, "attributes_values": {"1": "new"}, "version": 5})),
+        ]
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        issue = Issue(rm, id=1, project=1)
+        self.assertRaises(TaigaRestException, issue.set_attribute, 1, "new")
+        issue.set_attribute(1, "new")
+        self.assertEqual(requests_get.call_count, 2)
+        self.assertEqual(
+            json.loads(requests_patch.call_args_list[1][1]["data"]),
+            {"attributes_values": {"1": "new"}, "version": 4},
+        )
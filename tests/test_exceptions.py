@@ -16,3 +16,15 @@ class TestExceptions(unittest.TestCase):
         error_message = "Plain message error."
         taiga_exception = taiga.exceptions.TaigaRestException("uri", 500, error_message)
         self.assertEqual(str(taiga_exception), "Plain message error.")
+
+    def test_version_conflict(self):
+        conflict = taiga.exceptions.TaigaRestException(
+            "uri", 400, '{"version": "The version doesn\'t match with the current one"}', "PATCH"
+        )
+        self.assertTrue(conflict.is_version_conflict())
+        self.assertTrue(taiga.exceptions.TaigaRestException("uri", 409).is_version_conflict())
+        self.assertFalse(
+            taiga.exceptions.TaigaRestException("uri", 400, '{"subject": "Required"}').is_version_conflict()
+        )
+        self.assertFalse(taiga.exceptions.TaigaRestException("uri", 400, "Plain message error.").is_version_conflict())
+        self.assertFalse(taiga.exceptions.TaigaRestException("uri", 500, '{"version": "?"}').is_version_conflict())
@@ -15,7 +15,7 @@ class TestIssueTypes(unittest.TestCase):
         IssueTypes(rm).create(1, "IT 1")
         mock_new_resource.assert_called_with(payload={"project": 1, "name": "IT 1"})
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_delete_issue_types(self, requests_delete):
         rm = RequestMaker(api_path="/api/v1", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(204, "")
@@ -27,7 +27,7 @@ class TestIssueTypes(unittest.TestCase):
             verify=True,
         )
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_delete_issue_type(self, requests_delete):
         rm = RequestMaker(api_path="/api/v1", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(204, "")
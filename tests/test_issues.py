@@ -96,3 +96,16 @@ class TestIssues(unittest.TestCase):
         issue = Issue(rm, id=1)
         issue.add_comment("hola")
         mock_update.assert_called_with(comment="hola")
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_create(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(200, '[{"id": 1}, {"id": 2}]')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        issues = Issues(rm).bulk_create(1, ("Issue {}".format(i) for i in range(2)))
+        self.assertEqual(len(issues), 2)
+        self.assertIsInstance(issues[0], Issue)
+        mock_requestmaker_post.assert_called_once_with(
+            "/{endpoint}/bulk_create",
+            endpoint="issues",
+            payload={"project_id": 1, "bulk_issues": "Issue 0\nIssue 1"},
+        )
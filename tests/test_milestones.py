@@ -3,7 +3,7 @@ import unittest
 from unittest.mock import patch
 
 from taiga import TaigaAPI
-from taiga.models import Milestones, UserStory
+from taiga.models import Milestone, Milestones, UserStory
 from taiga.requestmaker import RequestMaker
 
 from .tools import MockResponse, create_mock_json
@@ -74,3 +74,21 @@ class TestMilestones(unittest.TestCase):
         milestone = api.milestones.get(1)
         milestone.stats()
         mock_requestmaker_get.assert_called_with("/{endpoint}/{id}/stats", endpoint="milestones", id=milestone.id)
+
+    @patch("taiga.models.UserStories.bulk_update_milestone")
+    def test_move_user_stories(self, mock_bulk_update):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        Milestone(rm, id=2, project=1).move_user_stories([3, 4])
+        mock_bulk_update.assert_called_once_with(1, 2, [3, 4])
+
+    @patch("taiga.models.UserStories.bulk_update_sprint_order")
+    def test_order_user_stories(self, mock_bulk_update):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        Milestone(rm, id=2, project=1).order_user_stories([4, 3], before=5)
+        mock_bulk_update.assert_called_once_with(1, 2, [4, 3], before=5, after=None)
+
+    @patch("taiga.models.Tasks.bulk_update_milestone")
+    def test_move_tasks(self, mock_bulk_update):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        Milestone(rm, id=2, project=1).move_tasks([3])
+        mock_bulk_update.assert_called_once_with(1, 2, [3])
@@ -1,10 +1,14 @@
+import copy
 import datetime
 import json
 import unittest
 from unittest.mock import patch
 
-from taiga.models import Projects
-from taiga.models.base import InstanceResource, ListResource, SearchableList
+import dateutil.tz
+
+from taiga.exceptions import TaigaConflictException, TaigaRestException
+from taiga.models import Issues, Projects
+from taiga.models.base import CONFLICT_LAST_WRITER_WINS, InstanceResource, ListResource, SearchableList, parse_date
 from taiga.requestmaker import RequestMaker
 
 from .tools import MockResponse, create_mock_json
@@ -87,6 +91,179 @@ class TestModelBase(unittest.TestCase):
             "/{endpoint}/{id}", endpoint="fakes", id=1, payload={"param1": "one"}
         )
 
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_save_changed_fields(self, mock_requestmaker_patch):
+        mock_requestmaker_patch.return_value = MockResponse(200, '{"version": 3}')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake = Fakes(rm).parse_list([{"id": 1, "param1": "one", "param2": "two", "version": 2}])[0]
+        self.assertEqual(fake.dirty_fields, frozenset())
+        fake.param2 = "deux"
+        fake.other = "not sent"
+        self.assertEqual(fake.dirty_fields, frozenset(["param2"]))
+        fake.save()
+        mock_requestmaker_patch.assert_called_once_with(
+            "/{endpoint}/{id}", endpoint="fakes", id=1, payload={"param2": "deux", "version": 2}
+        )
+        self.assertEqual(fake.version, 3)
+        self.assertEqual(fake.dirty_fields, frozenset())
+
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_save_without_changes(self, mock_requestmaker_patch):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake = Fake(rm, id=1, param1="one", param2="two", version=2)
+        fake.save()
+        self.assertFalse(mock_requestmaker_patch.called)
+
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_dirty_fields_cleared_by_patch(self, mock_requestmaker_patch):
+        mock_requestmaker_patch.return_value = MockResponse(200, "{}")
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake = Fake(rm, id=1, param1="one", param2="two")
+        fake.param1 = "un"
+        fake.param2 = "deux"
+        copied = copy.copy(fake)
+        fake.patch(["param1"])
+        self.assertEqual(fake.dirty_fields, frozenset(["param2"]))
+        self.assertEqual(copied.dirty_fields, frozenset(["param1", "param2"]))
+        del fake.param2
+        self.assertEqual(fake.dirty_fields, frozenset())
+
+    def test_dirty_fields_compact(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm).parse_list([{"id": 1, "param1": "one"}], compact=True)
+        fake = fakes[0]
+        fake.param1 = "un"
+        self.assertEqual(fakes.filter(param1="un"), [fake])
+        self.assertEqual(fakes.filter(param2="deux"), [])
+        self.assertEqual(fake.dirty_fields, frozenset(["param1"]))
+        self.assertEqual(fake.to_dict(), {"param1": "un"})
+        self.assertEqual(fake.__dict__, {})
+        fake._mark_clean()
+        self.assertEqual(fake.dirty_fields, frozenset())
+
+    def _conflicting_fake(self, rm, mock_requestmaker_get, latest):
+        mock_requestmaker_get.return_value = MockResponse(200, json.dumps(latest))
+        fake = Fakes(rm).parse_list([{"id": 1, "param1": "one", "param2": "two", "version": 2}])[0]
+        fake.param1 = "un"
+        return fake
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    @patch("taiga.requestmaker.RequestMaker.put")
+    def test_update_merges_latest_on_conflict(self, mock_requestmaker_put, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake = self._conflicting_fake(
+            rm, mock_requestmaker_get, {"id": 1, "param1": "one", "param2": "deux", "version": 3}
+        )
+        mock_requestmaker_put.side_effect = [
+            TaigaRestException("fakes/1", 400, '{"version": "The version doesn\'t match"}', "PUT"),
+            MockResponse(200, '{"version": 4}'),
+        ]
+        fake.update(conflict="fail")
+        mock_requestmaker_get.assert_called_once_with("/{endpoint}/{id}", endpoint="fakes", id=1)
+        mock_requestmaker_put.assert_called_with(
+            "/{endpoint}/{id}", endpoint="fakes", id=1, payload={"param1": "un", "param2": "deux"}
+        )
+        self.assertEqual(fake.version, 4)
+        self.assertEqual(fake.dirty_fields, frozenset())
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_patch_conflict_policies(self, mock_requestmaker_patch, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        latest = {"id": 1, "param1": "uno", "param2": "two", "version": 3}
+        conflict = TaigaRestException("fakes/1", 400, '{"version": "The version doesn\'t match"}', "PATCH")
+
+        fake = self._conflicting_fake(rm, mock_requestmaker_get, latest)
+        mock_requestmaker_patch.side_effect = [conflict]
+        with self.assertRaises(TaigaConflictException) as context:
+            fake.patch(["param1"], conflict="fail")
+        self.assertEqual(context.exception.fields, ["param1"])
+
+        fake = self._conflicting_fake(rm, mock_requestmaker_get, latest)
+        mock_requestmaker_patch.side_effect = [conflict, MockResponse(200, "{}")]
+        fake.patch(["param1"], conflict=CONFLICT_LAST_WRITER_WINS)
+        mock_requestmaker_patch.assert_called_with(
+            "/{endpoint}/{id}", endpoint="fakes", id=1, payload={"param1": "un"}
+        )
+
+        fake = self._conflicting_fake(rm, mock_requestmaker_get, latest)
+        mock_requestmaker_patch.side_effect = [conflict, MockResponse(200, "{}")]
+        merges = []
+
+        def merge(field, base, mine, theirs):
+            merges.append((field, base, mine, theirs))
+            return "{}/{}".format(mine, theirs)
+
+        fake.patch(["param1"], conflict=merge)
+        self.assertEqual(merges, [("param1", "one", "un", "uno")])
+        mock_requestmaker_patch.assert_called_with(
+            "/{endpoint}/{id}", endpoint="fakes", id=1, payload={"param1": "un/uno"}
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_patch_conflict_unassigned_fields(self, mock_requestmaker_patch, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        mock_requestmaker_get.return_value = MockResponse(
+            200, '{"id": 1, "subject": "Issue", "description": "new", "version": 3}'
+        )
+        conflict = TaigaRestException("issues/1", 400, '{"version": "The version doesn\'t match"}', "PATCH")
+        issue = Issues(rm).parse_list([{"id": 1, "subject": "Issue", "description": "old", "version": 2}])[0]
+        issue.subject = "New issue"
+        mock_requestmaker_patch.side_effect = [conflict]
+        with self.assertRaises(TaigaConflictException) as context:
+            issue.patch(["subject", "description", "version"], conflict="fail")
+        self.assertEqual(context.exception.fields, ["description"])
+        mock_requestmaker_patch.side_effect = [conflict, MockResponse(200, '{"version": 4}')]
+        issue.patch(["subject", "description", "version"], conflict=CONFLICT_LAST_WRITER_WINS)
+        mock_requestmaker_patch.assert_called_with(
+            "/{endpoint}/{id}",
+            endpoint="issues",
+            id=1,
+            payload={"subject": "New issue", "description": "old", "version": 3},
+        )
+        self.assertEqual(issue.version, 4)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_patch_conflict_in_place_edit(self, mock_requestmaker_patch, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        mock_requestmaker_get.return_value = MockResponse(200, '{"id": 1, "tags": ["x"], "version": 3}')
+        conflict = TaigaRestException("issues/1", 400, '{"version": "The version doesn\'t match"}', "PATCH")
+        issue = Issues(rm).parse_list([{"id": 1, "tags": ["a"], "version": 2}])[0]
+        issue.tags.append("mine")
+        mock_requestmaker_patch.side_effect = [conflict]
+        with self.assertRaises(TaigaConflictException) as context:
+            issue.patch(["tags"], conflict="fail")
+        self.assertEqual(context.exception.fields, ["tags"])
+        self.assertEqual(issue.tags, ["a", "mine"])
+        merges = []
+
+        def merge(field, base, mine, theirs):
+            merges.append((field, base, list(mine), theirs))
+            return theirs + mine
+
+        mock_requestmaker_patch.side_effect = [conflict, MockResponse(200, '{"version": 4}')]
+        issue.patch(["tags"], conflict=merge)
+        self.assertEqual(merges, [("tags", None, ["a", "mine"], ["x"])])
+        mock_requestmaker_patch.assert_called_with(
+            "/{endpoint}/{id}", endpoint="issues", id=1, payload={"tags": ["x", "a", "mine"]}
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    @patch("taiga.requestmaker.RequestMaker.patch")
+    def test_conflict_retries(self, mock_requestmaker_patch, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake = self._conflicting_fake(rm, mock_requestmaker_get, {"id": 1, "param1": "one", "version": 3})
+        mock_requestmaker_patch.side_effect = TaigaRestException("fakes/1", 409, "", "PATCH")
+        self.assertRaises(TaigaRestException, fake.save)
+        self.assertFalse(mock_requestmaker_get.called)
+        mock_requestmaker_patch.reset_mock()
+        self.assertRaises(TaigaRestException, fake.save, conflict="fail", conflict_retries=2)
+        self.assertEqual(mock_requestmaker_patch.call_count, 3)
+        self.assertEqual(mock_requestmaker_get.call_count, 2)
+        self.assertRaises(ValueError, fake.save, conflict="unknown")
+
     @patch("taiga.requestmaker.RequestMaker.patch")
     def test_call_model_base_patch_with_params(self, mock_requestmaker_patch):
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
@@ -196,6 +373,168 @@ class TestModelBase(unittest.TestCase):
         mock_requestmaker_get.assert_called_with("fakes", query={"page_size": 100}, paginate=True)
         self.assertEqual(len(f_list), 9)
 
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_list_parallel(self, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+        headers = {"X-Pagination-Next": True, "X-Pagination-Count": "5", "X-Paginated-By": "2"}
+
+        def get_page(endpoint, query, **kwargs):
+            page = query.get("page", 1)
+            data = [{"id": page * 10 + index} for index in range(2 if page < 3 else 1)]
+            return MockResponse(200, json.dumps(data), headers if page == 1 else {})
+
+        mock_requestmaker_get.side_effect = get_page
+        f_list = fakes.list(page_size=2, parallel=True, max_workers=2)
+        self.assertEqual([fake.id for fake in f_list], [10, 11, 20, 21, 30])
+        self.assertEqual(mock_requestmaker_get.call_count, 3)
+        mock_requestmaker_get.assert_any_call("fakes", query={"page_size": 2}, paginate=True, lazy=False)
+        mock_requestmaker_get.assert_any_call("fakes", query={"page_size": 2, "page": 3})
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_list_parallel_without_count(self, mock_requestmaker_get):
+        js_list = json.loads(create_mock_json("tests/resources/fakes_list_success.json"))
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+
+        data = json.dumps(js_list)
+        mock_requestmaker_get.return_value = MockResponse(
+            200, data, FakeHeaders([True, None, True, False], **{"X-Pagination-Next": True})
+        )
+        f_list = fakes.list(page_size=2, parallel=True)
+        mock_requestmaker_get.assert_called_with("fakes", query={"page": 3, "page_size": 2})
+        self.assertEqual(len(f_list), 27)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_iter(self, mock_requestmaker_get):
+        js_list = json.loads(create_mock_json("tests/resources/fakes_list_success.json"))
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+
+        data = json.dumps(js_list)
+        mock_requestmaker_get.return_value = MockResponse(
+            200, data, FakeHeaders([True, True, False], **{"X-Pagination-Next": True})
+        )
+        iterator = fakes.iter(page_size=2)
+        self.assertFalse(mock_requestmaker_get.called)
+        self.assertIsInstance(next(iterator), Fake)
+        mock_requestmaker_get.assert_called_once_with("fakes", query={"page_size": 2}, paginate=True)
+        self.assertEqual(len(list(iterator)), 26)
+        mock_requestmaker_get.assert_called_with("fakes", query={"page": 3, "page_size": 2})
+        self.assertEqual(mock_requestmaker_get.call_count, 3)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_iter_early_stop(self, mock_requestmaker_get):
+        js_list = json.loads(create_mock_json("tests/resources/fakes_list_success.json"))
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+
+        data = json.dumps(js_list)
+        mock_requestmaker_get.return_value = MockResponse(200, data, {"X-Pagination-Next": True})
+        for index, _fake in enumerate(fakes.iter()):
+            if index == 3:
+                break
+        self.assertEqual(mock_requestmaker_get.call_count, 1)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_list_compact(self, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        mock_requestmaker_get.return_value = MockResponse(
+            200, '[{"id": 1, "param1": "one", "extra": 1}, {"id": 2, "param1": "two", "other": 2}]'
+        )
+        f_list = Fakes(rm).list(compact=True)
+        self.assertIsInstance(f_list[0], Fake)
+        self.assertIs(type(f_list[0]), type(f_list[1]))
+        self.assertIs(type(f_list[0]), Fake.compact_class(["id", "param1", "extra"]))
+        self.assertEqual(f_list[0].__dict__, {})
+        self.assertEqual(f_list[1].__dict__, {"other": 2})
+        self.assertEqual((f_list[0].id, f_list[0].param1, f_list[0].extra), (1, "one", 1))
+        self.assertRaises(AttributeError, getattr, f_list[0], "param2")
+        self.assertEqual(f_list[1].to_dict(), {"param1": "two"})
+        self.assertEqual(repr(f_list[1]), "Fake(2)")
+        f_list[0].param2 = "new"
+        self.assertIs(f_list.get(param2="new"), f_list[0])
+        self.assertEqual(f_list.filter(other=2), [f_list[1]])
+        fake = copy.copy(f_list[1])
+        self.assertEqual((fake.param1, fake.other), ("two", 2))
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_list_raw(self, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+        mock_requestmaker_get.return_value = MockResponse(
+            200,
+            '[{"id": 1, "created_date": "2015-02-10T17:55:05+0000"}]',
+            FakeHeaders([True, False], **{"X-Pagination-Next": True}),
+        )
+        with patch.object(Fake, "parse") as fake_parse:
+            f_list = fakes.list(raw=True)
+            self.assertFalse(fake_parse.called)
+        self.assertEqual(f_list, [{"id": 1, "created_date": "2015-02-10T17:55:05+0000"}] * 2)
+        mock_requestmaker_get.return_value = MockResponse(200, '[{"id": 1}]')
+        self.assertEqual(fakes.list(raw="bytes"), [b'[{"id": 1}]'])
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_get_element_raw(self, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        mock_requestmaker_get.return_value = MockResponse(200, '{"id": 1}')
+        self.assertEqual(Fakes(rm).get(1, raw=True), {"id": 1})
+        self.assertEqual(Fakes(rm).get(1, raw="bytes"), b'{"id": 1}')
+        mock_requestmaker_get.assert_called_with("/{endpoint}/{id}", endpoint="fakes", id=1)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_list_cache(self, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+        mock_requestmaker_get.return_value = MockResponse(200, '[{"id": 1, "param1": "one"}]')
+        f_list = fakes.list(cache=True, param2="two")
+        mock_requestmaker_get.assert_called_once_with("fakes", query={"param2": "two"}, paginate=True)
+        self.assertEqual(len(rm.cache), 0)
+        f_list[0].param1 = "changed"
+        f_list = fakes.list(cache=True, param2="two")
+        self.assertEqual(mock_requestmaker_get.call_count, 1)
+        self.assertIsInstance(f_list, SearchableList)
+        self.assertEqual(f_list[0].param1, "one")
+        fakes.list(cache=True, param2="three")
+        self.assertEqual(mock_requestmaker_get.call_count, 2)
+        fakes.list(param2="two")
+        self.assertEqual(mock_requestmaker_get.call_count, 3)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    @patch("time.time")
+    def test_call_model_base_get_element_cache(self, mock_time, mock_requestmaker_get):
+        mock_time.return_value = 0
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+        mock_requestmaker_get.return_value = MockResponse(200, '{"id": 1, "param1": "one"}')
+        with patch.object(Fake, "cache_time", 5):
+            fake = fakes.get(1, cache=True)
+            mock_requestmaker_get.assert_called_once_with("/{endpoint}/{id}", endpoint="fakes", id=1)
+            self.assertEqual(len(rm.cache), 0)
+            self.assertIsNot(fakes.get(1, cache=True), fake)
+            self.assertEqual(fakes.get(1, cache=True).param1, "one")
+            self.assertEqual(mock_requestmaker_get.call_count, 1)
+            mock_time.return_value = 6
+            fakes.get(1, cache=True)
+            self.assertEqual(mock_requestmaker_get.call_count, 2)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_call_model_base_cache_deep_copies(self, mock_requestmaker_get):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = Fakes(rm)
+        body = '[{"id": 1, "param1": "one", "param2": ["a"], "created_date": "2015-02-10T14:53:27.000Z"}]'
+        mock_requestmaker_get.return_value = MockResponse(200, body)
+        for compact in (False, True):
+            f_list = fakes.list(cache=True, compact=compact)
+            f_list[0].param2.append("b")
+            f_list = fakes.list(cache=True, compact=compact)
+            self.assertEqual(f_list[0].param2, ["a"])
+            self.assertIs(f_list[0].requester, rm)
+            self.assertEqual(f_list[0].dirty_fields, frozenset())
+            self.assertEqual(f_list[0].created_date, parse_date("2015-02-10T14:53:27.000Z"))
+        self.assertEqual(mock_requestmaker_get.call_count, 2)
+        self.assertEqual(rm.object_cache._size, 2 * len(body))
+
     @patch("taiga.requestmaker.RequestMaker.get")
     def test_call_model_base_list_elements_no_paginate(self, mock_requestmaker_get):
         js_list = json.loads(create_mock_json("tests/resources/fakes_list_success.json"))
@@ -214,7 +553,7 @@ class TestModelBase(unittest.TestCase):
         mock_requestmaker_get.assert_called_with("fakes", query={"id": 1}, paginate=False)
         self.assertEqual(len(f_list), 1)
 
-    @patch("taiga.requestmaker.requests.get")
+    @patch("taiga.requestmaker.requests.Session.get")
     def test_call_model_base_list_elements_no_paginate_check_requests(self, mock_requestmaker_get):
         js_list = json.loads(create_mock_json("tests/resources/fakes_list_success.json"))
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
@@ -235,7 +574,7 @@ class TestModelBase(unittest.TestCase):
         )
         self.assertEqual(len(f_list), 9)
 
-    @patch("taiga.requestmaker.requests.get")
+    @patch("taiga.requestmaker.requests.Session.get")
     def test_call_model_base_list_elements_paginate_check_requests(self, mock_requestmaker_get):
         js_list = json.loads(create_mock_json("tests/resources/fakes_list_success.json"))
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
@@ -309,6 +648,96 @@ class TestModelBase(unittest.TestCase):
         self.assertTrue(searchable_list.get(param1="one", param2="a"), 1)
         self.assertTrue(searchable_list.get())
 
+    def test_searchable_list_index(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        searchable_list = SearchableList(Fake(rm, id=i, param1=i % 3, param2=["list"]) for i in range(30))
+        self.assertEqual(searchable_list.get(id=7).id, 7)
+        self.assertEqual(len(searchable_list.filter(param1=1)), 10)
+        self.assertEqual(set(searchable_list._indexes), {"id", "param1"})
+        with patch.object(SearchableList, "__iter__", side_effect=AssertionError("linear scan")):
+            fake = searchable_list.get(id=12)
+            filtered = searchable_list.filter(param1=1)
+            filtered_twice = searchable_list.filter(param1=1, id=4)
+            self.assertIsNone(searchable_list.get(id=100))
+        self.assertEqual(fake.id, 12)
+        self.assertEqual(len(filtered), 10)
+        self.assertEqual([fake.id for fake in filtered_twice], [4])
+        self.assertEqual(len(searchable_list.filter(param2=["list"])), 30)
+        self.assertIsNone(searchable_list._indexes["param2"])
+
+    def test_searchable_list_index_invalidation(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake1 = Fake(rm, id=1, param1="one")
+        fake2 = Fake(rm, id=2, param1="two")
+        searchable_list = SearchableList([fake1, fake2])
+        self.assertIs(searchable_list.get(param1="one"), fake1)
+        fake2.param1 = "one"
+        self.assertEqual(searchable_list.filter(param1="one"), [fake1, fake2])
+        fake3 = Fake(rm, id=3, param1="three")
+        searchable_list.append(fake3)
+        self.assertIs(searchable_list.get(param1="three"), fake3)
+        searchable_list.remove(fake3)
+        self.assertIsNone(searchable_list.get(param1="three"))
+        searchable_list[0] = fake3
+        self.assertIs(searchable_list.get(param1="three"), fake3)
+
+    def test_searchable_list_index_update(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fakes = [Fake(rm, id=i, param1=i % 2) for i in range(4)]
+        searchable_list = SearchableList(fakes)
+        other_list = SearchableList(Fake(rm, id=i, param1=i % 2) for i in range(4))
+        self.assertEqual(searchable_list.filter(param1=0, id__in=[0, 1, 2]), [fakes[0], fakes[2]])
+        self.assertEqual(other_list.get(param1=1).id, 1)
+        attributes = set(fakes[3].__dict__)
+        fakes[3].param1 = 0
+        self.assertEqual(set(searchable_list._indexes), {"id"})
+        self.assertEqual(set(other_list._indexes), {"param1"})
+        self.assertEqual(set(fakes[3].__dict__), attributes | {"_dirty"})
+        self.assertEqual(searchable_list.filter(param1=0), [fakes[0], fakes[2], fakes[3]])
+        del fakes[1].param1
+        self.assertEqual(searchable_list.filter(param1__in=[0, 1]), [fakes[0], fakes[2], fakes[3]])
+        fakes[0].param1 = ["unhashable"]
+        self.assertEqual(searchable_list.filter(param1=0), fakes[2:])
+        self.assertIsNone(searchable_list._indexes["param1"])
+
+    def test_searchable_list_lookups(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake1 = Fake(rm, id=1, param1=10, param2=["bug"], assigned_to=None)
+        fake2 = Fake(rm, id=2, param1=20, param2=["bug", "ui"], assigned_to=5)
+        fake3 = Fake(rm, id=3, param1=30, param2=[], assigned_to=6)
+        fake4 = Fake(rm, id=4, param2=None)
+        searchable_list = SearchableList([fake1, fake2, fake3, fake4])
+        self.assertEqual(searchable_list.filter(id__in=[3, 1, 7]), [fake1, fake3])
+        self.assertEqual(searchable_list.filter(param1__gt=10), [fake2, fake3])
+        self.assertEqual(searchable_list.filter(param1__lte=20), [fake1, fake2])
+        self.assertEqual(searchable_list.filter(param2__contains="bug"), [fake1, fake2])
+        self.assertEqual(searchable_list.filter(assigned_to__isnull=True), [fake1, fake4])
+        self.assertEqual(searchable_list.filter(assigned_to__isnull=False, param1__lt=30), [fake2])
+        self.assertEqual(searchable_list.filter(assigned_to__in=[5, 6], param2__contains="ui"), [fake2])
+        self.assertIs(searchable_list.get(param1__gte=15), fake2)
+
+    def test_searchable_list_order_by(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake1 = Fake(rm, id=1, param1=2, param2="b")
+        fake2 = Fake(rm, id=2, param1=1, param2="b")
+        fake3 = Fake(rm, id=3, param1=None, param2="a")
+        fake4 = Fake(rm, id=4, param1=3, param2="a")
+        searchable_list = SearchableList([fake1, fake2, fake3, fake4])
+        self.assertEqual(searchable_list.order_by("param1"), [fake2, fake1, fake4, fake3])
+        self.assertEqual(searchable_list.order_by("-param1"), [fake4, fake1, fake2, fake3])
+        self.assertEqual(searchable_list.order_by("param2", "-id"), [fake4, fake3, fake2, fake1])
+        self.assertIsInstance(searchable_list.filter(param2="a").order_by("id"), SearchableList)
+
+    def test_searchable_list_group_by(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        fake1 = Fake(rm, id=1, param1="one")
+        fake2 = Fake(rm, id=2, param1="two")
+        fake3 = Fake(rm, id=3, param1="one")
+        fake4 = Fake(rm, id=4)
+        groups = SearchableList([fake1, fake2, fake3, fake4]).group_by("param1")
+        self.assertEqual(groups, {"one": [fake1, fake3], "two": [fake2]})
+        self.assertIsInstance(groups["one"], SearchableList)
+
     @patch("taiga.requestmaker.RequestMaker.put")
     def test_call_model_base_update_2(self, mock_requestmaker_put):
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
@@ -329,6 +758,31 @@ class TestModelBase(unittest.TestCase):
         self.assertFalse(isinstance(fake.created_date, datetime.datetime))
         self.assertTrue(isinstance(fake.modified_date, datetime.datetime))
 
+    def test_datetime_parsing_formats(self):
+        utc = datetime.timezone.utc
+        self.assertEqual(
+            parse_date("2015-02-10T17:55:05.123Z", localize=False),
+            datetime.datetime(2015, 2, 10, 17, 55, 5, 123000, tzinfo=utc),
+        )
+        self.assertEqual(
+            parse_date("2015-02-10T17:55:05.1234567+02:00", localize=False),
+            datetime.datetime(2015, 2, 10, 15, 55, 5, 123456, tzinfo=utc),
+        )
+        self.assertEqual(parse_date("2015-02-10T17:55:05+0000").tzinfo, dateutil.tz.tzlocal())
+        self.assertEqual(parse_date("2015-02-10"), datetime.date(2015, 2, 10))
+        self.assertEqual(parse_date("2015-02-30"), "2015-02-30")
+        self.assertEqual(parse_date("2015-02-10T17:55:05"), "2015-02-10T17:55:05")
+        self.assertIsNone(parse_date(None))
+
+    def test_datetime_parsing_fields(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        with patch.object(Fake, "allowed_params", ["due_date"]), patch.object(Fake, "localize_dates", False):
+            fake = Fake(rm, id=1, due_date="2015-02-10", finished_date="2015-02-10T17:55:05Z", estimated_start=None)
+            self.assertEqual(fake.due_date, datetime.date(2015, 2, 10))
+            self.assertEqual(fake.finished_date.tzinfo, datetime.timezone.utc)
+            self.assertIsNone(fake.estimated_start)
+            self.assertEqual(fake.to_dict(), {"due_date": "2015-02-10"})
+
     def test_repr(self):
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
         fake = Fake(rm, id=1, param1="one", param2="two", param3="three")
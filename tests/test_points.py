@@ -15,7 +15,7 @@ class TestPoints(unittest.TestCase):
         Points(rm).create(1, "Point 1", 4)
         mock_new_resource.assert_called_with(payload={"project": 1, "name": "Point 1", "value": 4})
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_delete_points(self, requests_delete):
         rm = RequestMaker(api_path="/api/v1", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(204, "")
@@ -27,7 +27,7 @@ class TestPoints(unittest.TestCase):
             verify=True,
         )
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_delete_point(self, requests_delete):
         rm = RequestMaker(api_path="/api/v1", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(204, "")
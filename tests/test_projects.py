@@ -1,9 +1,12 @@
+import copy
+import json
 import unittest
 from datetime import datetime
 from unittest.mock import patch
 
 from taiga import TaigaAPI
-from taiga.models import Point, Project, Projects, Severity, SwimLane, User, UserStoryStatus
+from taiga.exceptions import TaigaRestException
+from taiga.models import Epic, Issue, Point, Project, Projects, Severity, SwimLane, User, UserStory, UserStoryStatus
 from taiga.requestmaker import RequestMaker
 
 from .tools import MockResponse, create_mock_json
@@ -25,6 +28,40 @@ class TestProjects(unittest.TestCase):
         self.assertTrue(isinstance(project.us_statuses[0], UserStoryStatus))
         self.assertTrue(isinstance(project.severities[0], Severity))
 
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_single_project_lazy_parsing(self, mock_requestmaker_get):
+        mock_requestmaker_get.return_value = MockResponse(
+            200, create_mock_json("tests/resources/project_details_success.json")
+        )
+        api = TaigaAPI(token="f4k3")
+        with patch("taiga.models.models.Users.parse") as users_parse:
+            users_parse.return_value = ["parsed"]
+            project = api.projects.get(1)
+            self.assertNotIn("members", project.__dict__)
+            self.assertFalse(users_parse.called)
+            copied = copy.copy(project)
+            self.assertEqual(project.members, ["parsed"])
+            self.assertEqual(project.members, ["parsed"])
+            self.assertEqual(users_parse.call_count, 1)
+            self.assertEqual(copied.members, ["parsed"])
+            self.assertEqual(users_parse.call_count, 2)
+        self.assertNotIn("members", project._nested)
+        self.assertIn("members", copied.__dict__)
+        self.assertRaises(AttributeError, getattr, project, "not_an_attribute")
+
+    def test_searchable_list_lazy_parsing(self):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        project = json.loads(create_mock_json("tests/resources/project_details_success.json"))
+        for compact in (False, True):
+            projects = Projects(rm).parse_list([dict(project)], compact=compact)
+            self.assertEqual(projects.filter(members__isnull=True), [])
+            self.assertIsInstance(projects.get(members__isnull=False).members[0], User)
+            if compact:
+                self.assertEqual(projects[0].__dict__, {})
+            projects = Projects(rm).parse_list([dict(project)], compact=compact)
+            self.assertRaises(TypeError, projects.group_by, "roles")
+            self.assertEqual(projects.order_by("-members"), projects)
+
     @patch("taiga.requestmaker.RequestMaker.get")
     def test_list_projects_parsing(self, mock_requestmaker_get):
         mock_requestmaker_get.return_value = MockResponse(
@@ -204,6 +241,13 @@ class TestProjects(unittest.TestCase):
         project.list_issue_statuses()
         mock_list_issue_statuses.assert_called_with(project=1)
 
+    @patch("taiga.models.IssueStatuses.list")
+    def test_list_issue_statuses_raw(self, mock_list_issue_statuses):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        project = Project(rm, id=1)
+        project.list_issue_statuses(raw=True)
+        mock_list_issue_statuses.assert_called_with(project=1, raw=True)
+
     @patch("taiga.models.Priorities.create")
     def test_add_priority(self, mock_new_priority):
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
@@ -362,6 +406,20 @@ class TestProjects(unittest.TestCase):
         project.list_issues()
         mock_list_issues.assert_called_with(project=1)
 
+    @patch("taiga.models.Issues.iter")
+    def test_iter_issues(self, mock_iter_issues):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        project = Project(rm, id=1)
+        project.iter_issues(page_size=10)
+        mock_iter_issues.assert_called_with(project=1, page_size=10)
+
+    @patch("taiga.models.UserStories.iter")
+    def test_iter_userstories(self, mock_iter_userstories):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        project = Project(rm, id=1)
+        project.iter_user_stories()
+        mock_iter_userstories.assert_called_with(project=1)
+
     @patch("taiga.models.UserStories.create")
     def test_add_userstory(self, mock_new_userstory):
         rm = RequestMaker("/api/v1", "fakehost", "faketoken")
@@ -522,3 +580,55 @@ class TestProjects(unittest.TestCase):
         project = Project(rm, id=1)
         project.list_epics()
         mock_list_epics.assert_called_with(project=1)
+
+    @patch("taiga.models.UserStories.bulk_create")
+    def test_add_user_stories(self, mock_bulk_create):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        Project(rm, id=1).add_user_stories(["US 1", "US 2"], status=2)
+        mock_bulk_create.assert_called_with(1, ["US 1", "US 2"], status=2, swimlane=None, chunk_size=None)
+
+    @patch("taiga.models.Issues.bulk_create")
+    def test_add_issues(self, mock_bulk_create):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        Project(rm, id=1).add_issues(["Issue 1"], chunk_size=10)
+        mock_bulk_create.assert_called_with(1, ["Issue 1"], milestone=None, chunk_size=10)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_resolve_refs(self, mock_requestmaker_get):
+        resolved = {1: {"project": 1, "us": 10}, 2: {"project": 1, "issue": 20}, 3: {"project": 1, "epic": 30}}
+
+        def get(uri, query=None, **parameters):
+            if uri == "/resolver":
+                if query["ref"] not in resolved:
+                    raise TaigaRestException(uri, 404, "Not found")
+                return MockResponse(200, json.dumps(resolved[query["ref"]]))
+            return MockResponse(200, json.dumps({"id": parameters["id"]}))
+
+        mock_requestmaker_get.side_effect = get
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        project = Project(rm, id=1, slug="my_slug")
+        items = project.resolve_refs(["#1", 2, "3", 1, 4])
+        self.assertEqual(sorted(items), [1, 2, 3, 4])
+        self.assertIsInstance(items[1], UserStory)
+        self.assertEqual(items[1].id, 10)
+        self.assertIsInstance(items[2], Issue)
+        self.assertIsInstance(items[3], Epic)
+        self.assertIsNone(items[4])
+        resolver_calls = [call for call in mock_requestmaker_get.call_args_list if call[0][0] == "/resolver"]
+        self.assertEqual(len(resolver_calls), 4)
+        mock_requestmaker_get.assert_any_call("/resolver", query={"project": "my_slug", "ref": 1})
+
+        # refs and objects are now cached, for any instance of the project
+        mock_requestmaker_get.reset_mock()
+        items = Project(rm, id=1, slug="my_slug").resolve_refs([1, 2, 3])
+        self.assertEqual(items[2].id, 20)
+        self.assertFalse(mock_requestmaker_get.called)
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_get_item_by_ref_epic(self, mock_requestmaker_get):
+        mock_requestmaker_get.return_value = MockResponse(200, '{"project": 1, "epic": 30}')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        project = Project(rm, id=1, slug="my_slug")
+        with patch.object(project, "get_epic_by_ref") as mock_get_epic_by_ref:
+            project.get_item_by_ref(1)
+            mock_get_epic_by_ref.assert_called_with(1)
@@ -0,0 +1,82 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from taiga import TaigaAPI
+from taiga.requestmaker import RateLimiter, RequestMaker
+
+from .tools import MockResponse, create_mock_json
+
+
+@patch("taiga.requestmaker.time.sleep")
+@patch("taiga.requestmaker.time.monotonic")
+class TestRateLimiter(unittest.TestCase):
+    def test_burst(self, monotonic, sleep):
+        monotonic.return_value = 0
+        limiter = RateLimiter(rate=2, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+        self.assertFalse(sleep.called)
+        limiter.acquire()
+        sleep.assert_called_once_with(0.5)
+
+    def test_reservations_queue(self, monotonic, sleep):
+        monotonic.return_value = 0
+        limiter = RateLimiter(rate=4)
+        self.assertEqual([limiter._reserve() for _ in range(3)], [0, 0.25, 0.5])
+
+    def test_refill(self, monotonic, sleep):
+        monotonic.return_value = 0
+        limiter = RateLimiter(rate=10, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        monotonic.return_value = 0.1
+        limiter.acquire()
+        monotonic.return_value = 10
+        limiter.acquire()
+        limiter.acquire()
+        self.assertFalse(sleep.called)
+        limiter.acquire()
+        self.assertEqual(sleep.call_count, 1)
+
+    def test_invalid(self, monotonic, sleep):
+        self.assertRaises(ValueError, RateLimiter, rate=0)
+        self.assertRaises(ValueError, RateLimiter, rate=1, burst=0)
+
+    def test_thread_safe(self, monotonic, sleep):
+        monotonic.return_value = 0
+        limiter = RateLimiter(rate=100, burst=1)
+        delays = []
+
+        def reserve():
+            for _ in range(50):
+                delays.append(limiter._reserve())
+
+        threads = [threading.Thread(target=reserve) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(round(delay * 100) for delay in delays), list(range(200)))
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    def test_request_maker(self, requests_get, monotonic, sleep):
+        monotonic.return_value = 0
+        requests_get.return_value = MockResponse(200, "")
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", rate_limiter=RateLimiter(rate=1))
+        rm.get("/nowhere")
+        rm.get("/nowhere")
+        self.assertEqual(requests_get.call_count, 2)
+        sleep.assert_called_once_with(1)
+
+    @patch("taiga.client.requests.Session.post")
+    def test_shared_across_auth(self, requests_post, monotonic, sleep):
+        monotonic.return_value = 0
+        requests_post.return_value = MockResponse(200, create_mock_json("tests/resources/auth_user_success.json"))
+        limiter = RateLimiter(rate=1)
+        api = TaigaAPI(host="host", rate_limiter=limiter)
+        api.auth("valid_user", "valid_password")
+        self.assertIs(api.raw_request.rate_limiter, limiter)
+        self.assertFalse(sleep.called)
+        api.auth("valid_user", "valid_password")
+        sleep.assert_called_once_with(1)
@@ -1,30 +1,61 @@
+import io
+import json
 import unittest
 from unittest.mock import patch
 
 import requests
 
 import taiga.exceptions
-from taiga.requestmaker import RequestMaker
+from taiga.requestmaker import (
+    CachedResponse,
+    JSONCodec,
+    MultipartStream,
+    RequestMaker,
+    RequestMakerException,
+    build_session,
+    get_json_codec,
+)
 
 from .tools import MockResponse
 
 
 class TestRequestMaker(unittest.TestCase):
-    @patch("taiga.requestmaker.requests.get")
+    def test_build_session_pool_size(self):
+        session = build_session(pool_connections=3, pool_maxsize=7)
+        adapter = session.get_adapter("https://host")
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertIs(adapter, session.get_adapter("http://host"))
+
+    def test_shared_session(self):
+        session = build_session()
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", session=session)
+        self.assertIs(rm.session, session)
+        with patch.object(session, "close") as session_close:
+            rm.close()
+            self.assertFalse(session_close.called)
+
+    def test_owned_session_closed(self):
+        rm = RequestMaker(api_path="/", host="host", token="f4k3")
+        with patch.object(rm.session, "close") as session_close:
+            rm.close()
+            self.assertTrue(session_close.called)
+
+    @patch("taiga.requestmaker.requests.Session.get")
     def test_call_requests_get(self, requests_get):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_get.return_value = MockResponse(200, "")
         rm.get("/nowhere")
         self.assertTrue(requests_get.called)
 
-    @patch("taiga.requestmaker.requests.post")
+    @patch("taiga.requestmaker.requests.Session.post")
     def test_call_requests_post(self, requests_post):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_post.return_value = MockResponse(200, "")
         rm.post("/nowhere")
         self.assertTrue(requests_post.called)
 
-    @patch("taiga.requestmaker.requests.post")
+    @patch("taiga.requestmaker.requests.Session.post")
     def test_call_requests_post_with_files(self, requests_post):
         rm = RequestMaker(api_path="/v1/", host="http://host", token="f4k3")
         requests_post.return_value = MockResponse(200, "")
@@ -39,83 +70,163 @@ class TestRequestMaker(unittest.TestCase):
             headers={"Authorization": "Bearer f4k3", "x-disable-pagination": "True"},
         )
 
-    @patch("taiga.requestmaker.requests.put")
+    @patch("taiga.requestmaker.requests.Session.put")
     def test_call_requests_put(self, requests_put):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_put.return_value = MockResponse(200, "")
         rm.put("/nowhere")
         self.assertTrue(requests_put.called)
 
-    @patch("taiga.requestmaker.requests.patch")
+    @patch("taiga.requestmaker.requests.Session.patch")
     def test_call_requests_patch(self, requests_patch):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_patch.return_value = MockResponse(200, "")
         rm.patch("/nowhere")
         self.assertTrue(requests_patch.called)
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_call_requests_delete(self, requests_delete):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(200, "")
         rm.delete("/nowhere")
         self.assertTrue(requests_delete.called)
 
-    @patch("taiga.requestmaker.requests.get")
+    @patch("taiga.requestmaker.requests.Session.get")
     def test_call_requests_get_raise_exception_on_bad_response(self, requests_get):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_get.return_value = MockResponse(400, "")
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.get, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.post")
+    @patch("taiga.requestmaker.requests.Session.post")
     def test_call_requests_post_raise_exception_on_bad_response(self, requests_post):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_post.return_value = MockResponse(400, "")
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.post, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.put")
+    @patch("taiga.requestmaker.requests.Session.put")
     def test_call_requests_put_raise_exception_on_bad_response(self, requests_put):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_put.return_value = MockResponse(400, "")
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.put, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.patch")
+    @patch("taiga.requestmaker.requests.Session.patch")
     def test_call_requests_patch_raise_exception_on_bad_response(self, requests_patch):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_patch.return_value = MockResponse(400, "")
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.patch, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_call_requests_delete_raise_exception_on_bad_response(self, requests_delete):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(400, "")
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.delete, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.get")
+    @patch("taiga.requestmaker.requests.Session.get")
     def test_call_requests_get_raise_exception_on_requests_error(self, requests_get):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_get.side_effect = requests.RequestException()
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.get, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.post")
+    @patch("taiga.requestmaker.requests.Session.post")
     def test_call_requests_post_raise_exception_on_requests_error(self, requests_post):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_post.side_effect = requests.RequestException()
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.post, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.put")
+    @patch("taiga.requestmaker.requests.Session.put")
     def test_call_requests_put_raise_exception_on_requests_error(self, requests_put):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_put.side_effect = requests.RequestException()
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.put, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.patch")
+    @patch("taiga.requestmaker.requests.Session.patch")
     def test_call_requests_patch_raise_exception_on_requests_error(self, requests_patch):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_patch.side_effect = requests.RequestException()
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.patch, "/nowhere")
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_call_requests_delete_raise_exception_on_requests_error(self, requests_delete):
         rm = RequestMaker(api_path="/", host="host", token="f4k3")
         requests_delete.side_effect = requests.RequestException()
         self.assertRaises(taiga.exceptions.TaigaRestException, rm.delete, "/nowhere")
+
+    def test_headers_without_lazy_pagination(self):
+        rm = RequestMaker(api_path="/", host="host", token="f4k3")
+        self.assertIn("x-lazy-pagination", rm.headers())
+        headers = rm.headers(lazy=False)
+        self.assertNotIn("x-lazy-pagination", headers)
+        self.assertNotIn("x-disable-pagination", headers)
+
+    def test_default_json_codec(self):
+        rm = RequestMaker(api_path="/", host="host", token="f4k3")
+        self.assertEqual(rm.json_codec.name, "orjson")
+        self.assertEqual(rm.json_codec.loads(rm.json_codec.dumps({"a": [1, "é"]})), {"a": [1, "é"]})
+
+    def test_get_json_codec(self):
+        self.assertEqual(get_json_codec("json").name, "json")
+        self.assertEqual(get_json_codec("json").dumps({1: "a"}), '{"1": "a"}')
+        self.assertEqual(json.loads(get_json_codec("orjson").dumps({1: "a"})), {"1": "a"})
+        with patch("taiga.requestmaker.ujson", None):
+            self.assertRaises(RequestMakerException, get_json_codec, "ujson")
+        with patch("taiga.requestmaker.orjson", None), patch("taiga.requestmaker.ujson", None):
+            self.assertEqual(get_json_codec().name, "json")
+
+    @patch("taiga.requestmaker.requests.Session.post")
+    def test_payload_encoded_with_codec(self, requests_post):
+        codec = JSONCodec(lambda obj: "encoded", json.loads, "custom")
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", json_codec=codec)
+        requests_post.return_value = MockResponse(200, "")
+        rm.post("/nowhere", payload={"subject": "US"})
+        self.assertEqual(requests_post.call_args[1]["data"], "encoded")
+
+    def test_decode_with_codec(self):
+        codec = JSONCodec(json.dumps, lambda data: {"decoded": data}, "custom")
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", json_codec=codec)
+        self.assertEqual(rm.decode(MockResponse(200, "[]")), {"decoded": b"[]"})
+        # cached responses are already decoded
+        self.assertEqual(rm.decode(CachedResponse(200, [1])), [1])
+
+    def test_multipart_stream(self):
+        progress = []
+        fileobj = io.BytesIO(b"0123456789" * 10)
+        fileobj.name = "/tmp/report.txt"
+        stream = MultipartStream(
+            {"project": 1, "description": None},
+            {"attached_file": fileobj},
+            chunk_size=30,
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+        body = b"".join(stream)
+        self.assertEqual(len(body), stream.len)
+        self.assertEqual(progress[-1], (stream.len, stream.len))
+        self.assertIn(b'name="project"\r\n\r\n1\r\n', body)
+        self.assertNotIn(b"description", body)
+        self.assertIn(b'filename="report.txt"\r\nContent-Type: text/plain\r\n\r\n' + b"0123456789" * 10, body)
+        self.assertTrue(body.endswith("--{}--\r\n".format(stream.boundary).encode()))
+        self.assertEqual(stream.content_type, "multipart/form-data; boundary={}".format(stream.boundary))
+        # the files are read again from the start when retried
+        self.assertEqual(b"".join(stream), body)
+
+    def test_multipart_stream_unknown_length(self):
+        with open("tests/resources/fake_objects.json") as fileobj:
+            stream = MultipartStream(files={"attached_file": fileobj})
+            self.assertIsNone(stream.len)
+            self.assertIn(b"fake", b"".join(stream))
+
+    @patch("taiga.requestmaker.requests.Session.post")
+    def test_call_requests_upload(self, requests_post):
+        rm = RequestMaker(api_path="/v1/", host="http://host", token="f4k3")
+        requests_post.return_value = MockResponse(200, "")
+        rm.upload("nowhere", fields={"project": 1}, files={"attached_file": io.BytesIO(b"content")})
+        stream = requests_post.call_args[1]["data"]
+        self.assertIsInstance(stream, MultipartStream)
+        self.assertEqual(
+            requests_post.call_args[1]["headers"],
+            {
+                "Authorization": "Bearer f4k3",
+                "Content-type": stream.content_type,
+                "Content-Length": str(stream.len),
+                "x-disable-pagination": "True",
+            },
+        )
@@ -0,0 +1,119 @@
+import io
+import unittest
+from email.utils import formatdate
+from unittest.mock import patch
+
+import requests
+
+import taiga.exceptions
+from taiga.requestmaker import RequestMaker, RetryPolicy
+
+from .tools import MockResponse
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff(self):
+        retry = RetryPolicy(backoff_factor=1, max_backoff=5)
+        for attempt, limit in ((0, 1), (1, 2), (2, 4), (3, 5), (10, 5)):
+            with patch("taiga.requestmaker.random.uniform", side_effect=lambda low, high: high) as uniform:
+                self.assertEqual(retry.backoff(attempt), limit)
+                uniform.assert_called_once_with(0, limit)
+
+    def test_retry_after_seconds(self):
+        retry = RetryPolicy()
+        self.assertEqual(retry.retry_after(MockResponse(429, "", {"Retry-After": "7"})), 7)
+        self.assertIsNone(retry.retry_after(MockResponse(429, "")))
+        self.assertIsNone(retry.retry_after(MockResponse(429, "", {"Retry-After": "soon"})))
+
+    @patch("time.time")
+    def test_retry_after_date(self, mock_time):
+        mock_time.return_value = 1000
+        retry = RetryPolicy()
+        response = MockResponse(503, "", {"Retry-After": formatdate(1010, usegmt=True)})
+        self.assertEqual(retry.retry_after(response), 10)
+
+    def test_delay_idempotent(self):
+        retry = RetryPolicy(total=2)
+        with patch.object(retry, "backoff", return_value=0.5):
+            for status in (429, 502, 503, 504):
+                self.assertEqual(retry.delay("GET", 0, MockResponse(status, "")), 0.5)
+            self.assertEqual(retry.delay("DELETE", 1), 0.5)
+            self.assertIsNone(retry.delay("GET", 2, MockResponse(503, "")))
+            self.assertIsNone(retry.delay("PUT", 0, MockResponse(500, "")))
+            self.assertIsNone(retry.delay("GET", 0, MockResponse(200, "")))
+
+    def test_delay_non_idempotent(self):
+        retry = RetryPolicy()
+        with patch.object(retry, "backoff", return_value=0.5):
+            self.assertEqual(retry.delay("POST", 0, MockResponse(429, "")), 0.5)
+            self.assertIsNone(retry.delay("POST", 0, MockResponse(503, "")))
+            self.assertIsNone(retry.delay("PATCH", 0, MockResponse(502, "")))
+            self.assertIsNone(retry.delay("POST", 0))
+            self.assertIsNotNone(RetryPolicy(non_idempotent_network_errors=True).delay("POST", 0))
+
+    def test_delay_retry_after(self):
+        retry = RetryPolicy(max_retry_after=60)
+        self.assertEqual(retry.delay("GET", 0, MockResponse(429, "", {"Retry-After": "30"})), 30)
+        self.assertIsNone(retry.delay("GET", 0, MockResponse(429, "", {"Retry-After": "90"})))
+
+    def test_disabled(self):
+        self.assertIsNone(RetryPolicy(total=0).delay("GET", 0, MockResponse(503, "")))
+
+
+@patch("taiga.requestmaker.time.sleep")
+class TestRequestMakerRetry(unittest.TestCase):
+    @patch("taiga.requestmaker.requests.Session.get")
+    def test_get_retried_on_throttle(self, requests_get, sleep):
+        requests_get.side_effect = [
+            MockResponse(429, "", {"Retry-After": "2"}),
+            MockResponse(503, ""),
+            MockResponse(200, "[]"),
+        ]
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", retry=RetryPolicy(backoff_factor=0))
+        self.assertEqual(rm.get("/nowhere").json(), [])
+        self.assertEqual(requests_get.call_count, 3)
+        self.assertEqual([call[0][0] for call in sleep.call_args_list], [2, 0])
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    def test_get_retried_on_network_error(self, requests_get, sleep):
+        requests_get.side_effect = [requests.ConnectionError(), MockResponse(200, "[]")]
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", retry=RetryPolicy())
+        rm.get("/nowhere")
+        self.assertEqual(requests_get.call_count, 2)
+
+    @patch("taiga.requestmaker.requests.Session.delete")
+    def test_retries_exhausted(self, requests_delete, sleep):
+        requests_delete.side_effect = requests.ConnectionError()
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", retry=RetryPolicy(total=2))
+        self.assertRaises(taiga.exceptions.TaigaRestException, rm.delete, "/nowhere")
+        self.assertEqual(requests_delete.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+
+    @patch("taiga.requestmaker.requests.Session.post")
+    def test_post_not_retried_on_network_error(self, requests_post, sleep):
+        requests_post.side_effect = requests.ConnectionError()
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", retry=RetryPolicy())
+        self.assertRaises(taiga.exceptions.TaigaRestException, rm.post, "/nowhere", payload={})
+        self.assertEqual(requests_post.call_count, 1)
+        self.assertFalse(sleep.called)
+
+    @patch("taiga.requestmaker.requests.Session.post")
+    def test_post_with_files_rewound(self, requests_post, sleep):
+        attached_file = io.BytesIO(b"data")
+
+        def read_file(*args, **kwargs):
+            kwargs["files"]["attached_file"].read()
+            return MockResponse(429, "") if requests_post.call_count == 1 else MockResponse(201, "{}")
+
+        requests_post.side_effect = read_file
+        rm = RequestMaker(api_path="/", host="host", token="f4k3", retry=RetryPolicy())
+        rm.post("/nowhere", payload={}, files={"attached_file": attached_file})
+        self.assertEqual(requests_post.call_count, 2)
+        self.assertEqual(attached_file.tell(), 4)
+
+    @patch("taiga.requestmaker.requests.Session.get")
+    def test_no_retry_by_default(self, requests_get, sleep):
+        requests_get.return_value = MockResponse(503, "")
+        rm = RequestMaker(api_path="/", host="host", token="f4k3")
+        rm.get("/nowhere")
+        self.assertEqual(requests_get.call_count, 1)
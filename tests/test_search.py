@@ -26,3 +26,12 @@ class TestSearch(unittest.TestCase):
         self.assertTrue(isinstance(search_result.user_stories[0], UserStory))
         self.assertTrue(isinstance(search_result.wikipages[0], WikiPage))
         self.assertTrue(isinstance(search_result.epics[0], Epic))
+
+    @patch("taiga.requestmaker.RequestMaker.get")
+    def test_raw_search(self, mock_requestmaker_get):
+        mock_requestmaker_get.return_value = MockResponse(200, create_mock_json("tests/resources/search_success.json"))
+        api = TaigaAPI(token="f4k3")
+        search_result = api.search(1, "NEW", raw=True)
+        self.assertEqual(search_result["count"], 3)
+        self.assertIsInstance(search_result["tasks"][0], dict)
+        self.assertEqual(api.search(1, "NEW", raw="bytes"), mock_requestmaker_get.return_value.content)
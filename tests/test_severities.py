@@ -15,7 +15,7 @@ class TestSeverities(unittest.TestCase):
         Severities(rm).create(1, "SV 1")
         mock_new_resource.assert_called_with(payload={"project": 1, "name": "SV 1"})
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_delete_severities(self, requests_delete):
         rm = RequestMaker(api_path="/api/v1", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(204, "")
@@ -27,7 +27,7 @@ class TestSeverities(unittest.TestCase):
             verify=True,
         )
 
-    @patch("taiga.requestmaker.requests.delete")
+    @patch("taiga.requestmaker.requests.Session.delete")
     def test_delete_severity(self, requests_delete):
         rm = RequestMaker(api_path="/api/v1", host="host", token="f4k3")
         requests_delete.return_value = MockResponse(204, "")
@@ -65,3 +65,60 @@ class TestTasks(unittest.TestCase):
         task = Task(rm, id=1)
         task.add_comment("hola")
         mock_update.assert_called_with(comment="hola")
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_create(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(200, '[{"id": 1}, {"id": 2}]')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        tasks = Tasks(rm).bulk_create(1, ["Task 1", "Task 2"], user_story=4)
+        self.assertEqual(len(tasks), 2)
+        self.assertIsInstance(tasks[0], Task)
+        mock_requestmaker_post.assert_called_once_with(
+            "/{endpoint}/bulk_create",
+            endpoint="tasks",
+            payload={"project_id": 1, "us_id": 4, "bulk_tasks": "Task 1\nTask 2"},
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_update_taskboard_order(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(200, "[]")
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        Tasks(rm).bulk_update_taskboard_order(1, [5, 4], milestone=2)
+        mock_requestmaker_post.assert_called_once_with(
+            "/{endpoint}/{action}",
+            endpoint="tasks",
+            action="bulk_update_taskboard_order",
+            payload={
+                "project_id": 1,
+                "milestone_id": 2,
+                "bulk_tasks": [{"task_id": 5, "order": 0}, {"task_id": 4, "order": 1}],
+            },
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.upload")
+    def test_stream_file_attach(self, mock_requestmaker_upload):
+        mock_requestmaker_upload.return_value = MockResponse(200, '{"id": 2, "object_id": 1}')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        task = Task(rm, id=1, project=1)
+        progress = print
+        attachment = task.attach("tests/resources/tasks_list_success.json", progress=progress, description="log")
+        self.assertEqual(attachment.id, 2)
+        files = mock_requestmaker_upload.call_args[1]["files"]
+        mock_requestmaker_upload.assert_called_once_with(
+            "tasks/attachments",
+            fields={"description": "log", "project": 1, "object_id": 1},
+            files=files,
+            progress=progress,
+            chunk_size=None,
+        )
+        # the file opened from the path is closed once sent
+        self.assertTrue(files["attached_file"].closed)
+
+    @patch("taiga.requestmaker.RequestMaker.upload")
+    def test_stream_open_file_attach(self, mock_requestmaker_upload):
+        mock_requestmaker_upload.return_value = MockResponse(200, '{"id": 2}')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        with open("tests/resources/tasks_list_success.json", "rb") as fd:
+            Task(rm, id=1, project=1).attach(fd, stream=True)
+            self.assertFalse(fd.closed)
+            self.assertIs(mock_requestmaker_upload.call_args[1]["files"]["attached_file"], fd)
@@ -140,3 +140,84 @@ class TestUserStories(unittest.TestCase):
         user_story = UserStory(rm, id=1)
         user_story.add_comment("hola")
         mock_update.assert_called_with(comment="hola")
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_create(self, mock_requestmaker_post):
+        mock_requestmaker_post.side_effect = [
+            MockResponse(200, '[{"id": 1, "subject": "US 1"}, {"id": 2, "subject": "US 2"}]'),
+            MockResponse(200, '[{"id": 3, "subject": "US 3"}]'),
+        ]
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        user_stories = UserStories(rm).bulk_create(1, ["US 1", "US 2", "US 3"], status=2, chunk_size=2)
+        self.assertEqual([user_story.id for user_story in user_stories], [1, 2, 3])
+        self.assertIsInstance(user_stories[0], UserStory)
+        mock_requestmaker_post.assert_any_call(
+            "/{endpoint}/bulk_create",
+            endpoint="userstories",
+            payload={"project_id": 1, "status_id": 2, "bulk_stories": "US 1\nUS 2"},
+        )
+        mock_requestmaker_post.assert_called_with(
+            "/{endpoint}/bulk_create",
+            endpoint="userstories",
+            payload={"project_id": 1, "status_id": 2, "bulk_stories": "US 3"},
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_create_multiline_subject(self, mock_requestmaker_post):
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        self.assertRaises(ValueError, UserStories(rm).bulk_create, 1, ["US 1", "US\n2"])
+        self.assertFalse(mock_requestmaker_post.called)
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_add_tasks(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(200, '[{"id": 1}, {"id": 2}]')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        tasks = UserStory(rm, id=1, project=2, milestone=3).add_tasks(["Task 1", "Task 2"])
+        self.assertEqual(len(tasks), 2)
+        self.assertIsInstance(tasks[0], Task)
+        mock_requestmaker_post.assert_called_once_with(
+            "/{endpoint}/bulk_create",
+            endpoint="tasks",
+            payload={"project_id": 2, "us_id": 1, "milestone_id": 3, "bulk_tasks": "Task 1\nTask 2"},
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_update_backlog_order(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(200, '[{"id": 3, "backlog_order": 1}]')
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        result = UserStories(rm).bulk_update_backlog_order(1, [3, 2], after=5)
+        self.assertEqual(result, [{"id": 3, "backlog_order": 1}])
+        mock_requestmaker_post.assert_called_once_with(
+            "/{endpoint}/{action}",
+            endpoint="userstories",
+            action="bulk_update_backlog_order",
+            payload={"project_id": 1, "after_userstory_id": 5, "bulk_userstories": [3, 2]},
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_update_kanban_order(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(200, "[]")
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        UserStories(rm).bulk_update_kanban_order(1, 4, (i for i in [3, 2]), swimlane=6)
+        mock_requestmaker_post.assert_called_once_with(
+            "/{endpoint}/{action}",
+            endpoint="userstories",
+            action="bulk_update_kanban_order",
+            payload={"project_id": 1, "status_id": 4, "swimlane_id": 6, "bulk_userstories": [3, 2]},
+        )
+
+    @patch("taiga.requestmaker.RequestMaker.post")
+    def test_bulk_update_milestone(self, mock_requestmaker_post):
+        mock_requestmaker_post.return_value = MockResponse(200, "[]")
+        rm = RequestMaker("/api/v1", "fakehost", "faketoken")
+        UserStories(rm).bulk_update_milestone(1, 2, [3, 4])
+        mock_requestmaker_post.assert_called_once_with(
+            "/{endpoint}/{action}",
+            endpoint="userstories",
+            action="bulk_update_milestone",
+            payload={
+                "project_id": 1,
+                "milestone_id": 2,
+                "bulk_stories": [{"us_id": 3, "order": 0}, {"us_id": 4, "order": 1}],
+            },
+        )
@@ -9,6 +9,10 @@ class MockResponse:
         self.text = text
         self.headers = headers
 
+    @property
+    def content(self):
+        return (self.text or "").encode("utf-8")
+
     def json(self):
         return json.loads(self.text)
 